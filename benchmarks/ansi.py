@@ -0,0 +1,173 @@
+"""
+ANSI parser benchmark: streaming AnsiParser vs. the former regex pipeline.
+
+    python -m benchmarks.ansi                          # Beispiel-Build-Log, 20 MB
+    python -m benchmarks.ansi --log build.log --mb 50  # eigener mitgeschnittener Log
+    python -m benchmarks.ansi --output ansi.json
+
+The log (raw PTY output including escape sequences) is repeated up to `mb`
+megabytes and fed in PTY-sized chunks (best of `repeat` runs). Besides MB/s
+the result counts the escape fragments each parser leaked into the text
+("leaked_escapes") and the characters that got a colour/attribute tag.
+
+Baselines: "regex" is the pipeline TerminalUI shipped with. Its CSI pattern
+also matches "m", so it strips every SGR sequence before the SGR pass and
+never colours anything. "regex_sgr" is the same pipeline with that fixed,
+which is the like-for-like comparison; "speedup" is measured against it.
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from main.terminal_tools.ansi import ANSI_COLORS, AnsiParser
+
+SAMPLE_LOG = Path(__file__).resolve().parent / "data" / "ue_build.log"
+CHUNK_SIZES = (65536, 4096, 1024)
+
+
+# ===== Bisherige Regex-Pipeline (Referenz, aus ui/tabs/terminal.py) =====
+SGR_RE = re.compile(r"\x1b\[((?:\d{1,3};?)+)m")
+OSC_RE = re.compile(r"\x1b\].*?(?:\x07|\x1b\\)")
+CSI_RE = re.compile(r"\x1b\[[:<>?=\d;]*[A-Za-z]")
+# wie CSI_RE, lässt aber SGR (Final "m") für den SGR-Durchlauf stehen
+CSI_NO_SGR_RE = re.compile(r"\x1b\[[:<>?=\d;]*[A-Za-ln-z]")
+_LEGACY_COLORS = {code: f"fg_{name}" for code, (name, _) in zip([*range(30, 38), *range(90, 98)], ANSI_COLORS)}
+
+
+class RegexAnsiParser:
+    """The regex parser TerminalUI used before AnsiParser: three passes per chunk, no state."""
+
+    csi_re = CSI_RE
+
+    def __init__(self):
+        self.current_fg = None
+        self.bold = False
+        self.underline = False
+
+    def _make_tags(self):
+        tags = []
+        if self.current_fg:
+            tags.append(self.current_fg)
+        if self.bold:
+            tags.append("attr_bold")
+        if self.underline:
+            tags.append("attr_underline")
+        return tags
+
+    def feed(self, text):
+        text = OSC_RE.sub("", text)
+        text = self.csi_re.sub("", text)
+        pos = 0
+        for match in SGR_RE.finditer(text):
+            start, end = match.span()
+            if start > pos:
+                yield text[pos:start], self._make_tags()
+            codes = [int(p) for p in match.group(1).split(";") if p] or [0]
+            for code in codes:
+                if code == 0:
+                    self.current_fg, self.bold, self.underline = None, False, False
+                elif code == 1:
+                    self.bold = True
+                elif code == 4:
+                    self.underline = True
+                elif code in _LEGACY_COLORS:
+                    self.current_fg = _LEGACY_COLORS[code]
+                elif code == 39:
+                    self.current_fg = None
+            pos = end
+        if pos < len(text):
+            yield text[pos:], self._make_tags()
+
+
+class RegexSgrAnsiParser(RegexAnsiParser):
+    """Same pipeline with the CSI pass no longer eating the SGR sequences."""
+
+    csi_re = CSI_NO_SGR_RE
+
+
+PARSERS = {"regex": RegexAnsiParser, "regex_sgr": RegexSgrAnsiParser, "streaming": AnsiParser}
+
+
+def load_log(path: str | Path = SAMPLE_LOG) -> str:
+    return Path(path).read_bytes().decode("utf-8", errors="replace")
+
+
+def make_chunks(log: str, mb: float, chunk_size: int) -> list[str]:
+    """Repeats `log` up to `mb` megabytes and cuts it into chunks of `chunk_size` characters."""
+    target = int(mb * 1024 * 1024)
+    data = log * max(target // max(len(log), 1), 1)
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+def _parse_all(parser_cls, chunks: list[str]) -> float:
+    parser = parser_cls()
+    start = time.perf_counter()
+    for chunk in chunks:
+        for _ in parser.feed(chunk):
+            pass
+    return time.perf_counter() - start
+
+
+def measure(parser_cls, chunks: list[str], repeat: int = 3) -> dict:
+    # Zählen in einem eigenen Durchlauf, damit es die Zeitmessung nicht verfälscht
+    parser = parser_cls()
+    leaked = tagged = 0
+    for chunk in chunks:
+        for text, tags in parser.feed(chunk):
+            leaked += text.count("\x1b")
+            if tags:
+                tagged += len(text)
+    seconds = min(_parse_all(parser_cls, chunks) for _ in range(repeat))
+    size_mb = sum(map(len, chunks)) / 1024 / 1024
+    return {
+        "mb_per_s": round(size_mb / seconds, 2),
+        "seconds": round(seconds, 3),
+        "leaked_escapes": leaked,
+        "tagged_chars": tagged,
+    }
+
+
+def run_benchmark(
+    log: str, mb: float = 20, chunk_sizes: tuple[int, ...] = CHUNK_SIZES, repeat: int = 3
+) -> dict:
+    results = {}
+    for size in chunk_sizes:
+        chunks = make_chunks(log, mb, size)
+        result = {name: measure(cls, chunks, repeat) for name, cls in PARSERS.items()}
+        result["speedup"] = round(result["streaming"]["mb_per_s"] / result["regex_sgr"]["mb_per_s"], 2)
+        results[str(size)] = result
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mb": mb,
+        "chunk_sizes": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare ANSI parser throughput.")
+    parser.add_argument("--log", default=str(SAMPLE_LOG), help="recorded PTY output (raw, with escapes)")
+    parser.add_argument("--mb", type=float, default=20, help="megabytes to parse per chunk size")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per parser, the fastest counts")
+    parser.add_argument("--output", help="write the result as JSON to this file")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(load_log(args.log), args.mb, repeat=args.repeat)
+    result["log"] = args.log
+    text = json.dumps(result, indent=4)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Startup benchmark: per-module import time and time to first window.
+
+    python -m benchmarks.startup                      # echtes Tk (Display nötig)
+    python -m benchmarks.startup --stub               # ohne Display, Tk gestubbt
+    python -m benchmarks.startup --output startup.json
+
+Each measurement runs in a fresh interpreter. The import profile comes from
+`python -X importtime`, the first-window time from a second run without it.
+GitHub is always answered by a local stub, the token is a dummy.
+
+With --stub no frame is drawn: the first-window time is only the point where
+the app calls mark_first_window() and is reported as `first_window_stub_ms`.
+`--baseline` checks the result against upper limits (exit code 1 if over).
+"""
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULT_MARKER = "STARTUP_RESULT "
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(stderr: str) -> dict[str, dict[str, float]]:
+    """{module: {"self_ms", "cumulative_ms", "depth"}} from `-X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = {
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+            "depth": (len(indent) - 1) // 2,
+        }
+    return modules
+
+
+def _driver(stub: bool) -> None:
+    """Runs inside the child interpreter: imports the app and waits for the first window."""
+    start = time.perf_counter()
+    if stub:
+        from benchmarks.stubs import install_tk_stub
+
+        install_tk_stub()
+
+    # Konfiguration ohne main/.env: Dummy-Token, sonst unverändert
+    from main.config import CONFIG_SERVICE, AppConfig
+
+    with open(CONFIG_SERVICE.path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    data.setdefault("git", {})["token"] = "benchmark"
+    CONFIG_SERVICE._config = AppConfig.from_dict(data)
+
+    from benchmarks.stubs import install_github_stub
+
+    install_github_stub()
+    import main.main as app
+
+    imported = time.perf_counter()
+    if stub:
+        # kein Mainloop: erster Frame = sichtbaren Tab direkt bauen
+        app.lazy_tabs.mark_first_window()
+        app.lazy_tabs.build(next(iter(app.lazy_tabs._specs)))
+    else:
+        deadline = time.time() + 60
+        while app.lazy_tabs.first_window_ms is None or not app.lazy_tabs.timings:
+            if time.time() > deadline:
+                raise TimeoutError("first window was not drawn within 60s")
+            app.rootwin.update()
+    done = time.perf_counter()
+
+    from main._template import STARTUP_TIME
+
+    # alle Zeiten ab Start des Interpreters-Codes (vor dem ersten App-Import)
+    # gestubbt wird kein Frame gezeichnet: nur der Zeitpunkt von mark_first_window()
+    first_window_key = "first_window_stub_ms" if stub else "first_window_ms"
+    result = {
+        "import_main_ms": round((imported - start) * 1000, 1),
+        first_window_key: round((STARTUP_TIME - start) * 1000 + app.lazy_tabs.first_window_ms, 1),
+        "usable_ms": round((done - start) * 1000, 1),
+        "tabs_ms": {name: round(seconds * 1000, 1) for name, seconds in app.lazy_tabs.timings.items()},
+    }
+    # ein write-Aufruf: print schreibt Text und Newline getrennt, dazwischen kann der Log-Thread landen
+    sys.stdout.write(RESULT_MARKER + json.dumps(result) + "\n")
+    sys.stdout.flush()
+    if not stub:
+        app.rootwin.destroy()
+
+
+def _run_child(stub: bool, importtime: bool) -> subprocess.CompletedProcess:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-m", "benchmarks.startup", "--driver"]
+    if stub:
+        cmd.append("--stub")
+    return subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True, timeout=300)
+
+
+def _child_result(proc: subprocess.CompletedProcess) -> dict:
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            # raw_decode: eine angehängte Konsolen-Logzeile stört nicht
+            return json.JSONDecoder().raw_decode(line[len(RESULT_MARKER) :])[0]
+    raise RuntimeError(f"Benchmark child failed ({proc.returncode}):\n{proc.stderr[-4000:]}")
+
+
+def run_benchmark(stub: bool, top: int = 25) -> dict:
+    profile_run = _run_child(stub, importtime=True)
+    _child_result(profile_run)  # bricht ab, wenn der Lauf fehlgeschlagen ist
+    imports = parse_importtime(profile_run.stderr)
+    timing = _child_result(_run_child(stub, importtime=False))
+
+    app_modules = {name: m for name, m in imports.items() if name.startswith("main")}
+    slowest = sorted(imports.items(), key=lambda item: item[1]["self_ms"], reverse=True)[:top]
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "mode": "stub" if stub else "tk",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **timing,
+        "import_total_ms": sum(m["self_ms"] for m in imports.values()),
+        "app_modules_ms": {name: m["cumulative_ms"] for name, m in app_modules.items()},
+        "slowest_imports_ms": {name: m["self_ms"] for name, m in slowest},
+    }
+
+
+def over_baseline(result: dict, baseline: dict) -> list[str]:
+    """Keys of `result` above their limit in `baseline` (keys starting with _ are comments)."""
+    return [
+        f"{key}: {result[key]:.0f} ms > {limit} ms"
+        for key, limit in baseline.items()
+        if not key.startswith("_") and key in result and result[key] > limit
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure UnrealGitUI startup.")
+    parser.add_argument("--stub", action="store_true", help="stub Tk (no display needed)")
+    parser.add_argument("--output", help="write the result as JSON to this file")
+    parser.add_argument("--top", type=int, default=25, help="number of slowest imports to keep")
+    parser.add_argument("--baseline", help="JSON file with upper limits in ms; exit code 1 if exceeded")
+    parser.add_argument("--driver", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.driver:
+        _driver(args.stub)
+        return 0
+
+    result = run_benchmark(args.stub, args.top)
+    text = json.dumps(result, indent=4)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    if args.baseline:
+        exceeded = over_baseline(result, json.loads(Path(args.baseline).read_text(encoding="utf-8")))
+        for line in exceeded:
+            print(f"Over baseline: {line}", file=sys.stderr)
+        return 1 if exceeded else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
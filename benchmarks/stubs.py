@@ -0,0 +1,70 @@
+"""
+Stand-ins for the startup benchmark when there is no display or no network.
+
+`install_tk_stub` replaces customtkinter (and CTkTable, which subclasses it) with
+widgets that accept every call, so the UI code runs without a Tk display.
+`install_github_stub` answers all requests to api.github.com locally.
+"""
+
+import json
+import sys
+import types
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class _StubWidget:
+    """Accepts any constructor arguments and any method call."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _StubWidget()
+
+    def __call__(self, *args, **kwargs):
+        return _StubWidget()
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+    def get(self, *args, **kwargs):
+        return ""
+
+
+def _stub_module(name: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__getattr__ = lambda attr: _StubWidget  # CTkFrame, CTkLabel, set_appearance_mode, ...
+    return module
+
+
+def install_tk_stub() -> None:
+    sys.modules["customtkinter"] = _stub_module("customtkinter")
+    ctktable = _stub_module("CTkTable")
+    sys.modules["CTkTable"] = ctktable
+
+
+class GithubStubAdapter(HTTPAdapter):
+    """Empty but valid answers for GraphQL and REST, without touching the network."""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 200 if request.method == "POST" else 404
+        body = {"data": {"repository": None}} if request.method == "POST" else {"message": "Not Found"}
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+
+def install_github_stub() -> None:
+    from main.github_tools.session import SESSION
+
+    SESSION.mount("https://api.github.com", GithubStubAdapter())
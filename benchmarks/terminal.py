@@ -0,0 +1,104 @@
+"""
+Terminal throughput benchmark: PTY backend -> PtyReader -> Screen -> render ops.
+
+    python -m benchmarks.terminal                     # 20 MB farbige Build-Ausgabe
+    python -m benchmarks.terminal --mb 100 --backend posix --output terminal.json
+
+A child process writes coloured log lines as fast as it can; the benchmark
+drains them frame by frame like TerminalUI does (without Tk) and reports
+throughput and frame statistics.
+"""
+
+import argparse
+import json
+import platform
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Farbige Zeilen wie bei einem Unreal-Build, bis `mb` Megabyte geschrieben sind
+_PRODUCER = r"""
+import sys
+line = "\x1b[32mLogInit\x1b[0m: Display: \x1b[1;33mCompiling\x1b[0m Module.Engine.{}.cpp ({} of 4000)\r\n"
+target, written, i = {mb} * 1024 * 1024, 0, 0
+out = sys.stdout
+while written < target:
+    text = line.format(i % 97, i % 4000)
+    out.write(text)
+    written += len(text)
+    i += 1
+out.flush()
+"""
+
+
+def run_benchmark(mb: float = 20, backend: str | None = None) -> dict:
+    from main.terminal_tools.pty_backend import create_pty
+    from main.terminal_tools.pty_reader import PtyReader
+    from main.terminal_tools.render_batch import drain_chunks
+    from main.terminal_tools.screen import Screen
+
+    join = subprocess.list2cmdline if sys.platform == "win32" else shlex.join
+    command = join([sys.executable, "-c", _PRODUCER.replace("{mb}", str(mb))])
+    notified = threading.Event()
+    start = time.perf_counter()
+    pty = create_pty(command, kind=backend)
+    reader = PtyReader(pty, notified.set)
+    reader.start()
+    screen = Screen()
+
+    frames, chars, max_frame = 0, 0, 0.0
+    try:
+        while True:
+            notified.wait(1.0)
+            notified.clear()
+            frame_start = time.perf_counter()
+            fed, pending = drain_chunks(reader.chunks, screen.feed)
+            if screen.render_ops():
+                frames += 1
+                chars += fed
+                max_frame = max(max_frame, time.perf_counter() - frame_start)
+            if reader.eof.is_set() and reader.chunks.empty():
+                break
+            if pending or reader.wait_for_data():
+                notified.set()
+    finally:
+        reader.stop()
+        pty.close()
+    seconds = time.perf_counter() - start
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "backend": pty.name,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mb": mb,
+        "seconds": round(seconds, 3),
+        "mb_per_s": round(chars / 1024 / 1024 / seconds, 2),
+        "frames": frames,
+        "chars_per_frame": round(chars / max(frames, 1)),
+        "max_frame_ms": round(max_frame * 1000, 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure terminal output throughput.")
+    parser.add_argument("--mb", type=float, default=20, help="megabytes of output to produce")
+    parser.add_argument("--backend", help="PTY backend (winpty / posix), default by platform")
+    parser.add_argument("--output", help="write the result as JSON to this file")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.mb, args.backend)
+    text = json.dumps(result, indent=4)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,61 @@
+import time
+
+# Referenzpunkt für die Startzeit-Messung (erstes Modul, das importiert wird)
+STARTUP_TIME = time.perf_counter()
+
 from rich.traceback import install as rich_tcbck_install
 
 rich_tcbck_install()
 # ============================#
 
 import atexit
+import functools
 import getpass
+import json
 import logging
 import os
 import platform
 import tempfile
+import threading
+from collections.abc import Callable
 from datetime import datetime
+from logging.handlers import QueueListener
 from pathlib import Path
 
 import toml
 from rich.logging import RichHandler
 
 from main.errors import PyProjectError
+from main.log_tools.async_handler import BoundedQueueHandler
+from main.log_tools.log_index import JsonLinesFormatter, LogIndexHandler, open_index, prune_index
+from main.log_tools.rotation import (
+    CompressingRotatingFileHandler,
+    compress_closed_logs,
+    prune_logs,
+    session_files,
+    write_latest_pointer,
+)
+from main.log_tools.settings import LogSettings
+from main.log_tools.ui_handler import UILogHandler
+
+
+@functools.cache
+def _load_pyproject(path: Path = Path("./pyproject.toml")) -> dict:
+    return toml.load(path)
 
 
 def _get_project_name() -> str:
-    pyproject = toml.load(Path("./pyproject.toml"))
-    return pyproject["project"]["name"]
+    return _load_pyproject()["project"]["name"]
+
+
+def _get_log_settings() -> LogSettings:
+    # CONFIG_SERVICE geht hier nicht: main.config importiert selbst den Logger.
+    # Nur die Datei lesen, geparst wird wie dort über LogSettings.from_dict
+    try:
+        with open("main/config.json", "r", encoding="utf-8") as file:
+            return LogSettings.from_dict(json.load(file).get("logs", {}))
+    except (OSError, ValueError):
+        return LogSettings()
 
 
 # ensure logs directory exists and add a file handler alongside the RichHandler
@@ -28,17 +63,84 @@ logs_dir = Path("./logs")
 logs_dir.mkdir(parents=True, exist_ok=True)
 log_file = f"logs/{_get_project_name()}-{datetime.now().strftime('%d%m%Y%H%M%S')}-{platform.node()}.log"
 
-file_handler = logging.FileHandler(Path(log_file), encoding="utf-8")
+# persistent cache directory (HTTP cache etc.), survives restarts unlike TMPDIR
+CACHE_DIR = Path("./cache")
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+LOG_SETTINGS = _get_log_settings()
+
+
+def _rotating_handler(path: Path, latest_pointer: bool = False) -> CompressingRotatingFileHandler:
+    return CompressingRotatingFileHandler(
+        path,
+        max_bytes=int(LOG_SETTINGS.max_file_mb * 1024 * 1024),
+        max_age=LOG_SETTINGS.max_age_hours * 3600,
+        keep_files=LOG_SETTINGS.keep_files,
+        keep_mb=LOG_SETTINGS.keep_mb,
+        latest_pointer=latest_pointer,
+    )
+
+
+file_handler = _rotating_handler(Path(log_file), latest_pointer=True)
 file_handler.setLevel(logging.DEBUG)
 file_formatter = logging.Formatter(
     "%(asctime)s @ %(name)s | %(levelname)s | %(message)s"
 )
 file_handler.setFormatter(file_formatter)
 
+# strukturierte Logs: JSON-Lines pro Session + SQLite-Index über alle Sessions
+session_name = Path(log_file).stem
+json_handler = _rotating_handler(Path(log_file).with_suffix(".jsonl"))
+json_handler.setLevel(logging.DEBUG)
+json_handler.setFormatter(JsonLinesFormatter(session_name))
+index_handler = LogIndexHandler(open_index(logs_dir), session_name)
+write_latest_pointer(logs_dir, log_file)
+
+
+def _housekeep_logs():
+    # alte Sessions komprimieren und Aufbewahrung anwenden, ohne den Start aufzuhalten
+    compress_closed_logs(logs_dir, log_file)
+    prune_logs(
+        logs_dir,
+        file_handler.keep_files,
+        file_handler.keep_mb,
+        protect=session_files(log_file),
+    )
+    prune_index(logs_dir, LOG_SETTINGS.index_days)
+
+
+threading.Thread(target=_housekeep_logs, name="log-housekeeping", daemon=True).start()
+
 console_handler = RichHandler(rich_tracebacks=True)
 console_handler.setLevel(logging.DEBUG)
 
-logging.basicConfig(level=logging.DEBUG, handlers=[console_handler, file_handler])
+# formatierte Records direkt an das Dashboard, ohne die Log-Datei erneut zu lesen
+ui_handler = UILogHandler(logging.DEBUG)
+ui_handler.setFormatter(file_formatter)
+
+# Alle Handler laufen hinter einer Queue im Listener-Thread; der aufrufende
+# (UI-)Thread legt den Record nur in die Queue
+queue_handler = BoundedQueueHandler()
+log_listener = QueueListener(
+    queue_handler.queue,
+    console_handler,
+    file_handler,
+    json_handler,
+    index_handler,
+    ui_handler,
+    respect_handler_level=True,
+)
+log_listener.start()
+
+
+@atexit.register
+def stop_log_listener():
+    # als erstes registriert -> läuft als letztes, nach allen anderen at-exit Logs
+    LOGGER.debug(f"Logging stats: {queue_handler.stats()}")
+    log_listener.stop()
+
+
+logging.basicConfig(level=logging.DEBUG, handlers=[queue_handler])
 
 LOGGER: logging.Logger = logging.getLogger(_get_project_name())
 LOGGER.debug("Logger initialized.")
@@ -50,7 +152,7 @@ def check_pyproject(path: Path = Path("./pyproject.toml")):
         return
 
     LOGGER.debug(f'Checking pyproject.toml at: "{path.resolve()}"')
-    pyproject = toml.load(path)
+    pyproject = _load_pyproject(path)
 
     if pyproject["project"]["name"] == "YOURPROJECTNAME":
         LOGGER.error("The 'name' field in pyproject.toml is not set.")
@@ -69,9 +171,23 @@ def check_pyproject(path: Path = Path("./pyproject.toml")):
         )
 
 
+# Aufräumfunktionen anderer Module (z.B. ausstehende Config-Schreibvorgänge),
+# laufen im at_exit_cleanup vor dem Löschen der Temp-Dateien
+_EXIT_HOOKS: list[Callable[[], None]] = []
+
+
+def register_exit_hook(hook: Callable[[], None]) -> None:
+    _EXIT_HOOKS.append(hook)
+
+
 @atexit.register
 def at_exit_cleanup():
     LOGGER.debug("Running at_exit cleanup.")
+    for hook in _EXIT_HOOKS:
+        try:
+            hook()
+        except Exception as e:
+            LOGGER.error(f"Error in exit hook {hook}: {e}")
     try:
         os.rmdir(TMPDIR)
     except Exception as e:
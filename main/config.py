@@ -1,8 +1,14 @@
 import json
 import os
+import tempfile
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field, fields
+
 from dotenv import load_dotenv
-from main.errors import MissingDotEnvFile, MissingGithubToken
-from main._template import LOGGER
+from main.errors import ConfigError, MissingDotEnvFile, MissingGithubToken
+from main._template import LOGGER, register_exit_hook
+from main.log_tools.settings import LogSettings
 
 
 def load_config(file_path: str) -> dict:
@@ -17,7 +23,8 @@ def load_config(file_path: str) -> dict:
     else:
         raise MissingDotEnvFile('Your .env file at `main/.env` is missing')
     
-    LOGGER.info(f'Config loaded: {config}')
+    # nur die Schlüssel: die Konfiguration enthält das GitHub-Token
+    LOGGER.info(f'Config loaded: {sorted(config)}')
     return config
 
 
@@ -28,3 +35,233 @@ def save_config(file_path: str, config: dict) -> None:
 
 def check_config(required_keys: list) -> bool:
     return all(key in load_config("main/config.json") for key in required_keys)
+
+
+# ===== Typisierte, einmal geladene Konfiguration =====
+CONFIG_PATH = "main/config.json"
+# Änderungen innerhalb dieses Fensters werden zu einem Schreibvorgang zusammengefasst
+SAVE_DELAY = 0.5
+
+
+def write_json_atomic(file_path: str, data: dict) -> None:
+    """Writes to a temp file next to the target and renames it, so a crash never leaves half a file."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@dataclass(slots=True)
+class GitSettings:
+    repo: str = ""
+    user: str = ""
+    token: str = ""
+    repos: list[str] = field(default_factory=list)
+
+    @property
+    def main_repo(self) -> str:
+        return f"{self.user}/{self.repo}"
+
+
+@dataclass(slots=True)
+class DashboardSettings:
+    last_commits: int = 5
+    provider: str = "local"
+    refresh_seconds: float = 120
+    repo_failure_budget: int = 3
+
+
+@dataclass(slots=True)
+class CacheSettings:
+    max_mb: float = 50
+
+
+@dataclass(slots=True)
+class RateLimitSettings:
+    max_concurrent: int = 4
+    background_reserve: int = 500
+
+
+@dataclass(slots=True)
+class StartupSettings:
+    # Tabs, die nach dem ersten Frame im Leerlauf vorgebaut werden
+    prewarm: list[str] = field(default_factory=list)
+    prewarm_delay_ms: int = 200
+    budget_ms: float = 2000
+
+
+@dataclass(slots=True)
+class TerminalSettings:
+    # leer = automatisch nach Plattform (winpty / posix, cmd.exe / $SHELL)
+    backend: str = ""
+    shell: str = ""
+    # Zeilen, die über dem Bildschirm im Terminal-Tab stehen bleiben; ältere
+    # landen in einer Datei im Temp-Ordner und werden beim Hochscrollen nachgeladen
+    scrollback_lines: int = 10000
+    spill_scrollback: bool = True
+
+
+_SECTIONS = {
+    "git": GitSettings,
+    "dashboard": DashboardSettings,
+    "cache": CacheSettings,
+    "rate_limit": RateLimitSettings,
+    "logs": LogSettings,
+    "startup": StartupSettings,
+    "terminal": TerminalSettings,
+}
+
+
+@dataclass(slots=True)
+class AppConfig:
+    app_title: str = "UnrealGitUI"
+    mode: str = "dark"
+    git: GitSettings = field(default_factory=GitSettings)
+    dashboard: DashboardSettings = field(default_factory=DashboardSettings)
+    cache: CacheSettings = field(default_factory=CacheSettings)
+    rate_limit: RateLimitSettings = field(default_factory=RateLimitSettings)
+    logs: LogSettings = field(default_factory=LogSettings)
+    startup: StartupSettings = field(default_factory=StartupSettings)
+    terminal: TerminalSettings = field(default_factory=TerminalSettings)
+    # frei belegbare Tool-Pfade (unreal, git, vscode, ...)
+    paths: dict[str, str] = field(default_factory=dict)
+    # unbekannte Keys bleiben beim Speichern erhalten
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AppConfig":
+        missing = [key for key in ("app_title", "git") if key not in data]
+        if missing:
+            raise ConfigError(f"Missing required configuration keys: {missing}")
+        config = cls(app_title=data["app_title"], mode=data.get("mode", "dark"), paths=dict(data.get("paths", {})))
+        for name, section_cls in _SECTIONS.items():
+            values = data.get(name, {})
+            known = {f.name for f in fields(section_cls)}
+            unknown = set(values) - known
+            if unknown:
+                LOGGER.warning(f"Ignoring unknown keys in config section '{name}': {sorted(unknown)}")
+            setattr(config, name, section_cls(**{k: v for k, v in values.items() if k in known}))
+        config.extra = {
+            k: v for k, v in data.items() if k not in _SECTIONS and k not in ("app_title", "mode", "paths")
+        }
+        return config
+
+    def to_dict(self) -> dict:
+        data = {"app_title": self.app_title, "mode": self.mode}
+        for name in _SECTIONS:
+            data[name] = asdict(getattr(self, name))
+        # Token kommt aus main/.env und gehört nicht in die config.json
+        data["git"].pop("token", None)
+        data["paths"] = dict(self.paths)
+        data.update(self.extra)
+        return data
+
+
+class ConfigService:
+    """
+    Loads config.json + main/.env once (on first access) and shares the typed
+    AppConfig between all modules. Changes go through `set`, which notifies the
+    subscribers of the changed key, so every tab sees edits without re-reading
+    the file. `save` is write-behind: it only marks the config dirty, a timer
+    thread writes it atomically after `save_delay` seconds of quiet.
+    """
+
+    def __init__(self, path: str = CONFIG_PATH, save_delay: float = SAVE_DELAY):
+        self.path = path
+        self.save_delay = save_delay
+        self._config: AppConfig | None = None
+        self._lock = threading.RLock()
+        self._subscribers: list[tuple[str, Callable[[str, object], None]]] = []
+        self._dirty = False
+        self._save_timer: threading.Timer | None = None
+
+    def get(self) -> AppConfig:
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = AppConfig.from_dict(load_config(self.path))
+        return self._config
+
+    def reload(self) -> AppConfig:
+        with self._lock:
+            self._config = None
+            return self.get()
+
+    def set(self, key: str, value) -> None:
+        """Sets a dotted key, e.g. "mode" or "dashboard.refresh_seconds", and notifies subscribers."""
+        config = self.get()
+        with self._lock:
+            *parents, name = key.split(".")
+            target = config
+            for parent in parents:
+                target = getattr(target, parent)
+            if isinstance(target, dict):
+                target[name] = value
+            else:
+                setattr(target, name, value)  # slots: Tippfehler im Key -> AttributeError
+            subscribers = list(self._subscribers)
+        for prefix, callback in subscribers:
+            if key == prefix or key.startswith(prefix + ".") or not prefix:
+                try:
+                    callback(key, value)
+                except Exception as e:
+                    LOGGER.error(f"Config subscriber for '{prefix}' failed: {e}")
+
+    def subscribe(self, callback: Callable[[str, object], None], prefix: str = "") -> Callable[[], None]:
+        """Calls `callback(key, value)` for changes below `prefix`; returns an unsubscribe function."""
+        entry = (prefix, callback)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def save(self) -> None:
+        """Schedules a write; further saves within `save_delay` restart the window."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Writes pending changes now (timer thread, or at exit)."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty or self._config is None:
+                return
+            data = self._config.to_dict()
+            self._dirty = False
+        try:
+            write_json_atomic(self.path, data)
+            LOGGER.debug(f'Config saved to "{self.path}".')
+        except OSError as e:
+            LOGGER.error(f'Could not save config to "{self.path}": {e}')
+            with self._lock:
+                self._dirty = True
+
+
+CONFIG_SERVICE = ConfigService()
+register_exit_hook(CONFIG_SERVICE.flush)
+
+
+def get_config() -> AppConfig:
+    return CONFIG_SERVICE.get()
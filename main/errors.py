@@ -14,3 +14,11 @@ class MissingDotEnvFile(Exception):
 class MissingGithubToken(Exception):
     """Exception if Github Token is Missing"""
     pass
+
+class GithubQueryError(Exception):
+    """Exception if a Github GraphQL Query fails"""
+    pass
+
+class GitCommandError(Exception):
+    """Exception if a local git command fails"""
+    pass
@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from main._template import LOGGER
+
+DEFAULT_CACHE_SIZE = 50 * 1024 * 1024  # 50 MB
+
+
+class EtagCache:
+    """
+    On-disk cache for GET responses, keyed by URL (+ Token-Hash).
+    Each entry is one JSON file with body, ETag / Last-Modified and headers.
+    The file mtime is used as last access time for LRU eviction. Sizes are
+    re-read from the directory before evicting, so entries written by another
+    running instance count against the limit as well.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_CACHE_SIZE):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._sizes: dict[str, int] = {}
+        self._scan()
+
+    def _scan(self) -> None:
+        sizes = {}
+        for f in self.directory.glob("*.json"):
+            try:
+                sizes[f.name] = f.stat().st_size
+            except OSError:
+                continue  # gerade von einer anderen Instanz entfernt
+        self._sizes = sizes
+
+    @staticmethod
+    def make_key(url: str, authorization: str | None = None) -> str:
+        raw = f"{url}|{authorization or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            try:
+                os.utime(path)  # LRU: Zugriff merken
+            except OSError:
+                pass
+        return entry
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def put(self, key: str, entry: dict) -> None:
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        data = json.dumps(entry)
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            self._sizes[path.name] = path.stat().st_size
+            self._evict()
+
+    def _evict(self) -> None:
+        # andere Instanzen schreiben ins selbe Verzeichnis: deren Einträge zählen mit
+        self._scan()
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+        files = sorted(
+            (self.directory / name for name in self._sizes),
+            key=lambda p: p.stat().st_mtime if p.exists() else 0,
+        )
+        for path in files:
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes.pop(path.name, 0)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            self.evictions += 1
+
+    def size(self) -> int:
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._sizes),
+                "bytes": sum(self._sizes.values()),
+            }
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that revalidates cached GET responses with If-None-Match /
+    If-Modified-Since. A 304 is answered from the cache (GitHub does not
+    count 304s against the rate limit).
+    """
+
+    def __init__(self, cache: EtagCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        key = EtagCache.make_key(request.url, request.headers.get("Authorization"))
+        entry = self.cache.get(key)
+        if entry:
+            if entry.get("etag"):
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.cache.record_hit()
+            LOGGER.debug("HTTP cache hit (304): %s", request.url)
+            cached = self._build_response(request, entry, response)
+            response.close()
+            return cached
+
+        self.cache.record_miss()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            self.cache.put(
+                key,
+                {
+                    "url": request.url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "headers": dict(response.headers),
+                    "body": response.text,
+                    "stored": time.time(),
+                },
+            )
+        return response
+
+    def _build_response(
+        self,
+        request: requests.PreparedRequest,
+        entry: dict,
+        not_modified: requests.Response,
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.encoding = "utf-8"
+        headers = CaseInsensitiveDict(entry.get("headers", {}))
+        # aktuelle Rate-Limit / Date Header vom 304 übernehmen
+        headers.update(not_modified.headers)
+        headers.pop("Content-Length", None)
+        headers.pop("Content-Encoding", None)
+        response.headers = headers
+        response._content = entry.get("body", "").encode("utf-8")
+        response._content_consumed = True
+        return response
@@ -1,10 +1,52 @@
+import threading
+
+from collections.abc import Iterator
+from datetime import datetime
+
 from github import Github
-from github.Commit import Commit
 
+from main.github_tools.graphql import COMMIT_PAGE_SIZE, SECTIONS, fetch_dashboard
+from main.github_tools.multi_repo import RepoOverview
+from main.github_tools.providers import (
+    DashboardProvider,
+    GithubProvider,
+    create_commit_provider,
+)
+from main.github_tools.session import (
+    configure_http_cache,
+    configure_scheduler,
+    install_github_cache,
+)
+from main.config import CONFIG_SERVICE, get_config
 from main.github_tools.token import GIT_AUTH_TOKEN
 
+CONFIG = get_config()
+
+# Alle REST-Requests laufen über den ETag-Cache (304 zählen nicht gegen das Rate-Limit)
+configure_http_cache(CONFIG.cache.max_mb)
+# Alle Requests gehen durch den Scheduler (Rate-Limit-Budget, Prioritäten, Backoff)
+configure_scheduler(CONFIG.rate_limit.max_concurrent, CONFIG.rate_limit.background_reserve)
+install_github_cache()
 GIT_CLIENT = Github(GIT_AUTH_TOKEN)
 
+_PROVIDERS: dict[str, DashboardProvider] = {}
+_PROVIDERS_LOCK = threading.Lock()
+
+
+def _reset_providers(key: str, value) -> None:
+    # geänderte Pfade / Provider-Art: Provider beim nächsten Zugriff neu anlegen
+    with _PROVIDERS_LOCK:
+        _PROVIDERS.clear()
+
+
+CONFIG_SERVICE.subscribe(_reset_providers, "paths")
+CONFIG_SERVICE.subscribe(_reset_providers, "dashboard.provider")
+
+REPO_OVERVIEW = RepoOverview(
+    GIT_AUTH_TOKEN,
+    failure_budget=CONFIG.dashboard.repo_failure_budget,
+)
+
 def get_last_commit(repo_name: str, branch: str = "master"):
     repo = GIT_CLIENT.get_repo(repo_name)
     branch_ref = repo.get_branch(branch)
@@ -46,15 +88,98 @@ def get_last_release(repo_name: str):
     return releases[0]
 
 
-def get_last_x_commits(repo_name: str, x: int = 5) -> list[Commit]:
-    repo = GIT_CLIENT.get_repo(repo_name)
-    commits = repo.get_commits()
+def iter_last_x_commits(repo_name: str, x: int = 5) -> Iterator[dict]:
+    # Stats für alle x Commits gebündelt (git log --numstat bzw. GraphQL-Seiten), kein c.stats pro Commit
+    yield from get_commit_provider(repo_name).iter_last_commits(x)
+
+
+def get_last_x_commits(repo_name: str, x: int = 5) -> list[dict]:
+    return list(iter_last_x_commits(repo_name, x))
+
+
+def get_commit_provider(repo_name: str) -> DashboardProvider:
+    with _PROVIDERS_LOCK:
+        if repo_name not in _PROVIDERS:
+            paths = CONFIG.paths
+            main_repo = CONFIG.git.main_repo
+            _PROVIDERS[repo_name] = create_commit_provider(
+                CONFIG.dashboard.provider,
+                repo_name,
+                GIT_AUTH_TOKEN,
+                # der lokale Clone gehört nur zum konfigurierten Repo
+                paths.get("unreal_project") if repo_name == main_repo else None,
+                paths.get("git"),
+            )
+        return _PROVIDERS[repo_name]
+
+
+def get_dashboard_data(
+    repo_name: str, x: int = 5, sections: tuple[str, ...] = SECTIONS
+) -> dict:
+    provider = get_commit_provider(repo_name)
+    if isinstance(provider, GithubProvider):
+        if "commits" in sections and x > COMMIT_PAGE_SIZE:
+            # großes Fenster: Commits seitenweise, Rest in einem Request
+            others = tuple(section for section in sections if section != "commits")
+            result = fetch_dashboard(repo_name, 1, GIT_AUTH_TOKEN, sections=others) if others else {}
+            result["commits"] = provider.get_last_commits(x)
+            return result
+        # Status, letzte x Commits (inkl. Stats) und letzter Commit in einem GraphQL-Request
+        return fetch_dashboard(repo_name, x, GIT_AUTH_TOKEN, sections=sections)
+
+    # Commit-Daten lokal, nur GitHub-only Fakten (Stars, PRs, Releases) über die API
+    result: dict = {}
+    if "status" in sections or "commit_count" in sections:
+        commit_count = provider.get_commit_count()
+        if "commit_count" in sections:
+            result["commit_count"] = commit_count
+        if "status" in sections:
+            result["status"] = GithubProvider(repo_name, GIT_AUTH_TOKEN).get_repo_facts()
+            result["status"]["commits"] = commit_count
+    if "commits" in sections:
+        result["commits"] = provider.get_last_commits(x)
+    if "last_commit" in sections:
+        result["last_commit"] = provider.get_last_commit()
+    return result
+
+
+def batched_sections(repo_name: str, x: int = 5) -> tuple[str, ...]:
+    """Sections `get_dashboard_data` answers with a single GitHub request.
+
+    Everything else comes from the provider on its own: commits from the local
+    clone or page by page (large windows), the last commit from the local clone.
+    """
+    if isinstance(get_commit_provider(repo_name), GithubProvider):
+        if x > COMMIT_PAGE_SIZE:
+            return ("status", "commit_count", "last_commit")
+        return SECTIONS
+    # lokal: nur die GitHub-only Fakten über die API
+    return ("status", "commit_count")
+
+
+def get_dashboard_delta(
+    repo_name: str, head_sha: str | None, since: datetime | None, x: int = 5
+) -> dict:
+    """Only what changed since the last known head: new commits (newest first),
+    the current status counts and the last commit details if the head moved."""
+    provider = get_commit_provider(repo_name)
+    new_commits = list(provider.iter_commits_since(head_sha, since, x))
+    return {
+        "commits": new_commits,
+        "status": get_dashboard_data(repo_name, 1, sections=("status", "commit_count"))["status"],
+        "last_commit": provider.get_last_commit() if new_commits else None,
+    }
+
+
+def get_configured_repos() -> list[str]:
+    """Main repo (git.user/git.repo) plus the extra repos from git.repos."""
+    repos = [CONFIG.git.main_repo]
+    for repo_name in CONFIG.git.repos:
+        if repo_name not in repos:
+            repos.append(repo_name)
+    return repos
 
-    # PyGithub gibt die neuesten Commits zuerst zurück!
-    commit_list: list[Commit] = []
-    for i, commit in enumerate(commits):
-        if i >= x:
-            break
-        commit_list.append(commit)
 
-    return commit_list
+def get_repo_overview(repo_names: list[str]) -> dict[str, dict | str]:
+    # gleiche Keys wie get_repo_info (+ commits, prs, last_release), alle Repos gebündelt
+    return REPO_OVERVIEW.fetch_all(repo_names)
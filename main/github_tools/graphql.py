@@ -0,0 +1,307 @@
+from collections.abc import Iterator
+from datetime import datetime
+
+import requests
+
+from main._template import LOGGER
+from main.errors import GithubQueryError
+from main.github_tools.session import SESSION
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Query-Bausteine je Dashboard-Panel; fetch_dashboard setzt daraus eine einzige Query zusammen
+STATUS_FIELDS = """
+    name
+    description
+    stargazerCount
+    forkCount
+    issues(states: OPEN) { totalCount }
+    openPullRequests: pullRequests(states: OPEN) { totalCount }
+    pullRequests { totalCount }
+    latestRelease { name tagName }
+"""
+
+HISTORY_FIELDS = """
+    defaultBranchRef {
+      name
+      target {
+        ... on Commit {
+          history(first: $last) {
+            totalCount
+            nodes {
+              oid
+              additions
+              deletions
+              changedFilesIfAvailable
+              message
+              author { name email date }
+            }
+          }
+        }
+      }
+    }
+"""
+
+# Stats für ein ganzes Commit-Fenster seitenweise statt N+1 REST-Requests
+COMMIT_STATS_QUERY = """
+query CommitStats($owner: String!, $name: String!, $first: Int!, $after: String, $since: GitTimestamp) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $first, after: $after, since: $since) {
+            pageInfo { hasNextPage endCursor }
+            nodes { oid additions deletions }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# GitHub erlaubt max. 100 Nodes pro Connection; kleinere Seiten liefern die ersten Zeilen schneller
+MAX_PAGE_SIZE = 100
+COMMIT_PAGE_SIZE = 25
+
+# Status mehrerer Repos in einer Query (ein Alias pro Repo)
+OVERVIEW_FIELDS = STATUS_FIELDS + """
+    defaultBranchRef {
+      name
+      target { ... on Commit { history { totalCount } } }
+    }
+"""
+
+SECTIONS = ("status", "commit_count", "commits", "last_commit")
+HISTORY_SECTIONS = ("commit_count", "commits", "last_commit")
+
+
+def build_dashboard_query(sections: tuple[str, ...] = SECTIONS) -> str:
+    fields = ""
+    if "status" in sections:
+        fields += STATUS_FIELDS
+    # Commit-Anzahl, Commit-Tabelle und letzter Commit teilen sich die History
+    if any(section in sections for section in HISTORY_SECTIONS):
+        fields += HISTORY_FIELDS
+    elif "status" in sections:
+        fields += "\n    defaultBranchRef { name }\n"
+    return (
+        "query Dashboard($owner: String!, $name: String!, $last: Int!) {\n"
+        "  repository(owner: $owner, name: $name) {"
+        + fields
+        + "  }\n}\n"
+    )
+
+
+DASHBOARD_QUERY = build_dashboard_query()
+
+
+def run_query(
+    query: str,
+    variables: dict,
+    token: str,
+    endpoint: str = GRAPHQL_URL,
+    session: requests.Session | None = None,
+    allow_partial: bool = False,
+) -> dict:
+    """Runs a query and returns its data.
+
+    With `allow_partial` errors that only affect single fields (e.g. one aliased
+    repository) are tolerated; the affected fields are None.
+    """
+    session = session or SESSION
+    response = session.post(
+        endpoint,
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"bearer {token}"},
+        timeout=30,
+    )
+    if response.status_code != 200:
+        raise GithubQueryError(
+            f"GraphQL request failed with status {response.status_code}: {response.text}"
+        )
+    payload = response.json()
+    if payload.get("errors") and not (allow_partial and payload.get("data")):
+        raise GithubQueryError(f"GraphQL query returned errors: {payload['errors']}")
+    return payload["data"]
+
+
+def _parse_date(value: str | None) -> datetime | str:
+    if not value:
+        return "N/A"
+    return datetime.fromisoformat(value)
+
+
+def _commit_stats(node: dict) -> dict:
+    return {
+        "sha": node["oid"],
+        "additions": node["additions"],
+        "deletions": node["deletions"],
+        "total": node["additions"] + node["deletions"],
+    }
+
+
+def _commit_details(node: dict) -> dict:
+    author = node.get("author") or {}
+    return {
+        "sha": node["oid"],
+        "message": node["message"],
+        "author": author.get("name"),
+        "email": author.get("email"),
+        "date": _parse_date(author.get("date")),
+        "changed_files": node.get("changedFilesIfAvailable") or 0,
+    }
+
+
+def _status(repo: dict, branch: dict, commit_count: int | None) -> dict[str, str | int | None]:
+    release = repo.get("latestRelease")
+    # Gleiche Keys (und Reihenfolge) wie bisher get_repo_info + load_data
+    return {
+        "name": repo["name"],
+        "description": repo["description"],
+        "stars": repo["stargazerCount"],
+        "forks": repo["forkCount"],
+        "open_issues": repo["issues"]["totalCount"]
+        + repo["openPullRequests"]["totalCount"],
+        "default_branch": branch.get("name", "N/A"),
+        "commits": commit_count,
+        "prs": repo["pullRequests"]["totalCount"],
+        "last_release": (release["name"] or release["tagName"]) if release else "N/A",
+    }
+
+
+def fetch_dashboard(
+    repo_name: str,
+    last_x: int,
+    token: str,
+    endpoint: str = GRAPHQL_URL,
+    session: requests.Session | None = None,
+    sections: tuple[str, ...] = SECTIONS,
+) -> dict:
+    """Lädt die Dashboard-Daten mit einem einzigen GraphQL-Request.
+
+    Rückgabe: {"status": dict, "commit_count": int, "commits": list[dict],
+    "last_commit": dict | None}, beschränkt auf die angefragten `sections`.
+    Ohne "commit_count" ist status["commits"] None.
+    """
+    owner, name = repo_name.split("/", 1)
+    LOGGER.debug(f"Fetching dashboard data {sections} for {repo_name} via GraphQL.")
+    data = run_query(
+        build_dashboard_query(sections),
+        {"owner": owner, "name": name, "last": min(max(last_x, 1), MAX_PAGE_SIZE)},
+        token,
+        endpoint=endpoint,
+        session=session,
+    )
+
+    repo = data.get("repository")
+    if repo is None:
+        raise GithubQueryError(f"Repository {repo_name} not found.")
+
+    branch = repo.get("defaultBranchRef") or {}
+    history = (branch.get("target") or {}).get("history") or {
+        "totalCount": 0,
+        "nodes": [],
+    }
+    nodes = history["nodes"]
+
+    commit_count = history["totalCount"] if "commit_count" in sections else None
+
+    result: dict = {}
+    if "status" in sections:
+        result["status"] = _status(repo, branch, commit_count)
+    if "commit_count" in sections:
+        result["commit_count"] = commit_count
+    if "commits" in sections:
+        result["commits"] = [_commit_stats(n) for n in nodes[:last_x]]
+    if "last_commit" in sections:
+        result["last_commit"] = _commit_details(nodes[0]) if nodes else None
+    return result
+
+
+def iter_commit_stats(
+    repo_name: str,
+    x: int,
+    token: str,
+    endpoint: str = GRAPHQL_URL,
+    session: requests.Session | None = None,
+    page_size: int = COMMIT_PAGE_SIZE,
+    since: datetime | None = None,
+) -> Iterator[dict]:
+    """Yields the stats of the last x commits page by page (newest first).
+
+    With `since` only commits from that point in time on are requested (delta polling).
+    """
+    owner, name = repo_name.split("/", 1)
+    page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+    after: str | None = None
+    remaining = x
+    while remaining > 0:
+        data = run_query(
+            COMMIT_STATS_QUERY,
+            {
+                "owner": owner,
+                "name": name,
+                "first": min(page_size, remaining),
+                "after": after,
+                "since": since.isoformat() if since else None,
+            },
+            token,
+            endpoint=endpoint,
+            session=session,
+        )
+        repo = data.get("repository")
+        if repo is None:
+            raise GithubQueryError(f"Repository {repo_name} not found.")
+        target = (repo.get("defaultBranchRef") or {}).get("target") or {}
+        history = target.get("history") or {"nodes": [], "pageInfo": {}}
+
+        nodes = history["nodes"][:remaining]
+        for node in nodes:
+            yield _commit_stats(node)
+        remaining -= len(nodes)
+
+        page_info = history.get("pageInfo") or {}
+        if not nodes or not page_info.get("hasNextPage"):
+            break
+        after = page_info.get("endCursor")
+
+
+def fetch_repo_overview(
+    repo_names: list[str],
+    token: str,
+    endpoint: str = GRAPHQL_URL,
+    session: requests.Session | None = None,
+) -> dict[str, dict | None]:
+    """Status (same keys as the status panel) for several repos in one request.
+
+    Repos that could not be resolved (not found, no access) map to None.
+    """
+    aliases = {f"r{i}": repo_name for i, repo_name in enumerate(repo_names)}
+    variables: dict[str, str] = {}
+    params: list[str] = []
+    fields = ""
+    for alias, repo_name in aliases.items():
+        owner, name = repo_name.split("/", 1)
+        variables[f"{alias}_owner"], variables[f"{alias}_name"] = owner, name
+        params.append(f"${alias}_owner: String!, ${alias}_name: String!")
+        fields += (
+            f"  {alias}: repository(owner: ${alias}_owner, name: ${alias}_name) {{"
+            + OVERVIEW_FIELDS
+            + "  }\n"
+        )
+    query = f"query Overview({', '.join(params)}) {{\n{fields}}}\n"
+
+    LOGGER.debug(f"Fetching overview for {len(repo_names)} repositories via GraphQL.")
+    data = run_query(query, variables, token, endpoint=endpoint, session=session, allow_partial=True)
+
+    result: dict[str, dict | None] = {}
+    for alias, repo_name in aliases.items():
+        repo = data.get(alias)
+        if repo is None:
+            result[repo_name] = None
+            continue
+        branch = repo.get("defaultBranchRef") or {}
+        history = (branch.get("target") or {}).get("history") or {"totalCount": 0}
+        result[repo_name] = _status(repo, branch, history["totalCount"])
+    return result
@@ -0,0 +1,86 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from main._template import LOGGER
+from main.github_tools.graphql import fetch_repo_overview
+
+# Repos pro GraphQL-Query; die Batches laufen parallel über die gemeinsame Session
+OVERVIEW_BATCH_SIZE = 10
+
+
+class RepoOverview:
+    """
+    Fetches the status of many repositories concurrently in aliased GraphQL batches.
+    Every repo has a failure budget: after `failure_budget` consecutive failures
+    it is skipped for `cooldown` seconds so one broken repo does not slow down
+    (or spam) every refresh.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        batch_size: int = OVERVIEW_BATCH_SIZE,
+        max_workers: int = 4,
+        failure_budget: int = 3,
+        cooldown: float = 600.0,
+        fetch=fetch_repo_overview,
+    ):
+        self.token = token
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.failure_budget = failure_budget
+        self.cooldown = cooldown
+        self._fetch = fetch
+        self._failures: dict[str, int] = {}
+        self._skip_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _is_skipped(self, repo_name: str, now: float) -> bool:
+        return self._skip_until.get(repo_name, 0) > now
+
+    def _record(self, repo_name: str, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._failures.pop(repo_name, None)
+                self._skip_until.pop(repo_name, None)
+                return
+            self._failures[repo_name] = self._failures.get(repo_name, 0) + 1
+            if self._failures[repo_name] >= self.failure_budget:
+                LOGGER.warning(
+                    f"{repo_name} failed {self._failures[repo_name]} times, skipping it for {self.cooldown:.0f}s."
+                )
+                self._skip_until[repo_name] = time.time() + self.cooldown
+
+    def _fetch_batch(self, batch: list[str]) -> dict[str, dict | None]:
+        try:
+            return self._fetch(batch, self.token)
+        except Exception as e:
+            LOGGER.error(f"Overview batch {batch} failed: {e}")
+            return {repo_name: None for repo_name in batch}
+
+    def fetch_all(self, repo_names: list[str]) -> dict[str, dict | str]:
+        """Returns {repo: status dict} or {repo: "error" | "skipped"}, in the given order."""
+        now = time.time()
+        active = [r for r in repo_names if not self._is_skipped(r, now)]
+        batches = [
+            active[i : i + self.batch_size] for i in range(0, len(active), self.batch_size)
+        ]
+
+        results: dict[str, dict | None] = {}
+        if batches:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batches)), thread_name_prefix="overview"
+            ) as executor:
+                for batch_result in executor.map(self._fetch_batch, batches):
+                    results.update(batch_result)
+
+        overview: dict[str, dict | str] = {}
+        for repo_name in repo_names:
+            if repo_name not in active:
+                overview[repo_name] = "skipped"
+                continue
+            status = results.get(repo_name)
+            self._record(repo_name, status is not None)
+            overview[repo_name] = status if status is not None else "error"
+        return overview
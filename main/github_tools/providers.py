@@ -0,0 +1,238 @@
+import os
+import shutil
+import subprocess
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
+
+from main._template import LOGGER
+from main.errors import GitCommandError
+from main.github_tools.graphql import fetch_dashboard, iter_commit_stats
+
+# Trenner für git --format (Record / Feld)
+_RS = "\x1e"
+_FS = "\x1f"
+
+
+class DashboardProvider(ABC):
+    """Source for the commit based dashboard data (same dict shapes as graphql.py)."""
+
+    name = "base"
+
+    @abstractmethod
+    def get_commit_count(self) -> int: ...
+
+    @abstractmethod
+    def get_last_commits(self, x: int = 5) -> list[dict]: ...
+
+    def iter_last_commits(self, x: int = 5) -> Iterator[dict]:
+        """Streams the last x commits; providers that can page override this."""
+        yield from self.get_last_commits(x)
+
+    def iter_commits_since(
+        self, head_sha: str | None, since: datetime | None, x: int = 5
+    ) -> Iterator[dict]:
+        """Streams the commits newer than head_sha (at most x, newest first)."""
+        for commit in self.iter_last_commits(x):
+            if commit["sha"] == head_sha:
+                return
+            yield commit
+
+    @abstractmethod
+    def get_last_commit(self) -> dict | None: ...
+
+
+class GithubProvider(DashboardProvider):
+    """Commit data via the GitHub GraphQL API, plus the GitHub-only repo facts."""
+
+    name = "github"
+
+    def __init__(self, repo_name: str, token: str):
+        self.repo_name = repo_name
+        self.token = token
+
+    def get_repo_facts(self, include_commit_count: bool = False) -> dict:
+        sections = ("status", "commit_count") if include_commit_count else ("status",)
+        return fetch_dashboard(self.repo_name, 1, self.token, sections=sections)["status"]
+
+    def get_commit_count(self) -> int:
+        return fetch_dashboard(self.repo_name, 1, self.token, sections=("commit_count",))["commit_count"]
+
+    def get_last_commits(self, x: int = 5) -> list[dict]:
+        return list(self.iter_last_commits(x))
+
+    def iter_last_commits(self, x: int = 5) -> Iterator[dict]:
+        yield from iter_commit_stats(self.repo_name, x, self.token)
+
+    def iter_commits_since(
+        self, head_sha: str | None, since: datetime | None, x: int = 5
+    ) -> Iterator[dict]:
+        # history(since:) schließt den alten Head mit ein -> dort abbrechen
+        for commit in iter_commit_stats(self.repo_name, x, self.token, since=since):
+            if commit["sha"] == head_sha:
+                return
+            yield commit
+
+    def get_last_commit(self) -> dict | None:
+        return fetch_dashboard(self.repo_name, 1, self.token, sections=("last_commit",))["last_commit"]
+
+
+class LocalGitProvider(DashboardProvider):
+    """Commit data from the local clone (git rev-list / git log), no network needed."""
+
+    name = "local"
+
+    def __init__(self, repo_path: str, git_executable: str | None = None, ref: str = "HEAD"):
+        self.repo_path = repo_path
+        self.git = git_executable or "git"
+        self.ref = ref
+
+    @staticmethod
+    def find_git(configured: str | None) -> str | None:
+        if configured and os.path.exists(configured):
+            return configured
+        return shutil.which("git")
+
+    def is_available(self) -> bool:
+        return bool(self.repo_path) and os.path.isdir(os.path.join(self.repo_path, ".git"))
+
+    def _popen_kwargs(self) -> dict:
+        return {
+            "text": True,
+            "encoding": "utf-8",
+            "errors": "replace",
+            # kein Konsolenfenster unter Windows
+            "creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        }
+
+    def _run(self, *args: str) -> str:
+        cmd = [self.git, "-C", self.repo_path, *args]
+        try:
+            result = subprocess.run(cmd, capture_output=True, **self._popen_kwargs())
+        except OSError as e:
+            raise GitCommandError(f"Could not run {cmd}: {e}") from e
+        if result.returncode != 0:
+            raise GitCommandError(f"{' '.join(cmd)} failed: {result.stderr.strip()}")
+        return result.stdout
+
+    def _stream(self, *args: str) -> Iterator[str]:
+        """Yields stdout lines while git is still running."""
+        cmd = [self.git, "-C", self.repo_path, *args]
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **self._popen_kwargs()
+            )
+        except OSError as e:
+            raise GitCommandError(f"Could not run {cmd}: {e}") from e
+        try:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+            stderr = proc.stderr.read() if proc.stderr else ""
+            if proc.wait() != 0:
+                raise GitCommandError(f"{' '.join(cmd)} failed: {stderr.strip()}")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            for pipe in (proc.stdout, proc.stderr):
+                if pipe is not None:
+                    pipe.close()
+
+    @staticmethod
+    def _numstat(lines: list[str]) -> tuple[int, int, int]:
+        """Returns (additions, deletions, files) for `git log --numstat` lines."""
+        additions = deletions = files = 0
+        for line in lines:
+            parts = line.split("\t")
+            if len(parts) < 3:
+                continue
+            files += 1
+            # Binärdateien haben "-" statt Zahlen
+            additions += int(parts[0]) if parts[0].isdigit() else 0
+            deletions += int(parts[1]) if parts[1].isdigit() else 0
+        return additions, deletions, files
+
+    def get_commit_count(self) -> int:
+        return int(self._run("rev-list", "--count", self.ref).strip())
+
+    def get_last_commits(self, x: int = 5) -> list[dict]:
+        return list(self.iter_last_commits(x))
+
+    def iter_last_commits(self, x: int = 5, revision: str | None = None) -> Iterator[dict]:
+        sha: str | None = None
+        numstat: list[str] = []
+        for line in self._stream("log", f"-n{x}", "--numstat", f"--format={_RS}%H", revision or self.ref):
+            if line.startswith(_RS):
+                if sha is not None:
+                    yield self._commit_stats(sha, numstat)
+                sha, numstat = line[1:], []
+            elif line:
+                numstat.append(line)
+        if sha is not None:
+            yield self._commit_stats(sha, numstat)
+
+    def iter_commits_since(
+        self, head_sha: str | None, since: datetime | None, x: int = 5
+    ) -> Iterator[dict]:
+        if head_sha is None:
+            yield from self.iter_last_commits(x)
+            return
+        try:
+            self._run("cat-file", "-e", f"{head_sha}^{{commit}}")
+        except GitCommandError:
+            # alter Head unbekannt (z.B. nach Rebase): generischer Vergleich
+            yield from super().iter_commits_since(head_sha, since, x)
+            return
+        yield from self.iter_last_commits(x, revision=f"{head_sha}..{self.ref}")
+
+    def _commit_stats(self, sha: str, numstat: list[str]) -> dict:
+        additions, deletions, _ = self._numstat(numstat)
+        return {
+            "sha": sha,
+            "additions": additions,
+            "deletions": deletions,
+            "total": additions + deletions,
+        }
+
+    def get_last_commit(self) -> dict | None:
+        output = self._run(
+            "log",
+            "-n1",
+            "--numstat",
+            f"--format=%H{_FS}%an{_FS}%ae{_FS}%aI{_FS}%B{_RS}",
+            self.ref,
+        )
+        if not output.strip():
+            return None
+        header, _, numstat = output.partition(_RS)
+        sha, author, email, date, message = header.split(_FS, 4)
+        _, _, files = self._numstat(numstat.strip("\n").splitlines())
+        return {
+            "sha": sha,
+            "message": message.strip("\n"),
+            "author": author,
+            "email": email,
+            "date": datetime.fromisoformat(date),
+            "changed_files": files,
+        }
+
+
+def create_commit_provider(
+    kind: str,
+    repo_name: str,
+    token: str,
+    repo_path: str | None,
+    git_executable: str | None = None,
+) -> DashboardProvider:
+    """Local git is the default; falls back to GitHub if the clone is not available."""
+    if kind == "local":
+        git = LocalGitProvider.find_git(git_executable)
+        provider = LocalGitProvider(repo_path or "", git)
+        if git and provider.is_available():
+            LOGGER.info(f'Using local git dashboard provider for "{repo_path}".')
+            return provider
+        LOGGER.warning(
+            f'Local clone "{repo_path}" or git not found, falling back to GitHub provider.'
+        )
+    return GithubProvider(repo_name, token)
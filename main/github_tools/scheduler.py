@@ -0,0 +1,293 @@
+import heapq
+import itertools
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+
+from main._template import LOGGER
+from main.github_tools.cache import CachingAdapter, EtagCache
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+# Latenz-Buckets in ms (letzter Bucket = alles darüber)
+LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+MAX_BACKOFF = 300.0
+
+# Endpunkte mit Latenz-Histogramm in der Statuszeile (nach Anzahl Requests)
+STATUS_ENDPOINTS = 3
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if ms <= bound:
+                self.counts[i] += 1
+                break
+        self.total += 1
+        self.sum_ms += ms
+
+    def percentile(self, p: float) -> float:
+        """Upper bucket bound that contains the p-th percentile."""
+        if not self.total:
+            return 0.0
+        threshold = self.total * p
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= threshold:
+                return bound
+        return LATENCY_BUCKETS[-1]
+
+    def summary(self) -> dict:
+        return {
+            "count": self.total,
+            "avg_ms": round(self.sum_ms / self.total, 1) if self.total else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": dict(zip((str(b) for b in LATENCY_BUCKETS), self.counts)),
+        }
+
+    def format(self) -> str:
+        """One line: percentiles plus the count per bucket, e.g. `p50<=100ms p95<=250ms [3 5 2 0 0 0 0 0]`."""
+        return (
+            f"p50<={self.percentile(0.5):g}ms p95<={self.percentile(0.95):g}ms "
+            f"[{' '.join(str(c) for c in self.counts)}]"
+        )
+
+
+class RateBudget:
+    """Rate-limit window of one GitHub resource (core, graphql, search, ...)."""
+
+    def __init__(self):
+        self.remaining: int | None = None
+        self.limit: int | None = None
+        self.reset_at: float | None = None
+
+    def allows(self, priority: int, reserve: int, now: float) -> bool:
+        if self.remaining is None:
+            return True
+        if self.reset_at is not None and now >= self.reset_at:
+            return True  # neues Fenster, Budget unbekannt bis zur nächsten Antwort
+        if priority == INTERACTIVE:
+            return self.remaining > 0
+        return self.remaining > reserve
+
+    def update(self, headers) -> None:
+        if "X-RateLimit-Remaining" in headers:
+            self.remaining = int(float(headers["X-RateLimit-Remaining"]))
+        if "X-RateLimit-Limit" in headers:
+            self.limit = int(float(headers["X-RateLimit-Limit"]))
+        if "X-RateLimit-Reset" in headers:
+            self.reset_at = float(headers["X-RateLimit-Reset"])
+
+    def stats(self, now: float) -> dict:
+        return {
+            "remaining": self.remaining,
+            "limit": self.limit,
+            "reset_in": max(int(self.reset_at - now), 0) if self.reset_at else None,
+        }
+
+
+def resource_for(url: str) -> str:
+    """Rate-limit resource a request is counted against before GitHub names it in X-RateLimit-Resource."""
+    path = urlparse(url).path
+    if path.endswith("/graphql"):
+        return "graphql"
+    if path.startswith("/search/"):
+        return "search"
+    return "core"
+
+
+def graphql_operation(body: bytes | str | None) -> str | None:
+    """Operation name of a GraphQL request body, e.g. "Dashboard" for `query Dashboard(...)`."""
+    if not body:
+        return None
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("operationName"):
+        return payload["operationName"]
+    match = re.match(r"\s*(?:query|mutation)\s+(\w+)", payload.get("query") or "")
+    return match.group(1) if match else None
+
+
+def endpoint_key(method: str, url: str, body: bytes | str | None = None) -> str:
+    """Groups URLs by endpoint, e.g. GET /repos/:repo/commits/:sha or POST /graphql Dashboard"""
+    path = urlparse(url).path
+    path = re.sub(r"^/repos/[^/]+/[^/]+", "/repos/:repo", path)
+    path = re.sub(r"/[0-9a-f]{40}(?=/|$)", "/:sha", path)
+    path = re.sub(r"/\d+(?=/|$)", "/:id", path)
+    key = f"{method} {path}"
+    if path.endswith("/graphql"):
+        # alle GraphQL-Abfragen gehen an denselben Pfad: nach Operation aufschlüsseln
+        key += f" {graphql_operation(body) or ':anonymous'}"
+    return key
+
+
+class RequestScheduler:
+    """
+    Central gate for all GitHub requests.
+    Tracks the rate-limit budget of every resource (core, graphql, search)
+    from the response headers, lets interactive
+    requests go first and keeps a reserve that background refreshes may not use.
+    Secondary rate limits (403/429 with Retry-After) pause all requests with
+    an adaptive backoff.
+    """
+
+    def __init__(self, max_concurrent: int = 4, background_reserve: int = 500):
+        self.max_concurrent = max_concurrent
+        self.background_reserve = background_reserve
+        self.budgets: dict[str, RateBudget] = {}
+        self.latencies: dict[str, LatencyHistogram] = {}
+        self._cond = threading.Condition()
+        self._waiting: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._blocked_until = 0.0
+        self._backoff = 0.0
+        self._local = threading.local()
+
+    # ===== Priorität pro Thread =====
+    def current_priority(self) -> int:
+        return getattr(self._local, "priority", INTERACTIVE)
+
+    @contextmanager
+    def background(self):
+        previous = self.current_priority()
+        self._local.priority = BACKGROUND
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    # ===== Budget =====
+    def budget(self, resource: str = "core") -> RateBudget:
+        return self.budgets.setdefault(resource, RateBudget())
+
+    def _wait_time(self, priority: int, now: float, resource: str = "core") -> float | None:
+        """None if the request may start now, otherwise the seconds to wait."""
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        budget = self.budget(resource)
+        if not budget.allows(priority, self.background_reserve, now):
+            return max((budget.reset_at or now + 60) - now, 0.5)
+        if self._active >= self.max_concurrent:
+            return 1.0
+        return None
+
+    def acquire(self, priority: int = INTERACTIVE, resource: str = "core") -> None:
+        ticket = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            while True:
+                if self._waiting[0] == ticket:
+                    wait = self._wait_time(priority, time.time(), resource)
+                    if wait is None:
+                        heapq.heappop(self._waiting)
+                        self._active += 1
+                        self._cond.notify_all()
+                        return
+                else:
+                    wait = 1.0
+                self._cond.wait(timeout=min(wait, 5.0))
+
+    def release(
+        self, endpoint: str, status: int | None, headers, elapsed: float, resource: str = "core"
+    ) -> None:
+        with self._cond:
+            self._active -= 1
+            self.latencies.setdefault(endpoint, LatencyHistogram()).record(elapsed * 1000)
+            if headers:
+                self._update_budget(status, headers, resource)
+            self._cond.notify_all()
+
+    def _update_budget(self, status: int | None, headers, resource: str = "core") -> None:
+        # GitHub nennt die Ressource selbst; Core- und GraphQL-Budget sind getrennte Fenster
+        budget = self.budget(headers.get("X-RateLimit-Resource") or resource)
+        budget.update(headers)
+
+        if status in (403, 429) and ("Retry-After" in headers or budget.remaining == 0):
+            now = time.time()
+            if "Retry-After" in headers:
+                # Secondary Rate Limit: Retry-After respektieren, bei Wiederholung verdoppeln
+                wait = max(float(headers["Retry-After"]), self._backoff * 2, 1.0)
+            else:
+                wait = max((budget.reset_at or now + 60) - now, 1.0)
+            self._backoff = min(wait, MAX_BACKOFF)
+            self._blocked_until = now + self._backoff
+            LOGGER.warning(
+                f"GitHub rate limit hit (status {status}), pausing requests for {self._backoff:.0f}s."
+            )
+        elif status is not None and status < 400:
+            self._backoff /= 2
+
+    # ===== Instrumentierung =====
+    def queue_depth(self) -> int:
+        return len(self._waiting)
+
+    def stats(self) -> dict:
+        with self._cond:
+            now = time.time()
+            return {
+                "budgets": {k: v.stats(now) for k, v in self.budgets.items()},
+                "queue_depth": len(self._waiting),
+                "active": self._active,
+                "paused_for": max(round(self._blocked_until - now, 1), 0),
+                "latency": {k: v.summary() for k, v in self.latencies.items()},
+            }
+
+    def format_status(self) -> str:
+        """Budget line per resource, then one latency histogram line per busiest endpoint."""
+        with self._cond:
+            budgets = ", ".join(
+                f"{name} {b.remaining}/{b.limit}" for name, b in sorted(self.budgets.items()) if b.remaining is not None
+            )
+            text = f"API-Budget: {budgets or '?'} | Queue: {len(self._waiting)} | Aktiv: {self._active}"
+            paused = self._blocked_until - time.time()
+            if paused > 0:
+                text += f" | Pausiert: {paused:.0f}s"
+            busiest = sorted(self.latencies.items(), key=lambda item: item[1].total, reverse=True)
+            for endpoint, histogram in busiest[:STATUS_ENDPOINTS]:
+                text += f"\n{endpoint} (n={histogram.total}): {histogram.format()}"
+        return text
+
+
+class ScheduledAdapter(CachingAdapter):
+    """CachingAdapter whose network requests go through the RequestScheduler."""
+
+    def __init__(self, cache: EtagCache, scheduler: RequestScheduler, **kwargs):
+        super().__init__(cache, **kwargs)
+        self.scheduler = scheduler
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        resource = resource_for(request.url or "")
+        self.scheduler.acquire(self.scheduler.current_priority(), resource)
+        start = time.perf_counter()
+        status, headers = None, None
+        try:
+            response = super().send(request, **kwargs)
+            status, headers = response.status_code, response.headers
+            return response
+        finally:
+            self.scheduler.release(
+                endpoint_key(request.method or "GET", request.url or "", request.body),
+                status,
+                headers,
+                time.perf_counter() - start,
+                resource,
+            )
@@ -0,0 +1,76 @@
+import atexit
+
+import requests
+from github.GithubRetry import GithubRetry
+from github.Requester import (
+    HTTPRequestsConnectionClass,
+    HTTPSRequestsConnectionClass,
+    Requester,
+)
+
+from main._template import CACHE_DIR, LOGGER
+from main.github_tools.cache import EtagCache
+from main.github_tools.scheduler import RequestScheduler, ScheduledAdapter
+
+# Gemeinsamer HTTP-Cache + Scheduler + Session für PyGithub (REST) und GraphQL
+HTTP_CACHE = EtagCache(CACHE_DIR / "http")
+SCHEDULER = RequestScheduler()
+
+SESSION = requests.Session()
+# verhindert den Fallback auf .netrc (wie in PyGithub)
+SESSION.auth = Requester.noopAuth
+# ein Keep-Alive-Pool für alle Threads (Dashboard-Panels, Multi-Repo-Batches)
+_ADAPTER = ScheduledAdapter(
+    HTTP_CACHE,
+    SCHEDULER,
+    max_retries=GithubRetry(),
+    pool_connections=4,
+    pool_maxsize=16,
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+def configure_http_cache(max_mb: int | float) -> None:
+    HTTP_CACHE.max_bytes = int(max_mb * 1024 * 1024)
+
+
+def configure_scheduler(max_concurrent: int, background_reserve: int) -> None:
+    SCHEDULER.max_concurrent = max_concurrent
+    SCHEDULER.background_reserve = background_reserve
+
+
+def log_request_stats() -> None:
+    LOGGER.info(f"HTTP cache stats: {HTTP_CACHE.stats()}")
+    LOGGER.info(f"GitHub request scheduler: {SCHEDULER.stats()}")
+
+
+atexit.register(log_request_stats)
+
+
+class CachedHTTPSConnection(HTTPSRequestsConnectionClass):
+    """PyGithub connection that sends every request through the shared SESSION."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session.close()
+        self.session = SESSION
+
+    def close(self) -> None:
+        # SESSION wird geteilt und bleibt offen
+        pass
+
+
+class CachedHTTPConnection(HTTPRequestsConnectionClass):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session.close()
+        self.session = SESSION
+
+    def close(self) -> None:
+        pass
+
+
+def install_github_cache() -> None:
+    """Routes all PyGithub requests through the caching SESSION."""
+    Requester.injectConnectionClasses(CachedHTTPConnection, CachedHTTPSConnection)
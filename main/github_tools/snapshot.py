@@ -0,0 +1,32 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from main._template import CACHE_DIR, LOGGER
+
+SNAPSHOT_FILE = CACHE_DIR / "dashboard_snapshot.json"
+
+
+def load_snapshot(path: Path = SNAPSHOT_FILE) -> dict | None:
+    """Returns {"saved_at": datetime, "panels": {...}} or None if there is no usable snapshot."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        snapshot["saved_at"] = datetime.fromisoformat(snapshot["saved_at"])
+        return snapshot
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        LOGGER.warning(f"Dashboard snapshot at {path} is unreadable: {e}")
+        return None
+
+
+def save_snapshot(panels: dict, path: Path = SNAPSHOT_FILE) -> None:
+    snapshot = {"saved_at": datetime.now().isoformat(), "panels": panels}
+    tmp = Path(f"{path}.tmp")
+    # erst temporär schreiben, dann atomar ersetzen
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=4, default=str)
+    os.replace(tmp, path)
+    LOGGER.debug(f'Dashboard snapshot saved to "{path}".')
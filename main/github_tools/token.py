@@ -1,11 +1,11 @@
 from tkinter import simpledialog
 
-from main._template import LOGGER
-from main.config import load_config, save_config
+from dotenv import set_key
 
-CONFIG = load_config("main/config.json")
+from main._template import LOGGER
+from main.config import CONFIG_SERVICE, get_config
 
-GIT_AUTH_TOKEN = CONFIG.get("git", {}).get("token", None)
+GIT_AUTH_TOKEN = get_config().git.token
 if GIT_AUTH_TOKEN is None or GIT_AUTH_TOKEN == "":
     LOGGER.warning("Git authentication token is missing in configuration.")
     while True:
@@ -13,8 +13,8 @@ if GIT_AUTH_TOKEN is None or GIT_AUTH_TOKEN == "":
             "Git Authentication Token", "Please enter your Git authentication token:"
         )
         if GIT_AUTH_TOKEN:
-            CONFIG["git"]["token"] = GIT_AUTH_TOKEN
-            save_config("main/config.json", CONFIG)
-            CONFIG = load_config("main/config.json")
+            # Token gehört in main/.env, nicht in die config.json
+            set_key("main/.env", "GITHUB_TOKEN", GIT_AUTH_TOKEN)
+            CONFIG_SERVICE.set("git.token", GIT_AUTH_TOKEN)
             LOGGER.info("Git authentication token saved to configuration.")
             break
@@ -0,0 +1,74 @@
+import copy
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler
+
+DEFAULT_QUEUE_SIZE = 10000
+# Records ab diesem Level werden bei voller Queue nicht verworfen, sondern kurz blockiert
+KEEP_LEVEL = logging.WARNING
+BLOCK_TIMEOUT = 1.0
+# Argumente dieser Typen werden sofort eingesetzt, sie könnten sich bis zum Listener ändern
+_MUTABLE = (dict, list, set, bytearray)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Puts records into a bounded queue that a QueueListener drains in the background.
+
+    Overflow policy: if the queue is full, records below KEEP_LEVEL are dropped
+    (and counted), warnings and errors wait up to BLOCK_TIMEOUT for space.
+    %-style messages are merged lazily in the listener thread, unless an argument
+    is a mutable container that could change before it gets there. Formatting
+    (Rich, file format) always happens in the listener thread.
+    Time spent in `emit` on the main (Tk) thread is measured.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE):
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+        self.ui_records = 0
+        self.ui_seconds = 0.0
+        self.ui_max_seconds = 0.0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        args = record.args
+        if isinstance(args, dict) or (args and any(isinstance(a, _MUTABLE) for a in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno < KEEP_LEVEL:
+                self.dropped += 1
+                return
+            try:
+                self.queue.put(record, timeout=BLOCK_TIMEOUT)
+            except queue.Full:
+                self.dropped += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            super().emit(record)
+            return
+        start = time.perf_counter()
+        super().emit(record)
+        elapsed = time.perf_counter() - start
+        self.ui_records += 1
+        self.ui_seconds += elapsed
+        self.ui_max_seconds = max(self.ui_max_seconds, elapsed)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.dropped,
+            "ui_records": self.ui_records,
+            "ui_total_ms": round(self.ui_seconds * 1000, 2),
+            "ui_avg_us": round(self.ui_seconds / self.ui_records * 1e6, 1) if self.ui_records else 0.0,
+            "ui_max_ms": round(self.ui_max_seconds * 1000, 3),
+        }
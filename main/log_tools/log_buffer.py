@@ -0,0 +1,179 @@
+import array
+import glob
+import gzip
+import io
+import logging
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO
+
+DEFAULT_MAX_LINES = 10000
+
+# Level-Spalte im Format des file_handler: "... | INFO | ..."
+_LEVEL_RE = re.compile(rb" \| (DEBUG|INFO|WARNING|ERROR|CRITICAL) \| ")
+
+
+class LogBuffer:
+    """
+    Ring buffer of (levelno, line) tuples for the log view.
+
+    Multi-line records (tracebacks) are split so every entry is one display line.
+    Lines below the level filter are kept, so changing the filter only rebuilds
+    the filtered view. Once `max_lines` is reached the oldest lines are dropped.
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, min_level: int = logging.DEBUG):
+        self.max_lines = max_lines
+        self.min_level = min_level
+        self.dropped = 0
+        self._lines: deque[tuple[int, str]] = deque(maxlen=max_lines)
+        self._visible: deque[tuple[int, str]] = deque(maxlen=max_lines)
+
+    def __len__(self) -> int:
+        return len(self._visible)
+
+    def extend(self, records: list[tuple[int, str]]) -> int:
+        """Adds records, returns how many visible lines dropped out at the front."""
+        before = len(self._visible)
+        added = 0
+        for levelno, text in records:
+            for line in text.splitlines() or [""]:
+                if len(self._lines) == self.max_lines:
+                    self.dropped += 1
+                self._lines.append((levelno, line))
+                if levelno >= self.min_level:
+                    self._visible.append((levelno, line))
+                    added += 1
+        return before + added - len(self._visible)
+
+    def set_min_level(self, level: int) -> None:
+        self.min_level = level
+        self._visible = deque(
+            (line for line in self._lines if line[0] >= level), maxlen=self.max_lines
+        )
+
+    def window(self, start: int, count: int) -> list[tuple[int, str]]:
+        start = max(start, 0)
+        end = min(start + count, len(self._visible))
+        return [self._visible[i] for i in range(start, end)]
+
+
+class SessionLogFile:
+    """
+    Read-only view on the complete log file of the session, for scrolling back
+    past the ring buffer. Only line offsets and levels are kept in memory; the
+    text of a window is read from disk when it is displayed.
+
+    Parts the rotating handler has already moved away (`<stem>.N.log`, gzipped
+    as `<stem>.N.log.gz`) stay in the index; the current file is always the
+    part after the last rotated one.
+    """
+
+    def __init__(self, path: str | Path, min_level: int = logging.DEBUG):
+        self.path = Path(path)
+        self.min_level = min_level
+        self._offsets = array.array("q")
+        self._parts = array.array("l")
+        self._levels = array.array("b")
+        self._visible = array.array("l")
+        # Teil, der gerade unter `path` geschrieben wird, und wie weit er indiziert ist
+        self._part = 1
+        self._scanned = 0
+        self._file_id: tuple[int, int] | None = None
+        self._level = logging.INFO
+        # zuletzt gelesener gzip-Teil, entpackt (Fenster liegen meist im selben Teil)
+        self._unpacked: tuple[Path, bytes] | None = None
+
+    def __len__(self) -> int:
+        return len(self._visible)
+
+    def rotated_parts(self) -> dict[int, Path]:
+        """Rotated parts of this session by part number."""
+        parts: dict[int, Path] = {}
+        for candidate in self.path.parent.glob(f"{glob.escape(self.path.stem)}.*{self.path.suffix}*"):
+            number, _, rest = candidate.name[len(self.path.stem) + 1 :].partition(".")
+            if number.isdigit() and rest in (self.path.suffix[1:], self.path.suffix[1:] + ".gz"):
+                # unkomprimiert gewinnt: das .gz kann noch geschrieben werden
+                if int(number) not in parts or not candidate.name.endswith(".gz"):
+                    parts[int(number)] = candidate
+        return parts
+
+    def refresh(self) -> None:
+        """Indexes lines appended since the last call (complete lines only)."""
+        parts = self.rotated_parts()
+        last = max(parts, default=0)
+        if last >= self._part:
+            # der bisher aktuelle Teil wurde rotiert: dort weiterlesen, danach alle später rotierten
+            for number in range(self._part, last + 1):
+                if number in parts:
+                    with self._open(parts[number]) as f:
+                        self._scan(f, number, self._scanned if number == self._part else 0, closed=True)
+                self._scanned = 0
+            self._part, self._file_id = last + 1, None
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if self._file_id is not None and (stat.st_dev, stat.st_ino) != self._file_id:
+                return  # gerade rotiert, der rotierte Teil kommt beim nächsten Aufruf
+            self._file_id = (stat.st_dev, stat.st_ino)
+            self._scanned = self._scan(f, self._part, self._scanned, closed=False)
+
+    def _scan(self, f: BinaryIO, part: int, offset: int, closed: bool) -> int:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n") and not closed:
+                break
+            match = _LEVEL_RE.search(raw)
+            if match:
+                # Folgezeilen (Tracebacks) erben das Level des Records
+                self._level = logging.getLevelName(match.group(1).decode())
+            self._offsets.append(offset)
+            self._parts.append(part)
+            self._levels.append(self._level // 10)
+            if self._level >= self.min_level:
+                self._visible.append(len(self._offsets) - 1)
+            offset += len(raw)
+        return offset
+
+    def _open(self, path: Path) -> BinaryIO:
+        if path.suffix != ".gz":
+            return open(path, "rb")
+        if self._unpacked is None or self._unpacked[0] != path:
+            with gzip.open(path, "rb") as f:
+                self._unpacked = (path, f.read())
+        return io.BytesIO(self._unpacked[1])
+
+    def set_min_level(self, level: int) -> None:
+        self.min_level = level
+        self._visible = array.array(
+            "l", (i for i, lvl in enumerate(self._levels) if lvl * 10 >= level)
+        )
+
+    def window(self, start: int, count: int) -> list[tuple[int, str]]:
+        start = max(start, 0)
+        end = min(start + count, len(self._visible))
+        parts = self.rotated_parts() if end > start and self._parts[self._visible[start]] < self._part else {}
+        lines = []
+        files: dict[int, BinaryIO | None] = {}
+        try:
+            for i in range(start, end):
+                index = self._visible[i]
+                part = self._parts[index]
+                if part not in files:
+                    try:
+                        files[part] = self._open(self.path if part == self._part else parts[part])
+                    except (OSError, KeyError):
+                        files[part] = None  # inzwischen von der Aufbewahrung gelöscht
+                f = files[part]
+                if f is None:
+                    lines.append((self._levels[index] * 10, f"[Logteil {part} nicht mehr vorhanden]"))
+                    continue
+                f.seek(self._offsets[index])
+                text = f.readline().decode("utf-8", errors="replace").rstrip("\r\n")
+                lines.append((self._levels[index] * 10, text))
+        finally:
+            for f in files.values():
+                if f is not None:
+                    f.close()
+        return lines
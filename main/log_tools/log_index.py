@@ -0,0 +1,223 @@
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+INDEX_FILE = "index.sqlite3"
+# max. Records pro Transaktion bzw. Sekunden bis zum nächsten Commit
+FLUSH_RECORDS = 200
+FLUSH_INTERVAL = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    level INTEGER NOT NULL,
+    logger TEXT NOT NULL,
+    session TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS logs_ts ON logs (ts);
+CREATE INDEX IF NOT EXISTS logs_level_ts ON logs (level, ts);
+CREATE INDEX IF NOT EXISTS logs_logger_ts ON logs (logger, ts);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts USING fts5 (message, content='logs', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS logs_fts_insert AFTER INSERT ON logs BEGIN
+    INSERT INTO logs_fts (rowid, message) VALUES (new.id, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS logs_fts_delete AFTER DELETE ON logs BEGIN
+    INSERT INTO logs_fts (logs_fts, rowid, message) VALUES ('delete', old.id, old.message);
+END;
+"""
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    message = record.getMessage()
+    if record.exc_info:
+        message += "\n" + logging.Formatter().formatException(record.exc_info)
+    return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record (ts, level, logger, session, message)."""
+
+    def __init__(self, session: str):
+        super().__init__()
+        self.session = session
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(
+            {
+                "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+                "level": record.levelname,
+                "logger": record.name,
+                "session": self.session,
+                "message": _record_message(record),
+            },
+            ensure_ascii=False,
+        )
+
+
+class LogIndex:
+    """
+    SQLite index over the log records of all sessions. Full-text search uses
+    FTS5 if the SQLite build has it, otherwise a LIKE scan.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        try:
+            self.conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def add(self, rows: list[tuple[float, int, str, str, str]]) -> None:
+        """Inserts (ts, level, logger, session, message) rows in one transaction."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO logs (ts, level, logger, session, message) VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def prune(self, older_than: float) -> int:
+        with self.conn:
+            return self.conn.execute("DELETE FROM logs WHERE ts < ?", (older_than,)).rowcount
+
+    def search(
+        self,
+        text: str | None = None,
+        level: int | None = None,
+        logger: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 200,
+    ) -> list[dict]:
+        """Newest matching records first."""
+        where, params = [], []
+        if text:
+            if self.has_fts:
+                # jedes Wort als Phrase, damit FTS-Syntaxzeichen keine Fehler erzeugen
+                query = " ".join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+                where.append("id IN (SELECT rowid FROM logs_fts WHERE logs_fts MATCH ?)")
+                params.append(query)
+            else:
+                where.append("message LIKE ?")
+                params.append(f"%{text}%")
+        if level is not None:
+            where.append("level >= ?")
+            params.append(level)
+        if logger:
+            # Logger inkl. Kinder, z.B. "github" findet auch "github.Requester"
+            where.append("(logger = ? OR logger LIKE ?)")
+            params += [logger, f"{logger}.%"]
+        if since is not None:
+            where.append("ts >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            where.append("ts <= ?")
+            params.append(until.timestamp())
+
+        sql = "SELECT ts, level, logger, session, message FROM logs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY ts DESC LIMIT ?"
+        params.append(limit)
+        return [
+            {
+                "ts": datetime.fromtimestamp(ts),
+                "level": logging.getLevelName(levelno),
+                "logger": name,
+                "session": session,
+                "message": message,
+            }
+            for ts, levelno, name, session, message in self.conn.execute(sql, params)
+        ]
+
+
+class LogIndexHandler(logging.Handler):
+    """
+    Writes records into the LogIndex while the session runs. Records are
+    collected and committed in batches (FLUSH_RECORDS or every FLUSH_INTERVAL).
+    """
+
+    def __init__(self, index: LogIndex, session: str, level: int = logging.DEBUG):
+        super().__init__(level)
+        self.index = index
+        self.session = session
+        self._pending: list[tuple[float, int, str, str, str]] = []
+        self._pending_lock = threading.Lock()
+        self._stop_flush = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="log-index", daemon=True)
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            row = (record.created, record.levelno, record.name, self.session, _record_message(record))
+        except Exception:
+            self.handleError(record)
+            return
+        with self._pending_lock:
+            self._pending.append(row)
+            full = len(self._pending) >= FLUSH_RECORDS
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+        with self.lock:
+            try:
+                self.index.add(rows)
+            except sqlite3.Error as e:
+                # nicht über logging melden, das landet wieder hier
+                print(f"Log index write failed: {e}", file=sys.stderr)
+
+    def _flush_loop(self) -> None:
+        while not self._stop_flush.wait(FLUSH_INTERVAL):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop_flush.set()
+        self.flush()
+        with self.lock:
+            self.index.close()
+        super().close()
+
+
+def open_index(directory: str | Path = "logs") -> LogIndex:
+    return LogIndex(Path(directory) / INDEX_FILE)
+
+
+def parse_time(value: str | None) -> datetime | None:
+    """Accepts "YYYY-MM-DD" or "YYYY-MM-DD HH:MM[:SS]"; empty values mean no limit."""
+    if not value or not value.strip():
+        return None
+    return datetime.fromisoformat(value.strip())
+
+
+def format_result(row: dict) -> str:
+    return f"{row['ts']:%Y-%m-%d %H:%M:%S} @ {row['logger']} | {row['level']} | {row['message']}"
+
+
+def prune_index(directory: str | Path, keep_days: float) -> int:
+    index = open_index(directory)
+    try:
+        return index.prune(time.time() - keep_days * 86400)
+    finally:
+        index.close()
@@ -0,0 +1,184 @@
+import gzip
+import os
+import shutil
+import sys
+import time
+from logging.handlers import BaseRotatingHandler
+from pathlib import Path
+
+# jede Session schreibt zwei Streams mit gleichem Namen: Text-Log und JSON-Lines
+STREAM_SUFFIXES = (".log", ".jsonl")
+LOG_SUFFIXES = (".log", ".log.gz", ".jsonl", ".jsonl.gz")
+# jüngere Dateien können noch zu einer anderen laufenden Instanz gehören
+CLOSED_AFTER = 3600
+# enthält den Dateinamen des aktuellen Session-Logs, damit niemand logs/ durchsuchen muss
+LATEST_POINTER = "latest.txt"
+
+
+def session_files(path: str | Path) -> tuple[Path, ...]:
+    """Both streams of the session that writes `path`."""
+    path = Path(path)
+    return tuple(path.with_suffix(suffix) for suffix in STREAM_SUFFIXES)
+
+
+def _stream(path: Path) -> str:
+    return ".jsonl" if path.name.endswith((".jsonl", ".jsonl.gz")) else ".log"
+
+
+def write_latest_pointer(directory: str | Path, log_path: str | Path) -> None:
+    pointer = Path(directory) / LATEST_POINTER
+    tmp = pointer.with_name(pointer.name + ".tmp")
+    tmp.write_text(Path(log_path).name, encoding="utf-8")
+    os.replace(tmp, pointer)
+
+
+def latest_log(directory: str | Path = "logs") -> Path | None:
+    """The log file of the running (or last) session, without scanning the directory."""
+    try:
+        name = (Path(directory) / LATEST_POINTER).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    path = Path(directory) / name
+    return path if name and path.exists() else None
+
+
+def compress_log(path: str | Path) -> Path:
+    """Gzips a closed log file next to itself and removes the original."""
+    path = Path(path)
+    target = path.with_name(path.name + ".gz")
+    tmp = target.with_name(target.name + ".tmp")
+    with open(path, "rb") as src, gzip.open(tmp, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    # mtime behalten, danach richtet sich die Aufbewahrung
+    shutil.copystat(path, tmp)
+    os.replace(tmp, target)
+    try:
+        os.remove(path)
+    except OSError:
+        # unter Windows noch von einer anderen Instanz geöffnet: Original behalten, keine Doppelung
+        target.unlink(missing_ok=True)
+        raise
+    return target
+
+
+def compress_closed_logs(
+    directory: str | Path, current: str | Path, min_age: float = CLOSED_AFTER
+) -> list[Path]:
+    """Compresses the plain .log / .jsonl files of earlier sessions.
+
+    Files modified within `min_age` seconds or still locked by another
+    process are left alone; a later start picks them up.
+    """
+    current = Path(current).resolve()
+    now = time.time()
+    compressed = []
+    for path in Path(directory).iterdir():
+        if path.suffix not in STREAM_SUFFIXES or path.resolve().with_suffix("") == current.with_suffix(""):
+            continue
+        try:
+            if now - path.stat().st_mtime < min_age:
+                continue
+            compressed.append(compress_log(path))
+        except OSError:
+            continue  # z.B. noch von einer anderen Instanz geöffnet
+    return compressed
+
+
+def prune_logs(
+    directory: str | Path,
+    keep_files: int | None = None,
+    keep_mb: float | None = None,
+    protect: tuple[str | Path, ...] = (),
+) -> list[Path]:
+    """Deletes the oldest logs until at most `keep_files` per stream (.log / .jsonl)
+    and `keep_mb` in total remain."""
+    protected = {Path(p).resolve() for p in protect}
+    logs = []
+    for path in Path(directory).iterdir():
+        if path.name.endswith(LOG_SUFFIXES):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            logs.append((stat.st_mtime, stat.st_size, path))
+    logs.sort(reverse=True)  # neueste zuerst
+
+    removed = []
+    counts = dict.fromkeys(STREAM_SUFFIXES, 0)
+    total = 0
+    max_bytes = keep_mb * 1024 * 1024 if keep_mb else None
+    for _, size, path in logs:
+        stream = _stream(path)
+        counts[stream] += 1
+        total += size
+        over = (keep_files and counts[stream] > keep_files) or (max_bytes and total > max_bytes)
+        if over and path.resolve() not in protected:
+            try:
+                os.remove(path)
+                removed.append(path)
+            except OSError:
+                continue
+            counts[stream] -= 1
+            total -= size
+    return removed
+
+
+class CompressingRotatingFileHandler(BaseRotatingHandler):
+    """
+    File handler that rolls the session log over by size or age.
+
+    The full file is renamed to `<name>.<part>.log` and gzipped; the handler then
+    continues in a fresh file under the original name. After every rollover the
+    retention budget is applied to the directory; both streams of the running
+    session are protected. With `latest_pointer` the handler also rewrites the
+    latest-log pointer to its fresh file.
+    """
+
+    def __init__(
+        self,
+        filename: str | Path,
+        max_bytes: int = 0,
+        max_age: float = 0,
+        keep_files: int | None = None,
+        keep_mb: float | None = None,
+        encoding: str = "utf-8",
+        latest_pointer: bool = False,
+    ):
+        super().__init__(filename, "a", encoding=encoding)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.keep_files = keep_files
+        self.keep_mb = keep_mb
+        self.latest_pointer = latest_pointer
+        self.part = 0
+        self.opened_at = time.time()
+        self.directory = Path(self.baseFilename).parent
+
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            return False
+        if self.max_bytes and self.stream.tell() >= self.max_bytes:
+            return True
+        return bool(self.max_age) and time.time() - self.opened_at >= self.max_age
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.part += 1
+        base = Path(self.baseFilename)
+        rotated = base.with_name(f"{base.stem}.{self.part}{base.suffix}")
+        try:
+            os.replace(base, rotated)
+            compress_log(rotated)
+        except OSError as e:
+            # Logging darf hier nicht selbst loggen (Rekursion), also nur stderr
+            print(f"Log rotation failed: {e}", file=sys.stderr)
+        self.stream = self._open()
+        self.opened_at = time.time()
+        if self.latest_pointer:
+            try:
+                write_latest_pointer(self.directory, base)
+            except OSError as e:
+                print(f"Could not update latest log pointer: {e}", file=sys.stderr)
+        prune_logs(self.directory, self.keep_files, self.keep_mb, protect=session_files(base))
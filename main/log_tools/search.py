@@ -0,0 +1,49 @@
+"""
+Searches the log index of all sessions.
+
+    python -m main.log_tools.search "rate limit" --level WARNING --since 2025-01-01
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from main.log_tools.log_index import format_result, open_index, parse_time
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Search the UnrealGitUI log index.")
+    parser.add_argument("text", nargs="?", help="full-text query (all words must match)")
+    parser.add_argument("--level", help="minimum level, e.g. WARNING")
+    parser.add_argument("--logger", help="logger name (includes child loggers)")
+    parser.add_argument("--since", help='start time, "YYYY-MM-DD[ HH:MM[:SS]]"')
+    parser.add_argument("--until", help='end time, "YYYY-MM-DD[ HH:MM[:SS]]"')
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--logs-dir", default="logs")
+    args = parser.parse_args(argv)
+
+    level = logging.getLevelName(args.level.upper()) if args.level else None
+    if level is not None and not isinstance(level, int):
+        parser.error(f"unknown level: {args.level}")
+    try:
+        since, until = parse_time(args.since), parse_time(args.until)
+    except ValueError as e:
+        parser.error(str(e))
+
+    index = open_index(args.logs_dir)
+    try:
+        start = time.perf_counter()
+        rows = index.search(args.text, level, args.logger, since, until, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        index.close()
+
+    for row in reversed(rows):  # älteste zuerst, wie in der Log-Datei
+        print(format_result(row))
+    print(f"{len(rows)} records in {elapsed:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
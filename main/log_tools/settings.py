@@ -0,0 +1,22 @@
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True)
+class LogSettings:
+    """The "logs" section of config.json.
+
+    Lives here rather than in main.config: the logging setup in main._template
+    needs it before the logger (which main.config imports) exists.
+    """
+
+    max_lines: int = 10000
+    max_file_mb: float = 20
+    max_age_hours: float = 24
+    keep_files: int = 20
+    keep_mb: float = 200
+    index_days: float = 30
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "LogSettings":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in values.items() if k in known})
@@ -0,0 +1,35 @@
+import logging
+from collections import deque
+
+# Records, die gepuffert werden, bis die UI sie abholt (z.B. vor dem Start des Fensters)
+DEFAULT_BUFFER_SIZE = 5000
+
+
+class UILogHandler(logging.Handler):
+    """
+    Buffers formatted records in memory for the dashboard log panel.
+
+    `emit` only formats the record and appends it to a bounded deque, so logging
+    from worker threads never touches Tk. The UI thread collects the records in
+    batches with `drain`. If nobody drains, the oldest records are dropped.
+    """
+
+    def __init__(self, level: int = logging.DEBUG, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        super().__init__(level)
+        self.records: deque[tuple[int, str]] = deque(maxlen=buffer_size)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.records.append((record.levelno, self.format(record)))
+        except Exception:
+            self.handleError(record)
+
+    def drain(self, max_records: int | None = None) -> list[tuple[int, str]]:
+        """Pops up to `max_records` (levelno, text) tuples, oldest first."""
+        batch = []
+        while self.records and (max_records is None or len(batch) < max_records):
+            try:
+                batch.append(self.records.popleft())
+            except IndexError:
+                break
+        return batch
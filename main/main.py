@@ -7,64 +7,55 @@ from tkinter import simpledialog
 # ==== IMPORTS ==== #
 import customtkinter as ctk
 
-from main.config import check_config, load_config, save_config
-from main.errors import ConfigError
+from main.config import CONFIG_SERVICE, get_config
 
-# ==== IMPORT UI TABS ==== #
-from main.ui.tabs.dashboard import DashboardUI
-from main.ui.tabs.terminal import TerminalUI
-from main.ui.tabs.unreal_tools import UnrealToolsUI
+# ==== UI TABS (werden erst beim ersten Öffnen importiert und gebaut) ==== #
+from main.ui.lazy_tabs import LazyTabs
 
 # ==== CONFIGURATION ==== #
-if not check_config(["app_title", "git"]):
-    raise ConfigError("Missing required configuration keys.")
-
-CONFIG = load_config("main/config.json")
+# einmal geladen (ConfigError bei fehlenden Pflicht-Keys), alle Tabs teilen dieselbe Instanz
+CONFIG = get_config()
 
 
 # ==== Global Functions ====#
 def toggle_mode(event=None):
-    if CONFIG.get("mode", "dark") == "dark":
-        ctk.set_appearance_mode("light")
-        CONFIG["mode"] = "light"
-        save_config("main/config.json", CONFIG)
-    elif CONFIG.get("mode", "dark") == "light":
-        ctk.set_appearance_mode("dark")
-        CONFIG["mode"] = "dark"
-        save_config("main/config.json", CONFIG)
-    else:
-        ctk.set_appearance_mode("light")
-        CONFIG["mode"] = "light"
-        save_config("main/config.json", CONFIG)
+    CONFIG_SERVICE.set("mode", "light" if CONFIG.mode == "dark" else "dark")
+    CONFIG_SERVICE.save()
+
+
+CONFIG_SERVICE.subscribe(lambda key, mode: ctk.set_appearance_mode(mode), "mode")
 
 
 # ==== MAIN WINDOW ==== #
 rootwin = ctk.CTk()
-rootwin.title(CONFIG.get("app_title", "ERROR LOADING TITLE"))
+rootwin.title(CONFIG.app_title)
 rootwin.geometry("800x930")
 rootwin.resizable(False, False)
-ctk.set_appearance_mode(CONFIG.get("mode", "dark"))
+ctk.set_appearance_mode(CONFIG.mode)
 ctk.set_default_color_theme("orange.json") 
 
 tabs = ctk.CTkTabview(rootwin)
 tabs.pack(expand=True, fill="both", padx=20, pady=20)
 
-dashboard_tab: ctk.CTkFrame = tabs.add("Dashboard")
-workflow_tab: ctk.CTkFrame = tabs.add("Workflow")
-git_tools_tab: ctk.CTkFrame = tabs.add("Git Tools")
-unreal_tools_tab: ctk.CTkFrame = tabs.add("Unreal Tools")
-terminal_tab: ctk.CTkFrame = tabs.add("Terminal")
-settings_tab: ctk.CTkFrame = tabs.add("Settings")
+lazy_tabs = LazyTabs(tabs)
+dashboard_tab: ctk.CTkFrame = lazy_tabs.add("Dashboard", "main.ui.tabs.dashboard", "DashboardUI")
+workflow_tab: ctk.CTkFrame = lazy_tabs.add("Workflow")
+git_tools_tab: ctk.CTkFrame = lazy_tabs.add("Git Tools")
+unreal_tools_tab: ctk.CTkFrame = lazy_tabs.add("Unreal Tools", "main.ui.tabs.unreal_tools", "UnrealToolsUI")
+terminal_tab: ctk.CTkFrame = lazy_tabs.add("Terminal", "main.ui.tabs.terminal", "TerminalUI")
+settings_tab: ctk.CTkFrame = lazy_tabs.add("Settings")
+
 
-# ==== ADD TABS CONTENT ==== #
-dashboard_ui: DashboardUI = DashboardUI(dashboard_tab)
-dashboard_ui.pack(expand=True, fill="both")
+def _after_first_frame() -> None:
+    # erst das Fenster zeigen, dann den sichtbaren Tab bauen und die anderen vorwärmen
+    lazy_tabs.mark_first_window()
+    lazy_tabs.build(tabs.get())
+    lazy_tabs.report(CONFIG.startup.budget_ms)
+    lazy_tabs.prewarm(CONFIG.startup.prewarm, CONFIG.startup.prewarm_delay_ms)
 
-terminal_ui: TerminalUI = TerminalUI(terminal_tab)
-terminal_ui.pack(expand=True, fill="both")
 
-unreal_tools_ui: UnrealToolsUI = UnrealToolsUI(unreal_tools_tab)
-unreal_tools_ui.pack(expand=True, fill="both")
+# after_idle: das Fenster wird im Leerlauf gezeichnet, danach erst bauen
+rootwin.after_idle(lambda: rootwin.after(1, _after_first_frame))
 
 # ==== Keybinds ====#
 rootwin.bind_all("<Control-Shift-Alt-m>", lambda event: toggle_mode())
@@ -0,0 +1,387 @@
+import functools
+import re
+from typing import Iterator, NamedTuple, Protocol
+
+# Zustände des Parsers (nach dem VT500-Zustandsdiagramm, vereinfacht)
+GROUND = 0
+ESCAPE = 1
+ESCAPE_INTERMEDIATE = 2
+CSI = 3
+OSC = 4
+STRING = 5  # DCS, SOS, PM, APC: Inhalt wird verworfen
+
+# längere CSI-Sequenzen sind kaputt und werden verworfen
+MAX_CSI_LENGTH = 256
+
+DEFAULT_FG = "#f8f8f2"
+DEFAULT_BG = "#1e1e1e"
+
+# SGR 30-37 / 90-97 (bzw. 40-47 / 100-107), gleichzeitig Index 0-15 der 256er-Palette
+ANSI_COLORS = [
+    ("black", "#000000"),
+    ("red", "#ff5555"),
+    ("green", "#50fa7b"),
+    ("yellow", "#f1fa8c"),
+    ("blue", "#6272a4"),
+    ("magenta", "#ff79c6"),
+    ("cyan", "#8be9fd"),
+    ("white", "#f8f8f2"),
+    ("bright_black", "#44475a"),
+    ("bright_red", "#ff6e6e"),
+    ("bright_green", "#69ff94"),
+    ("bright_yellow", "#ffffa5"),
+    ("bright_blue", "#caa9ff"),
+    ("bright_magenta", "#ff92df"),
+    ("bright_cyan", "#9aedfe"),
+    ("bright_white", "#ffffff"),
+]
+_COLOR_BY_NAME = dict(ANSI_COLORS)
+
+# Attribut-Tags, die sich ohne eigene Schrift darstellen lassen
+ATTR_STYLES = {
+    "attr_underline": {"underline": True},
+    "attr_strike": {"overstrike": True},
+}
+
+# Parameter + Intermediates einer CSI-Sequenz, danach folgt das Final-Zeichen
+_CSI_BODY = re.compile(r"[0-?]*[ -/]*")
+# Vollständige Sequenzen für den schnellen Weg per re.split; Gruppen: CSI-Parameter,
+# CSI-Final, Final einer kurzen ESC-Sequenz. OSC und DCS/APC/... haben keine Gruppe.
+_TOKENS = re.compile(
+    r"\x1b(?:\[([0-?]*[ -/]*)([@-~])"
+    r"|\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    r"|[PX^_][^\x1b]*\x1b\\"
+    r"|([ -/]*[0-OQ-WYZ\\`a-~]))"
+)
+# nur Ziffern, ";" und ":" sind SGR; sonst private Modi (CSI > 4 m) oder Intermediates
+_SGR_PARAMS = re.compile(r"[\d;:]*")
+# Ende von OSC (BEL oder ESC \) bzw. DCS/APC/... (ESC \)
+_STRING_END = re.compile(r"[\x07\x1b]")
+
+
+def color_256(index: int) -> str:
+    """Palette index -> colour name (0-15) or "#rrggbb" (16-255)."""
+    if index < 16:
+        return ANSI_COLORS[index][0]
+    if index < 232:
+        index -= 16
+        levels = (0, 95, 135, 175, 215, 255)
+        r, g, b = levels[index // 36], levels[index // 6 % 6], levels[index % 6]
+    else:
+        r = g = b = 8 + 10 * (index - 232)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def tag_style(tag: str) -> dict | None:
+    """tag_config options for a tag produced by AnsiParser (None for font based tags)."""
+    if tag.startswith(("fg_", "bg_")):
+        value = tag[3:]
+        color = value if value.startswith("#") else _COLOR_BY_NAME.get(value)
+        if color is None:
+            return None
+        return {"foreground" if tag[0] == "f" else "background": color}
+    return ATTR_STYLES.get(tag)
+
+
+def _int(value: str, default: int = 0) -> int:
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+def _extended_color(args: list[str], colon: bool = False) -> tuple[str | None, int]:
+    """
+    Colour after 38/48: "5;n" (256 colours) or "2;r;g;b" (truecolor). Returns
+    the colour and how many parameters were used. The colon form may carry a
+    colour space id before r:g:b ("38:2::r:g:b").
+    """
+    if not args:
+        return None, 0
+    kind = args[0]
+    if kind == "5" and len(args) >= 2:
+        index = _int(args[1], -1)
+        return (color_256(index) if 0 <= index <= 255 else None), 2
+    if kind == "2":
+        rgb = args[2:5] if colon and len(args) >= 5 else args[1:4]
+        if len(rgb) == 3:
+            r, g, b = (min(max(_int(v), 0), 255) for v in rgb)
+            return f"#{r:02x}{g:02x}{b:02x}", 4
+        return None, len(args)
+    return None, 1
+
+
+class SgrState(NamedTuple):
+    fg: str | None = None
+    bg: str | None = None
+    bold: bool = False
+    italic: bool = False
+    underline: bool = False
+    strike: bool = False
+    reverse: bool = False
+    conceal: bool = False
+
+    def tags(self) -> tuple[str, ...]:
+        fg, bg = self.fg, self.bg
+        if self.reverse:
+            fg, bg = bg or DEFAULT_BG, fg or DEFAULT_FG
+        if self.conceal:
+            fg = bg or DEFAULT_BG
+        tags = []
+        if fg:
+            tags.append("fg_" + fg)
+        if bg:
+            tags.append("bg_" + bg)
+        if self.bold:
+            tags.append("attr_bold")
+        if self.italic:
+            tags.append("attr_italic")
+        if self.underline:
+            tags.append("attr_underline")
+        if self.strike:
+            tags.append("attr_strike")
+        return tuple(tags)
+
+
+RESET = SgrState()
+
+# einfache SGR-Codes -> geänderte Felder
+_SGR_FLAGS = {
+    1: {"bold": True},
+    3: {"italic": True},
+    4: {"underline": True},
+    7: {"reverse": True},
+    8: {"conceal": True},
+    9: {"strike": True},
+    21: {"underline": True},
+    22: {"bold": False},
+    23: {"italic": False},
+    24: {"underline": False},
+    27: {"reverse": False},
+    28: {"conceal": False},
+    29: {"strike": False},
+    39: {"fg": None},
+    49: {"bg": None},
+}
+for _i, (_name, _) in enumerate(ANSI_COLORS[:8]):
+    _SGR_FLAGS[30 + _i] = {"fg": _name}
+    _SGR_FLAGS[40 + _i] = {"bg": _name}
+    _SGR_FLAGS[90 + _i] = {"fg": ANSI_COLORS[_i + 8][0]}
+    _SGR_FLAGS[100 + _i] = {"bg": ANSI_COLORS[_i + 8][0]}
+
+
+@functools.lru_cache(maxsize=4096)
+def apply_sgr(state: SgrState, params: str) -> tuple[SgrState, tuple[str, ...]]:
+    """
+    New state and tags after "CSI <params> m". Pure and cached: build output
+    repeats the same few sequences, so most calls are a cache hit.
+    """
+    if not _SGR_PARAMS.fullmatch(params):
+        return state, state.tags()
+    changes: dict = {}
+    parts = params.split(";") if params else ["0"]
+    i = 0
+    while i < len(parts):
+        part = parts[i]
+        i += 1
+        if ":" in part:
+            sub = part.split(":")
+            code = _int(sub[0])
+            if code in (38, 48):
+                color, _ = _extended_color(sub[1:], colon=True)
+                if color is not None:
+                    changes["fg" if code == 38 else "bg"] = color
+            elif code == 4:
+                changes["underline"] = _int(sub[1], 1) != 0 if len(sub) > 1 else True
+            continue
+        code = _int(part)
+        if code == 0:
+            state, changes = RESET, {}
+        elif code in (38, 48):
+            color, used = _extended_color(parts[i:])
+            i += used
+            if color is not None:
+                changes["fg" if code == 38 else "bg"] = color
+        elif code in _SGR_FLAGS:
+            changes.update(_SGR_FLAGS[code])
+        # 2 (dim), 5/6 (blink) usw. werden ignoriert
+    if changes:
+        state = state._replace(**changes)
+    return state, state.tags()
+
+
+class ControlHandler(Protocol):
+    """Receives the control sequences AnsiParser does not handle itself (see `Screen`)."""
+
+    def csi(self, params: str, final: str) -> None: ...
+
+    def esc(self, final: str) -> None: ...
+
+
+class AnsiParser:
+    """
+    Incremental ANSI parser that yields (text, tags).
+
+    Complete escape sequences of a chunk are split off in one regex pass and
+    text with the same tags is yielded as one piece; only SGR sequences cost
+    Python work. A sequence cut off at the end of a chunk (or a malformed one)
+    goes through a state machine that carries it into the next `feed` call, so
+    PTY read boundaries never leak as text. SGR is handled
+    completely (bold, italic, underline, strike, reverse, conceal, 16/256/
+    truecolor fore- and background); OSC (window titles) and DCS/APC strings
+    are dropped. Other CSI and ESC sequences are dropped too, unless a
+    `handler` is given: then they are passed to it in order with the text,
+    i.e. after the text before them has been yielded.
+
+    Tags: "fg_<name>" / "bg_<name>" for the 16 palette colours, "fg_#rrggbb" /
+    "bg_#rrggbb" for the rest, and "attr_bold", "attr_italic", "attr_underline",
+    "attr_strike". `tag_style` turns a tag into tag_config options.
+    """
+
+    def __init__(self, handler: ControlHandler | None = None):
+        self.handler = handler
+        self.state = GROUND
+        self._csi = ""
+        self._string_esc = False
+        self.reset_state()
+
+    def reset_state(self):
+        self.sgr = RESET
+        self.tags: tuple[str, ...] = ()
+
+    def feed(self, text: str) -> Iterator[tuple[str, tuple[str, ...]]]:
+        if self.state != GROUND:
+            # angefangene Sequenz aus dem letzten Chunk zu Ende lesen
+            pos = yield from self._feed_states(text, 0, until_ground=True)
+            text = text[pos:]
+            if not text:
+                return
+
+        parts = _TOKENS.split(text)
+        texts, params, finals, shorts = parts[0::4], parts[1::4], parts[2::4], parts[3::4]
+        tail = texts.pop()
+        if "\x1b" in "".join(texts):
+            # kaputte Sequenz mitten im Chunk (selten): ganzer Chunk zeichenweise
+            yield from self._feed_states(text, 0)
+            return
+
+        handler = self.handler
+        tags = self.tags
+        run_start = 0  # Texte ab hier haben die aktuellen Tags und werden am Stück ausgegeben
+        for i, final in enumerate(finals):
+            if final == "m":
+                self.sgr, new_tags = apply_sgr(self.sgr, params[i])
+                if new_tags == tags:
+                    continue
+            elif final is None and shorts[i] == "c":
+                self.sgr, new_tags = RESET, ()  # RIS
+            elif handler is None or (final is None and len(shorts[i] or "") != 1):
+                continue  # OSC/DCS sowie ESC ( B usw. (Zeichensätze) werden ignoriert
+            else:
+                new_tags = tags
+            run = "".join(texts[run_start : i + 1])
+            if run:
+                yield run, tags
+            run_start = i + 1
+            tags = self.tags = new_tags
+            if handler is not None and final != "m":
+                if final is not None:
+                    handler.csi(params[i], final)
+                else:
+                    handler.esc(shorts[i])
+
+        esc = tail.find("\x1b")
+        run = "".join(texts[run_start:]) + (tail if esc < 0 else tail[:esc])
+        if run:
+            yield run, tags
+        if esc >= 0:
+            # unvollständige Sequenz am Chunk-Ende
+            yield from self._feed_states(tail, esc)
+
+    def _feed_states(self, text: str, pos: int, until_ground: bool = False):
+        """
+        Character level state machine from `pos`; with `until_ground` it stops
+        as soon as a sequence is complete. Returns the position it stopped at.
+        """
+        end = len(text)
+        while pos < end:
+            state = self.state
+            if state == GROUND:
+                if until_ground:
+                    return pos
+                esc = text.find("\x1b", pos)
+                if esc < 0:
+                    yield text[pos:], self.tags
+                    return end
+                if esc > pos:
+                    yield text[pos:esc], self.tags
+                pos = esc + 1
+                self.state = ESCAPE
+
+            elif state == ESCAPE:
+                char = text[pos]
+                pos += 1
+                if char == "[":
+                    self.state = CSI
+                    self._csi = ""
+                elif char == "]":
+                    self.state = OSC
+                elif char in "PX^_":
+                    self.state = STRING
+                elif " " <= char <= "/":
+                    self.state = ESCAPE_INTERMEDIATE  # z.B. ESC ( B
+                elif char != "\x1b":
+                    if char == "c":
+                        self.reset_state()  # RIS
+                    self.state = GROUND
+                    if self.handler is not None:
+                        self.handler.esc(char)
+
+            elif state == ESCAPE_INTERMEDIATE:
+                char = text[pos]
+                pos += 1
+                if not " " <= char <= "/":
+                    self.state = GROUND
+
+            elif state == CSI:
+                body_end = _CSI_BODY.match(text, pos).end()
+                if body_end == end:
+                    # Sequenz geht im nächsten Chunk weiter
+                    self._csi += text[pos:]
+                    if len(self._csi) > MAX_CSI_LENGTH:
+                        self._csi = ""
+                        self.state = GROUND
+                    return end
+                body = self._csi + text[pos:body_end]
+                self._csi = ""
+                self.state = GROUND
+                final = text[body_end]
+                if "@" <= final <= "~":
+                    pos = body_end + 1
+                    if final == "m":
+                        self.sgr, self.tags = apply_sgr(self.sgr, body)
+                    elif self.handler is not None:
+                        self.handler.csi(body, final)
+                else:
+                    # ungültiges Zeichen bricht die Sequenz ab und wird normal verarbeitet
+                    pos = body_end
+
+            else:  # OSC / STRING
+                if self._string_esc:
+                    self._string_esc = False
+                    if text[pos] == "\\":
+                        pos += 1
+                        self.state = GROUND
+                    else:
+                        # ESC ohne "\" beendet den String und beginnt eine neue Sequenz
+                        self.state = ESCAPE
+                    continue
+                match = _STRING_END.search(text, pos)
+                if match is None:
+                    return end
+                pos = match.end()
+                if match.group() == "\x07" and state == OSC:
+                    self.state = GROUND
+                elif match.group() == "\x1b":
+                    self._string_esc = True
+        return end
@@ -0,0 +1,211 @@
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+from abc import ABC, abstractmethod
+
+from main._template import LOGGER
+
+if os.name == "posix":
+    import fcntl
+    import pty
+    import select
+    import struct
+    import termios
+
+DEFAULT_ROWS = 24
+DEFAULT_COLS = 80
+# Zeit für den Shell-Prozess, sich nach SIGHUP/close selbst zu beenden
+CLOSE_TIMEOUT = 1.0
+# Macht den PTY (stdin) zum Controlling Terminal und startet dann das Kommando. Läuft in einem
+# eigenen Interpreter statt als preexec_fn: Python-Code im geforkten Kind eines Prozesses mit
+# Threads kann an Locks hängen, die im Moment des fork() ein anderer Thread hielt.
+_CTTY_WRAPPER = (
+    "import fcntl, os, sys, termios; "
+    "fcntl.ioctl(0, termios.TIOCSCTTY, 0); "
+    "os.execv(sys.argv[1], sys.argv[2:])"
+)
+
+
+class PtyBackend(ABC):
+    """
+    Pseudo terminal running a shell. `read` is only called when `fileno()` is
+    readable (see PtyReader); it returns "" / b"" if there is nothing to read
+    after all and raises EOFError once the process has ended.
+    """
+
+    name = "base"
+    # was die Enter-Taste an die Shell schickt
+    newline = "\r"
+
+    @abstractmethod
+    def fileno(self) -> int: ...
+
+    @abstractmethod
+    def read(self, size: int) -> str | bytes: ...
+
+    @abstractmethod
+    def write(self, data: str) -> None: ...
+
+    @abstractmethod
+    def resize(self, rows: int, cols: int) -> None: ...
+
+    @abstractmethod
+    def isalive(self) -> bool: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class WinptyBackend(PtyBackend):
+    """ConPTY/winpty via pywinpty; its PtyProcess is backed by a socket, so it can be selected."""
+
+    name = "winpty"
+    newline = "\r\n"
+
+    def __init__(self, command: str, rows: int = DEFAULT_ROWS, cols: int = DEFAULT_COLS):
+        import winpty
+
+        self.proc = winpty.PtyProcess.spawn(command, dimensions=(rows, cols))
+
+    def fileno(self) -> int:
+        return self.proc.fileno()
+
+    def read(self, size: int) -> str:
+        return self.proc.read(size)
+
+    def write(self, data: str) -> None:
+        self.proc.write(data)
+
+    def resize(self, rows: int, cols: int) -> None:
+        self.proc.setwinsize(rows, cols)
+
+    def isalive(self) -> bool:
+        return self.proc.isalive()
+
+    def close(self) -> None:
+        self.proc.close(force=True)
+
+
+class PosixPtyBackend(PtyBackend):
+    """os.openpty + subprocess; the shell gets the slave side as controlling terminal.
+
+    The controlling terminal is set by a small wrapper interpreter that execs
+    the command (same pid), so no Python code runs between fork and exec.
+    """
+
+    name = "posix"
+
+    def __init__(
+        self,
+        command: str | list[str],
+        rows: int = DEFAULT_ROWS,
+        cols: int = DEFAULT_COLS,
+        env: dict[str, str] | None = None,
+    ):
+        args = shlex.split(command) if isinstance(command, str) else list(command)
+        env = dict(os.environ if env is None else env)
+        env.setdefault("TERM", "xterm-256color")
+        executable = shutil.which(args[0], path=env.get("PATH")) if args else None
+        if executable is None:
+            # wie Popen: fehlendes Kommando sofort melden, nicht erst als Ausgabe im Terminal
+            raise FileNotFoundError(f"Command not found: {args[0] if args else command!r}")
+        self.master, slave = pty.openpty()
+        self.resize(rows, cols)
+        try:
+            self.proc = subprocess.Popen(
+                # -I -S: ohne site und PYTHON*-Variablen, startet in wenigen Millisekunden
+                [sys.executable, "-I", "-S", "-c", _CTTY_WRAPPER, executable, *args],
+                stdin=slave,
+                stdout=slave,
+                stderr=slave,
+                env=env,
+                start_new_session=True,  # eigene Session, Signale treffen nicht die App
+            )
+        except BaseException:
+            os.close(self.master)
+            raise
+        finally:
+            os.close(slave)
+        os.set_blocking(self.master, False)
+
+    def fileno(self) -> int:
+        return self.master
+
+    def read(self, size: int) -> bytes:
+        try:
+            data = os.read(self.master, size)
+        except BlockingIOError:
+            return b""
+        except OSError:
+            # Linux meldet EIO, sobald die Slave-Seite geschlossen ist
+            raise EOFError("pty closed")
+        if not data:
+            raise EOFError("pty closed")
+        return data
+
+    def write(self, data: str) -> None:
+        view = memoryview(data.encode("utf-8"))
+        while view:
+            try:
+                view = view[os.write(self.master, view) :]
+            except BlockingIOError:
+                # Eingabepuffer des PTY voll: warten bis die Shell liest
+                select.select([], [self.master], [], CLOSE_TIMEOUT)
+
+    def resize(self, rows: int, cols: int) -> None:
+        fcntl.ioctl(self.master, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+
+    def isalive(self) -> bool:
+        return self.proc.poll() is None
+
+    def close(self) -> None:
+        if self.isalive():
+            # wie beim Schließen eines Terminalfensters: SIGHUP an die Prozessgruppe
+            for sig in (signal.SIGHUP, signal.SIGKILL):
+                try:
+                    os.killpg(self.proc.pid, sig)
+                    self.proc.wait(CLOSE_TIMEOUT)
+                    break
+                except subprocess.TimeoutExpired:
+                    continue
+                except ProcessLookupError:
+                    break
+        self.proc.poll()
+        try:
+            os.close(self.master)
+        except OSError:
+            pass
+
+
+BACKENDS: dict[str, type[PtyBackend]] = {
+    WinptyBackend.name: WinptyBackend,
+    PosixPtyBackend.name: PosixPtyBackend,
+}
+
+
+def default_backend() -> str:
+    return "winpty" if sys.platform == "win32" else "posix"
+
+
+def default_shell() -> str:
+    if sys.platform == "win32":
+        return "cmd.exe /Q"
+    return os.environ.get("SHELL") or "/bin/sh"
+
+
+def create_pty(
+    command: str | None = None,
+    rows: int = DEFAULT_ROWS,
+    cols: int = DEFAULT_COLS,
+    kind: str | None = None,
+) -> PtyBackend:
+    """Starts `command` (default: the platform shell) on the backend `kind` (default: by platform)."""
+    kind = kind or default_backend()
+    if kind not in BACKENDS:
+        raise ValueError(f"Unknown PTY backend '{kind}', expected one of {sorted(BACKENDS)}")
+    command = command or default_shell()
+    LOGGER.info(f'Starting "{command}" on PTY backend "{kind}" ({cols}x{rows}).')
+    return BACKENDS[kind](command, rows, cols)
@@ -0,0 +1,88 @@
+import codecs
+import queue
+import selectors
+import socket
+import threading
+from typing import Callable, Protocol
+
+READ_SIZE = 64 * 1024
+
+
+class ReadablePty(Protocol):
+    """Subset of PtyBackend the reader needs; read raises EOFError when the process ended."""
+
+    def fileno(self) -> int: ...
+
+    def read(self, size: int) -> str | bytes: ...
+
+
+class PtyReader:
+    """
+    Reads a PTY in a worker thread that blocks on readiness of its file
+    descriptor (selectors), so an idle terminal costs no CPU.
+
+    Chunks land in `chunks`. `on_data` is called from the worker thread once
+    when data arrives while the UI is waiting; the UI drains the queue and
+    calls `wait_for_data` to be notified again.
+    """
+
+    def __init__(self, pty: ReadablePty, on_data: Callable[[], None], encoding: str = "utf-8"):
+        self.pty = pty
+        self.on_data = on_data
+        self.chunks: queue.Queue[str] = queue.Queue()
+        self.eof = threading.Event()
+        self._waiting = threading.Event()
+        self._waiting.set()
+        # UTF-8-Sequenzen können über zwei reads verteilt sein
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        # socketpair statt pipe: select() unter Windows kann nur Sockets
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._thread = threading.Thread(target=self._run, name="pty-reader", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._wake_r.close()
+            self._wake_w.close()
+
+    def wait_for_data(self) -> bool:
+        """
+        Re-arms the notification after the UI drained the queue. Returns True
+        if data arrived in the meantime, i.e. the UI should keep polling.
+        """
+        self._waiting.set()
+        return not self.chunks.empty()
+
+    def _push(self, text: str) -> None:
+        if text:
+            self.chunks.put(text)
+        # erst einreihen, dann benachrichtigen: wait_for_data sieht sonst ggf. eine leere Queue
+        if self._waiting.is_set():
+            self._waiting.clear()
+            self.on_data()
+
+    def _run(self) -> None:
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.pty, selectors.EVENT_READ)
+            selector.register(self._wake_r, selectors.EVENT_READ)
+            while True:
+                for key, _ in selector.select():
+                    if key.fileobj is self._wake_r:
+                        return
+                    try:
+                        data = self.pty.read(READ_SIZE)
+                    except (EOFError, OSError):
+                        # Prozess beendet
+                        self.eof.set()
+                        self._push(self._decoder.decode(b"", final=True))
+                        return
+                    if data:
+                        self._push(self._decoder.decode(data) if isinstance(data, bytes) else data)
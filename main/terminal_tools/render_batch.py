@@ -0,0 +1,43 @@
+import queue
+import time
+from typing import Callable
+
+# Zeitbudget pro Frame fürs Parsen; der Rest bleibt in der Queue für den nächsten Frame
+FRAME_BUDGET = 0.008
+# max. Zeichen pro Frame, damit auch ein einzelnes insert die UI nicht blockiert
+FRAME_MAX_CHARS = 64 * 1024
+# Abstand der Polls bei Rückstau; nach IDLE_MS ohne Ausgabe wird neue Ausgabe sofort gezeichnet
+FRAME_MS = 16
+IDLE_MS = 50
+
+
+def drain_chunks(
+    chunks: queue.Queue,
+    feed: Callable[[str], None],
+    budget: float = FRAME_BUDGET,
+    max_chars: int = FRAME_MAX_CHARS,
+) -> tuple[int, bool]:
+    """
+    Passes queued chunks to `feed` until the queue is empty, the time budget
+    is used up or `max_chars` is reached. Returns the number of characters
+    fed and whether chunks are still pending.
+    """
+    chars = 0
+    deadline = time.perf_counter() + budget
+    while chars < max_chars and time.perf_counter() < deadline:
+        try:
+            chunk = chunks.get_nowait()
+        except queue.Empty:
+            return chars, False
+        feed(chunk)
+        chars += len(chunk)
+    return chars, not chunks.empty()
+
+
+def frame_delay(idle: float) -> int:
+    """
+    Delay in ms before drawing newly arrived output, given the seconds since
+    the last frame: immediately after a pause (echo of a keypress), one frame
+    later while output is streaming so it is drawn in batches.
+    """
+    return 0 if idle * 1000 >= IDLE_MS else FRAME_MS
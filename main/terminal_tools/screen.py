@@ -0,0 +1,436 @@
+import re
+from collections import deque
+from itertools import groupby
+
+from main.terminal_tools.ansi import AnsiParser
+from main.terminal_tools.scrollback import Run, ScrollbackSpill
+
+TAB_WIDTH = 8
+# Zeilen, die nach oben aus dem Bildschirm geschoben wurden und im Widget bleiben
+SCROLLBACK_LINES = 10000
+
+# Steuerzeichen trennen (CRLF am Stück); ausgewertet werden CR, LF/VT/FF, BS und TAB, der Rest wird ignoriert
+_CONTROLS = re.compile(r"(\r\n|[\x00-\x1f\x7f])")
+_ALT_SCREEN_MODES = {"47", "1047", "1049"}
+
+
+def _count(args: list[int], index: int = 0) -> int:
+    """Numeric CSI argument where missing and 0 both mean 1."""
+    return max(args[index], 1) if index < len(args) else 1
+
+
+class Line:
+    """One screen row: character and tags per cell, plus whether it changed since the last render."""
+
+    __slots__ = ("chars", "tags", "dirty")
+
+    def __init__(self, cols: int):
+        self.chars = [" "] * cols
+        self.tags: list[tuple[str, ...]] = [()] * cols
+        self.dirty = True
+
+    def erase(self, start: int, end: int):
+        end = min(end, len(self.chars))
+        if end > start:
+            self.chars[start:end] = " " * (end - start)
+            self.tags[start:end] = [()] * (end - start)
+            self.dirty = True
+
+    def resize(self, cols: int):
+        missing = cols - len(self.chars)
+        if missing > 0:
+            self.chars += [" "] * missing
+            self.tags += [()] * missing
+        elif missing < 0:
+            del self.chars[cols:], self.tags[cols:]
+        self.dirty = True
+
+    def runs(self) -> list[Run]:
+        """Text runs with equal tags, without the blank cells at the end of the line."""
+        chars, tags = self.chars, self.tags
+        text = "".join(chars)
+        end, width = len(text.rstrip(" ")), len(tags)
+        if end < width and tags[end:].count(()) != width - end:
+            # Leerzeichen mit Hintergrundfarbe am Ende bleiben erhalten
+            end = width
+            while end and chars[end - 1] == " " and not tags[end - 1]:
+                end -= 1
+        if not end:
+            return []
+        head = tags[:end]
+        if head.count(head[0]) == end:
+            return [(text[:end], head[0])]
+        runs, start = [], 0
+        for tag, cells in groupby(head):
+            stop = start + len(list(cells))
+            runs.append((text[start:stop], tag))
+            start = stop
+        return runs
+
+
+class Screen:
+    """
+    VT100 screen model fed with raw PTY output.
+
+    The visible rows have a cursor, carriage return, line feed with scroll
+    region (DECSTBM), cursor movement, erase in line/display, insert/delete
+    of lines and characters, autowrap and the alternate screen. Rows pushed
+    off the top of the full screen go to the scrollback (up to
+    `scrollback_lines`); older lines are handed to `spill` if one is given,
+    otherwise dropped. A progress bar redrawn with "\\r" or "ESC [ K"
+    therefore stays one line instead of appending a new one per update.
+
+    `render_ops` returns what changed since the last call for a text widget
+    that holds the scrollback followed by the screen rows; only rows whose
+    content changed are repainted.
+    """
+
+    def __init__(
+        self,
+        rows: int = 24,
+        cols: int = 80,
+        scrollback_lines: int = SCROLLBACK_LINES,
+        spill: ScrollbackSpill | None = None,
+    ):
+        self.rows, self.cols = max(rows, 1), max(cols, 1)
+        self.scrollback_lines = scrollback_lines
+        self.spill = spill
+        self.scrollback: deque[list[Run]] = deque()
+        self.parser = AnsiParser(handler=self)
+        # seit dem letzten render_ops oben hinausgeschobene Zeilen
+        self._pending: list[Line] = []
+        self._full_redraw = True
+        self.reset()
+
+    def reset(self):
+        self.lines = [Line(self.cols) for _ in range(self.rows)]
+        self.row = self.col = 0
+        self.top, self.bottom = 0, self.rows - 1
+        self.autowrap = True
+        self.cursor_visible = True
+        self._wrap_pending = False
+        self._saved_cursor = (0, 0)
+        self._main_screen = None  # gesicherter Hauptbildschirm, solange der alternative aktiv ist
+
+    # ===== Eingabe =====
+    def feed(self, data: str):
+        for text, tags in self.parser.feed(data):
+            self.write(text, tags)
+
+    def write(self, text: str, tags: tuple[str, ...] = ()):
+        """Writes already parsed text (may contain control characters) at the cursor."""
+        for i, part in enumerate(_CONTROLS.split(text)):
+            if i % 2:
+                self._control(part)
+            elif part:
+                self._print(part, tags)
+
+    def _control(self, char: str):
+        if char == "\r\n":
+            self.col = 0
+            self._index()
+        elif char == "\r":
+            self.col = 0
+        elif char in "\n\x0b\x0c":
+            self._index()
+        elif char == "\b":
+            self.col = max(self.col - 1, 0)
+        elif char == "\t":
+            self.col = min((self.col // TAB_WIDTH + 1) * TAB_WIDTH, self.cols - 1)
+        else:
+            return  # BEL, NUL usw.
+        self._wrap_pending = False
+
+    def _print(self, text: str, tags: tuple[str, ...]):
+        cols = self.cols
+        while text:
+            if self._wrap_pending:
+                self._wrap_pending = False
+                self.col = 0
+                self._index()
+            line, col = self.lines[self.row], self.col
+            part = text[: cols - col]
+            end = col + len(part)
+            line.chars[col:end] = part
+            line.tags[col:end] = [tags] * len(part)
+            line.dirty = True
+            text = text[len(part) :]
+            if end < cols:
+                self.col = end
+                continue
+            self.col = cols - 1
+            if self.autowrap:
+                self._wrap_pending = True
+            elif text:
+                # ohne Autowrap überschreibt der Rest die letzte Spalte
+                line.chars[-1], line.tags[-1] = text[-1], tags
+                text = ""
+
+    # ===== Steuersequenzen (Handler für AnsiParser) =====
+    def csi(self, params: str, final: str):
+        if params and params[0] in "<=>?":
+            if params[0] == "?" and final in "hl":
+                self._set_modes(params[1:].split(";"), final == "h")
+            return
+        if params[-1:] and params[-1] in " !\"#$%&'()*+,-./":
+            return  # Sequenzen mit Intermediates (z.B. Cursorform)
+        try:
+            args = [int(p) if p else 0 for p in params.split(";")] if params else []
+        except ValueError:
+            return
+        self._wrap_pending = False
+        rows, cols = self.rows, self.cols
+        n = _count(args)
+        if final == "A" or final == "F":
+            self.row = max(self.row - n, self.top if self.row >= self.top else 0)
+        elif final in "BeE":
+            self.row = min(self.row + n, self.bottom if self.row <= self.bottom else rows - 1)
+        elif final in "Ca":
+            self.col = min(self.col + n, cols - 1)
+        elif final == "D":
+            self.col = max(self.col - n, 0)
+        elif final in "G`":
+            self.col = min(n, cols) - 1
+        elif final == "d":
+            self.row = min(n, rows) - 1
+        elif final in "Hf":
+            self.row, self.col = min(n, rows) - 1, min(_count(args, 1), cols) - 1
+        elif final == "J":
+            self._erase_display(args[0] if args else 0)
+        elif final == "K":
+            self._erase_line(args[0] if args else 0)
+        elif final == "L":
+            if self.top <= self.row <= self.bottom:
+                self._scroll_down(n, self.row)
+        elif final == "M":
+            if self.top <= self.row <= self.bottom:
+                self._scroll_up(n, self.row)
+        elif final == "P":
+            line = self.lines[self.row]
+            n = min(n, cols - self.col)
+            del line.chars[self.col : self.col + n], line.tags[self.col : self.col + n]
+            line.resize(cols)
+        elif final == "@":
+            line = self.lines[self.row]
+            n = min(n, cols - self.col)
+            line.chars[self.col : self.col] = " " * n
+            line.tags[self.col : self.col] = [()] * n
+            line.resize(cols)
+        elif final == "X":
+            self.lines[self.row].erase(self.col, self.col + n)
+        elif final == "S":
+            self._scroll_up(n)
+        elif final == "T":
+            self._scroll_down(n)
+        elif final == "r":
+            top = _count(args) - 1
+            bottom = min(args[1] if len(args) > 1 and args[1] else rows, rows) - 1
+            if top < bottom:
+                self.top, self.bottom = top, bottom
+                self.row = self.col = 0
+        elif final == "s":
+            self._saved_cursor = (self.row, self.col)
+        elif final == "u":
+            self._restore_cursor()
+        if final in "EF":
+            self.col = 0
+
+    def esc(self, final: str):
+        if final == "7":
+            self._saved_cursor = (self.row, self.col)
+        elif final == "8":
+            self._restore_cursor()
+        elif final == "D":
+            self._index()
+        elif final == "E":
+            self.col = 0
+            self._index()
+        elif final == "M":
+            if self.row == self.top:
+                self._scroll_down(1)
+            elif self.row > 0:
+                self.row -= 1
+        elif final == "c":
+            self.reset()
+        self._wrap_pending = False
+
+    def _restore_cursor(self):
+        row, col = self._saved_cursor
+        self.row, self.col = min(row, self.rows - 1), min(col, self.cols - 1)
+
+    def _set_modes(self, modes: list[str], on: bool):
+        for mode in modes:
+            if mode == "7":
+                self.autowrap = on
+            elif mode == "25":
+                self.cursor_visible = on
+            elif mode in _ALT_SCREEN_MODES:
+                self._alternate_screen(on, save_cursor=mode == "1049")
+
+    def _alternate_screen(self, on: bool, save_cursor: bool):
+        if on and self._main_screen is None:
+            self._main_screen = (self.lines, self.row, self.col)
+            self.lines = [Line(self.cols) for _ in range(self.rows)]
+            if not save_cursor:
+                self.row, self.col = 0, 0
+        elif not on and self._main_screen is not None:
+            lines, row, col = self._main_screen
+            self._main_screen = None
+            self.lines = lines
+            if save_cursor:
+                self.row, self.col = row, col
+            self._touch(0, self.rows)
+
+    # ===== Bildschirmoperationen =====
+    def _touch(self, start: int, end: int):
+        for line in self.lines[start:end]:
+            line.dirty = True
+
+    def _index(self):
+        if self.row == self.bottom:
+            self._scroll_up(1)
+        elif self.row < self.rows - 1:
+            self.row += 1
+
+    def _scroll_up(self, n: int, top: int | None = None):
+        """Scrolls the region (from `top` or the region top) up by `n` rows."""
+        bottom = self.bottom
+        if top is None:
+            top = self.top
+            if top == 0 and bottom == self.rows - 1 and self._main_screen is None:
+                # ganzer Bildschirm: die oberen Zeilen wandern unverändert in den Scrollback
+                n = min(n, self.rows)
+                self._pending += self.lines[:n]
+                del self.lines[:n]
+                self.lines += [Line(self.cols) for _ in range(n)]
+                return
+        n = min(n, bottom - top + 1)
+        del self.lines[top : top + n]
+        self.lines[bottom - n + 1 : bottom - n + 1] = [Line(self.cols) for _ in range(n)]
+        self._touch(top, bottom + 1)
+
+    def _scroll_down(self, n: int, top: int | None = None):
+        top = self.top if top is None else top
+        bottom = self.bottom
+        n = min(n, bottom - top + 1)
+        del self.lines[bottom - n + 1 : bottom + 1]
+        self.lines[top:top] = [Line(self.cols) for _ in range(n)]
+        self._touch(top, bottom + 1)
+
+    def _erase_line(self, mode: int):
+        line = self.lines[self.row]
+        if mode == 0:
+            line.erase(self.col, self.cols)
+        elif mode == 1:
+            line.erase(0, self.col + 1)
+        elif mode == 2:
+            line.erase(0, self.cols)
+
+    def _erase_display(self, mode: int):
+        if mode == 0:
+            self._erase_line(0)
+            rows = range(self.row + 1, self.rows)
+        elif mode == 1:
+            self._erase_line(1)
+            rows = range(self.row)
+        else:
+            rows = range(self.rows)
+            if mode == 3:
+                # löscht zusätzlich den Scrollback
+                self.scrollback.clear()
+                if self.spill is not None:
+                    self.spill.clear()
+                self._pending.clear()
+                self._full_redraw = True
+        for row in rows:
+            self.lines[row].erase(0, self.cols)
+
+    def resize(self, rows: int, cols: int):
+        rows, cols = max(rows, 1), max(cols, 1)
+        if (rows, cols) == (self.rows, self.cols):
+            return
+        if self._main_screen is not None:
+            lines, row, col = self._main_screen
+            self._main_screen = (self._resize_lines(lines, rows, cols), min(row, rows - 1), min(col, cols - 1))
+        if rows < self.rows and self.row >= rows and self._main_screen is None:
+            # Zeilen über dem Cursor wandern in den Scrollback, damit der Cursor sichtbar bleibt
+            up = self.row - rows + 1
+            self._pending += self.lines[:up]
+            del self.lines[:up]
+            self.row -= up
+        self.lines = self._resize_lines(self.lines, rows, cols)
+        self.rows, self.cols = rows, cols
+        self.top, self.bottom = 0, rows - 1
+        self.row, self.col = min(self.row, rows - 1), min(self.col, cols - 1)
+        self._wrap_pending = False
+        self._full_redraw = True
+
+    @staticmethod
+    def _resize_lines(lines: list[Line], rows: int, cols: int) -> list[Line]:
+        lines = lines[:rows]
+        for line in lines:
+            line.resize(cols)
+        return lines + [Line(cols) for _ in range(rows - len(lines))]
+
+    # ===== Ausgabe =====
+    @property
+    def cursor(self) -> tuple[int, int]:
+        """Cursor as (widget line index, column), valid after `render_ops`."""
+        return len(self.scrollback) + self.row, self.col
+
+    def text(self) -> list[str]:
+        """Scrollback and screen as plain text lines (without trailing blanks)."""
+        lines = [*self.scrollback, *(line.runs() for line in (*self._pending, *self.lines))]
+        return ["".join(text for text, _ in runs) for runs in lines]
+
+    def render_ops(self) -> list[tuple]:
+        """
+        Changes since the last call as operations on a text widget that holds
+        the scrollback followed by the screen rows (line indices from 0):
+
+            ("replace", index, runs)  replace the content of one line
+            ("append", lines)         append lines (each a list of runs)
+            ("delete", count)         delete the first `count` lines
+            ("reset", lines)          replace the whole content
+        """
+        pending, self._pending = self._pending, []
+        if self._full_redraw:
+            self._full_redraw = False
+            self.scrollback.extend(line.runs() for line in pending)
+            self._trim_scrollback()
+            for line in self.lines:
+                line.dirty = False
+            return [("reset", [*self.scrollback, *(line.runs() for line in self.lines)])]
+
+        ops = []
+        base, rows = len(self.scrollback), self.rows
+        # die ersten hinausgeschobenen Zeilen stehen schon im Widget (bisherige Bildschirmzeilen)
+        moved = min(len(pending), rows)
+        for i, line in enumerate(pending[:moved]):
+            runs = line.runs()
+            self.scrollback.append(runs)
+            if line.dirty:
+                ops.append(("replace", base + i, runs))
+        append = [line.runs() for line in pending[moved:]]
+        self.scrollback.extend(append)
+        # neue Zeilen unten am Bildschirm
+        for line in self.lines[rows - moved :]:
+            append.append(line.runs())
+            line.dirty = False
+        if append:
+            ops.append(("append", append))
+        for row, line in enumerate(self.lines[: rows - moved]):
+            if line.dirty:
+                line.dirty = False
+                ops.append(("replace", base + moved + row, line.runs()))
+        excess = self._trim_scrollback()
+        if excess:
+            ops.append(("delete", excess))
+        return ops
+
+    def _trim_scrollback(self) -> int:
+        excess = max(len(self.scrollback) - self.scrollback_lines, 0)
+        dropped = [self.scrollback.popleft() for _ in range(excess)]
+        if dropped and self.spill is not None:
+            self.spill.append(dropped)
+        return excess
@@ -0,0 +1,89 @@
+import json
+import mmap
+import os
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from main._template import LOGGER, TMPDIR, register_exit_hook
+
+# Zeilen, die beim Hochscrollen über den Widget-Anfang auf einmal nachgeladen werden
+PAGE_LINES = 1000
+
+Run = tuple[str, tuple[str, ...]]
+
+
+class ScrollbackSpill:
+    """
+    Append-only file for scrollback lines that no longer fit in the terminal
+    widget. Every line is one JSON record (its runs) followed by a newline;
+    an in-memory offset table allows reading any range of lines back through
+    a memory map without loading the whole file.
+    """
+
+    def __init__(self, directory: str | Path = TMPDIR):
+        fd, path = tempfile.mkstemp(prefix="terminal-", suffix=".scrollback", dir=directory)
+        self.path = Path(path)
+        self._file = os.fdopen(fd, "w+b")
+        self._offsets = array("Q", [0])  # Startposition jeder Zeile, zuletzt das Dateiende
+        self._map: mmap.mmap | None = None
+        self._closed = False
+        # TMPDIR lässt sich beim Beenden nur leer löschen
+        register_exit_hook(self.close)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def append(self, lines: Iterable[list[Run]]):
+        records = [
+            (json.dumps(runs, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8") for runs in lines
+        ]
+        if not records or self._closed:
+            return
+        end = self._offsets[-1]
+        for record in records:
+            end += len(record)
+            self._offsets.append(end)
+        self._file.write(b"".join(records))
+
+    def read(self, start: int, stop: int) -> list[list[Run]]:
+        """Lines `start` to `stop` (exclusive) in their original order."""
+        start, stop = max(start, 0), min(stop, len(self))
+        if start >= stop or self._closed:
+            return []
+        end = self._offsets[stop]
+        if self._map is None or len(self._map) < end:
+            self._remap()
+        data = self._map[self._offsets[start] : end]
+        return [[(text, tuple(tags)) for text, tags in json.loads(record)] for record in data.split(b"\n")[:-1]]
+
+    def _remap(self):
+        # die Datei ist seit dem letzten Mapping gewachsen
+        self._file.flush()
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def clear(self):
+        if self._closed:
+            return
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.seek(0)
+        self._file.truncate()
+        self._offsets = array("Q", [0])
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            LOGGER.warning(f'Could not delete terminal scrollback file "{self.path}": {e}')
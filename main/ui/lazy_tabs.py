@@ -0,0 +1,96 @@
+import importlib
+import threading
+import time
+
+import customtkinter as ctk
+
+from main._template import LOGGER, STARTUP_TIME
+
+
+class LazyTabs:
+    """
+    Builds the content of a CTkTabview tab the first time it is selected.
+
+    Tabs are registered with the module and class of their UI; the module is
+    only imported when the tab is built (or prewarmed). `prewarm` imports all
+    registered modules in a worker thread and then builds the given tabs one
+    by one while the main loop is idle. Build times are kept in `timings`.
+    """
+
+    def __init__(self, tabview: ctk.CTkTabview):
+        self.tabview = tabview
+        self.widgets: dict[str, ctk.CTkFrame] = {}
+        self.timings: dict[str, float] = {}
+        self.first_window_ms: float | None = None
+        self._specs: dict[str, tuple[str, str]] = {}
+        tabview.configure(command=self._on_select)
+
+    def add(self, name: str, module: str | None = None, class_name: str | None = None) -> ctk.CTkFrame:
+        """Adds a tab; without module/class it stays an empty frame."""
+        frame = self.tabview.add(name)
+        if module and class_name:
+            self._specs[name] = (module, class_name)
+        return frame
+
+    def build(self, name: str) -> ctk.CTkFrame | None:
+        if name in self.widgets or name not in self._specs:
+            return self.widgets.get(name)
+        module, class_name = self._specs[name]
+        start = time.perf_counter()
+        try:
+            ui_class = getattr(importlib.import_module(module), class_name)
+            widget = ui_class(self.tabview.tab(name))
+        except Exception as e:
+            LOGGER.exception(f'Could not build tab "{name}": {e}')
+            widget = ctk.CTkLabel(self.tabview.tab(name), text=f"Tab konnte nicht geladen werden:\n{e}")
+        widget.pack(expand=True, fill="both")
+        self.widgets[name] = widget
+        self.timings[name] = time.perf_counter() - start
+        LOGGER.info(f'Tab "{name}" built in {self.timings[name] * 1000:.0f} ms.')
+        return widget
+
+    def _on_select(self):
+        self.build(self.tabview.get())
+
+    def prewarm(self, names: list[str], delay_ms: int = 200) -> None:
+        """Imports every tab module in the background, then builds `names` during idle time."""
+        modules = {module for module, _ in self._specs.values()}
+
+        def import_modules():
+            for module in modules:
+                try:
+                    importlib.import_module(module)
+                except Exception as e:
+                    LOGGER.warning(f"Prewarm import of {module} failed: {e}")
+
+        threading.Thread(target=import_modules, name="tab-prewarm", daemon=True).start()
+        pending = [name for name in names if name in self._specs]
+
+        def build_next():
+            while pending and pending[0] in self.widgets:
+                pending.pop(0)
+            if pending:
+                self.build(pending.pop(0))
+                # ein Tab pro Leerlauf-Slot, damit die UI dazwischen reagiert
+                self.tabview.after(delay_ms, lambda: self.tabview.after_idle(build_next))
+
+        self.tabview.after(delay_ms, lambda: self.tabview.after_idle(build_next))
+
+    def mark_first_window(self) -> float:
+        self.first_window_ms = (time.perf_counter() - STARTUP_TIME) * 1000
+        return self.first_window_ms
+
+    def report(self, budget_ms: float) -> float:
+        """Logs time to first window plus the tab costs so far; returns the total in ms."""
+        first_window = self.first_window_ms or 0.0
+        total_ms = first_window + sum(self.timings.values()) * 1000
+        costs = ", ".join(f"{name}: {seconds * 1000:.0f} ms" for name, seconds in self.timings.items())
+        message = (
+            f"Startup: first window after {first_window:.0f} ms, usable after {total_ms:.0f} ms "
+            f"(budget {budget_ms:.0f} ms). Tabs: {costs or '-'}"
+        )
+        if total_ms > budget_ms:
+            LOGGER.warning(message)
+        else:
+            LOGGER.info(message)
+        return total_ms
@@ -0,0 +1,175 @@
+import logging
+import threading
+import tkinter.font as tkfont
+
+import customtkinter as ctk
+
+from main._template import LOGGER
+from main.log_tools.log_buffer import DEFAULT_MAX_LINES, LogBuffer, SessionLogFile
+
+LOG_LEVEL_COLORS = {
+    "DEBUG": "#8a8a8a",
+    "INFO": "white",
+    "WARNING": "#e5a50a",
+    "ERROR": "#e05252",
+    "CRITICAL": "#ff2b2b",
+}
+
+
+class LogView(ctk.CTkFrame):
+    """
+    Virtualized log view: the textbox only holds the visible lines plus `margin`
+    lines above and below. The scrollbar and mouse wheel move a window over the
+    source, which is the in-memory ring buffer or, on demand, the full session
+    log file.
+    """
+
+    def __init__(self, master, max_lines: int = DEFAULT_MAX_LINES, margin: int = 50, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.buffer = LogBuffer(max_lines)
+        self.session: SessionLogFile | None = None
+        self.source: LogBuffer | SessionLogFile = self.buffer
+        self.margin = margin
+        self._top = 0
+        self._rows = 20
+        self._follow = True
+        self._loading_session: SessionLogFile | None = None
+        self._session_ready = threading.Event()
+
+        self.textbox = ctk.CTkTextbox(
+            self,
+            width=700,
+            height=300,
+            corner_radius=5,
+            fg_color="#1e1e1e",  # dunkelgrau/schwarz
+            text_color="white",
+            wrap="none",
+            activate_scrollbars=False,
+            state="disabled",
+        )
+        self.textbox.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, orientation="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        for level_name, color in LOG_LEVEL_COLORS.items():
+            self.textbox.tag_config(level_name, foreground=color)
+
+        inner = self.textbox._textbox
+        inner.bind("<Configure>", self._on_resize)
+        inner.bind("<MouseWheel>", self._on_mousewheel)  # Windows / macOS
+        inner.bind("<Button-4>", lambda e: self._scroll_by(-3))  # Linux
+        inner.bind("<Button-5>", lambda e: self._scroll_by(3))
+
+    # ===== Daten =====
+    def append(self, records: list[tuple[int, str]]) -> None:
+        dropped = self.buffer.extend(records)
+        if self.source is self.buffer:
+            if not self._follow:
+                # gleiche Zeilen sichtbar lassen, auch wenn vorne welche herausfallen
+                self._top = max(self._top - dropped, 0)
+        elif self.session is not None:
+            self.session.refresh()
+        self._render()
+
+    def set_min_level(self, level: int) -> None:
+        self.buffer.set_min_level(level)
+        if self.session is not None:
+            self.session.set_min_level(level)
+        self._follow = True
+        self._render()
+
+    def show_session(self, path: str) -> None:
+        """Switches to the complete session log; the file is indexed in a worker thread."""
+        session = SessionLogFile(path, self.buffer.min_level)
+        self._loading_session = session
+        self._session_ready.clear()
+
+        def index():
+            try:
+                session.refresh()
+            except OSError as e:
+                LOGGER.error(f'Could not index session log "{path}": {e}')
+            self._session_ready.set()
+
+        threading.Thread(target=index, name="log-index", daemon=True).start()
+        self.after(50, self._poll_session)
+
+    def _poll_session(self):
+        if self._loading_session is None:
+            return  # inzwischen zurück zum Ringpuffer gewechselt
+        if not self._session_ready.is_set():
+            self.after(50, self._poll_session)
+            return
+        self.session, self._loading_session = self._loading_session, None
+        self.source = self.session
+        self._follow = True
+        self._render()
+
+    def show_buffer(self) -> None:
+        self.session = self._loading_session = None
+        self.source = self.buffer
+        self._follow = True
+        self._render()
+
+    # ===== Scrollen =====
+    def _max_top(self) -> int:
+        return max(len(self.source) - self._rows, 0)
+
+    def _scroll_to(self, top: int) -> None:
+        self._top = min(max(top, 0), self._max_top())
+        self._follow = self._top >= self._max_top()
+        self._render()
+
+    def _scroll_by(self, lines: int) -> str:
+        self._scroll_to(self._top + lines)
+        return "break"  # kein natives Scrollen im Textfeld
+
+    def _on_mousewheel(self, event) -> str:
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, action: str, value, unit: str | None = None):
+        if action == "moveto":
+            self._scroll_to(int(float(value) * len(self.source)))
+        elif action == "scroll":
+            step = self._rows if unit == "pages" else 1
+            self._scroll_by(int(value) * step)
+
+    def _on_resize(self, event):
+        linespace = tkfont.Font(font=self.textbox._textbox.cget("font")).metrics("linespace")
+        rows = max(event.height // max(linespace, 1), 1)
+        if rows != self._rows:
+            self._rows = rows
+            self._render()
+
+    # ===== Rendern =====
+    def _render(self) -> None:
+        total = len(self.source)
+        if self._follow:
+            self._top = self._max_top()
+        self._top = min(self._top, self._max_top())
+        start = max(self._top - self.margin, 0)
+        lines = self.source.window(start, self._top - start + self._rows + self.margin)
+
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        # aufeinanderfolgende Zeilen mit gleichem Level in einem insert
+        run_level, run_lines = None, []
+        for levelno, text in lines:
+            if levelno != run_level and run_lines:
+                self._insert_run(run_level, run_lines)
+                run_lines = []
+            run_level = levelno
+            run_lines.append(text)
+        if run_lines:
+            self._insert_run(run_level, run_lines)
+        self.textbox.configure(state="disabled")
+        self.textbox.yview(f"{self._top - start + 1}.0")
+
+        if total:
+            self.scrollbar.set(self._top / total, min((self._top + self._rows) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _insert_run(self, levelno: int, lines: list[str]) -> None:
+        tag = logging.getLevelName(levelno)
+        self.textbox.insert("end", "\n".join(lines) + "\n", tag if tag in LOG_LEVEL_COLORS else None)
@@ -1,24 +1,44 @@
+import logging
 import os
-import threading
+import queue
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 
 import customtkinter as ctk
 from CTkTable import CTkTable
-from github.GitRelease import GitRelease
 
-from main._template import LOGGER
-from main.config import load_config
+from main._template import LOGGER, log_file, logs_dir, ui_handler
+from main.config import CONFIG_SERVICE, get_config
 from main.ctk_external_modules.CTkCollapsibleFrame import CTkCollapsiblePanel
 from main.github_tools.dashboard import (
-    get_commits_since,
-    get_last_commit,
-    get_last_release,
-    get_last_x_commits,
-    get_prs,
-    get_repo_info,
+    batched_sections,
+    get_dashboard_data,
+    get_configured_repos,
+    get_dashboard_delta,
+    get_repo_overview,
+    iter_last_x_commits,
 )
+from main.github_tools.session import SCHEDULER, log_request_stats
+from main.github_tools.snapshot import load_snapshot, save_snapshot
+from main.log_tools.log_index import format_result, open_index, parse_time
+from main.log_tools.rotation import latest_log
+from main.ui.log_view import LOG_LEVEL_COLORS, LogView
 
-CONFIG = load_config("main/config.json")
+CONFIG = get_config()
+
+# Panels, deren Daten im Snapshot landen (Workflow-Checks sind lokal und immer frisch)
+SNAPSHOT_PANELS = ("status", "commits", "details")
+
+COMMIT_TABLE_HEADER = ["SHA", "Add", "Del", "Total"]
+
+# Log-Anzeige: max. Records pro Frame, danach kommt der Rest im nächsten Frame
+LOG_MAX_LINES_PER_FRAME = 500
+LOG_FRAME_MS = 16
+LOG_IDLE_MS = 250
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+LOG_SEARCH_LIMIT = 500
 
 
 class DashboardUI(ctk.CTkFrame):
@@ -29,60 +49,103 @@ class DashboardUI(ctk.CTkFrame):
         # Obere Frames nebeneinander
         self.status_frame = ctk.CTkFrame(self)
         self.status_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        LOGGER.debug("Status Frame created. {}".format(repr(self.status_frame)))
+        LOGGER.debug("Status Frame created. %r", self.status_frame)
         self.commit_table_frame = ctk.CTkFrame(self)
         self.commit_table_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
         LOGGER.debug(
-            "Commit Table Frame created. {}".format(repr(self.commit_table_frame))
+            "Commit Table Frame created. %r", self.commit_table_frame
         )
 
         # Untere Frames nebeneinander
         self.commit_details_frame = ctk.CTkFrame(self)
         self.commit_details_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
         LOGGER.debug(
-            "Commit Details Frame created. {}".format(repr(self.commit_details_frame))
+            "Commit Details Frame created. %r", self.commit_details_frame
         )
         self.start_frame = ctk.CTkFrame(self)
         self.start_frame.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
-        LOGGER.debug("Start Frame created. {}".format(repr(self.start_frame)))
+        LOGGER.debug("Start Frame created. %r", self.start_frame)
 
         # Collapsible Logs Frame
         self.log_frame = ctk.CTkFrame(self)
         self.log_frame.grid(
             row=2, column=0, columnspan=2, padx=10, pady=10, sticky="nsew"
         )
-        LOGGER.debug("Log Frame created. {}".format(repr(self.log_frame)))
+        LOGGER.debug("Log Frame created. %r", self.log_frame)
+
+        # "Stand"-Anzeige für Snapshot- bzw. Live-Daten
+        self.as_of_label = ctk.CTkLabel(self, text="", text_color="gray", anchor="e")
+        self.as_of_label.grid(row=3, column=1, padx=10, pady=(0, 5), sticky="e")
+
+        # Rate-Limit-Budget / Queue / Latenzen des Request-Schedulers
+        self.budget_label = ctk.CTkLabel(self, text="", text_color="gray", anchor="w", justify="left")
+        self.budget_label.grid(row=3, column=0, padx=10, pady=(0, 5), sticky="w")
+
+        # Multi-Repo-Übersicht (nur wenn git.repos weitere Repos enthält)
+        self._repos = get_configured_repos()
+        self.overview_frame: ctk.CTkScrollableFrame | None = None
+        if len(self._repos) > 1:
+            overview_collapsible = CTkCollapsiblePanel(self.log_frame, title="Repositories")
+            overview_collapsible.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="nsew")
+            self.overview_frame = ctk.CTkScrollableFrame(overview_collapsible._content_frame, width=700, height=200)
+            self.overview_frame.pack(fill="both", expand=True)
 
         logs_collapsible: CTkCollapsiblePanel = CTkCollapsiblePanel(
             self.log_frame, title="Logs"
         )
-        logs_collapsible.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        logs_collapsible.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
         LOGGER.debug(
-            "Logs Collapsible Panel created. {}".format(repr(logs_collapsible))
+            "Logs Collapsible Panel created. %r", logs_collapsible
         )
 
-        # Scrollbar + Textbox (schwarzer Hintergrund)
-        self.log_textbox = ctk.CTkTextbox(
-            logs_collapsible._content_frame,
-            width=700,
-            height=300,
-            corner_radius=5,
-            fg_color="#1e1e1e",  # dunkelgrau/schwarz
-            text_color="white",
-            state="disabled",
+        # Level-Filter
+        log_toolbar = ctk.CTkFrame(logs_collapsible._content_frame, fg_color="transparent")
+        log_toolbar.pack(side="top", fill="x", pady=(0, 5))
+        ctk.CTkLabel(log_toolbar, text="Level:").pack(side="left", padx=(0, 5))
+        self.log_level_menu = ctk.CTkOptionMenu(
+            log_toolbar, values=list(LOG_LEVELS), width=110, command=self._set_log_level
         )
-        self.log_textbox.pack(
-            side="left", fill="both", expand=True, padx=(0, 0), pady=(0, 0)
+        self.log_level_menu.set("DEBUG")
+        self.log_level_menu.pack(side="left")
+        # Ringpuffer hält nur die letzten Zeilen, die ganze Session kommt aus der Log-Datei
+        self.log_session_switch = ctk.CTkSwitch(
+            log_toolbar, text="Ganze Session", command=self._toggle_log_session
         )
+        self.log_session_switch.pack(side="right")
 
-        # Scrollbar hinzufügen
-        scrollbar = ctk.CTkScrollbar(
+        # Virtualisierte Log-Ansicht: nur der sichtbare Ausschnitt liegt im Textfeld
+        self.log_view = LogView(
             logs_collapsible._content_frame,
-            orientation="vertical",
-            command=self.log_textbox.yview,
+            max_lines=CONFIG.logs.max_lines,
+        )
+        self.log_view.pack(side="top", fill="both", expand=True)
+
+        # Suche über alle Sessions im Log-Index
+        search_collapsible = CTkCollapsiblePanel(logs_collapsible._content_frame, title="Suche")
+        search_collapsible.pack(side="top", fill="x", pady=(5, 0))
+        search_bar = ctk.CTkFrame(search_collapsible._content_frame, fg_color="transparent")
+        search_bar.pack(side="top", fill="x", pady=(0, 5))
+        self.search_text = ctk.CTkEntry(search_bar, placeholder_text="Text", width=180)
+        self.search_text.pack(side="left", padx=(0, 5))
+        self.search_level = ctk.CTkOptionMenu(search_bar, values=list(LOG_LEVELS), width=100)
+        self.search_level.set("DEBUG")
+        self.search_level.pack(side="left", padx=(0, 5))
+        self.search_logger = ctk.CTkEntry(search_bar, placeholder_text="Logger", width=120)
+        self.search_logger.pack(side="left", padx=(0, 5))
+        self.search_since = ctk.CTkEntry(search_bar, placeholder_text="Von (YYYY-MM-DD HH:MM)", width=170)
+        self.search_since.pack(side="left", padx=(0, 5))
+        self.search_until = ctk.CTkEntry(search_bar, placeholder_text="Bis", width=170)
+        self.search_until.pack(side="left", padx=(0, 5))
+        ctk.CTkButton(search_bar, text="Suchen", width=80, command=self._search_logs).pack(side="left")
+        self.search_text.bind("<Return>", lambda e: self._search_logs())
+        self.search_status = ctk.CTkLabel(search_collapsible._content_frame, text="", text_color="gray", anchor="w")
+        self.search_status.pack(side="top", fill="x")
+        self.search_results = ctk.CTkTextbox(
+            search_collapsible._content_frame, height=200, fg_color="#1e1e1e", wrap="none", state="disabled"
         )
-        scrollbar.pack(side="right", fill="y")
-        self.log_textbox.configure(yscrollcommand=scrollbar.set)
+        self.search_results.pack(side="top", fill="both", expand=True)
+        for level_name, color in LOG_LEVEL_COLORS.items():
+            self.search_results.tag_config(level_name, foreground=color)
 
         # Grid-Konfiguration
         self.grid_rowconfigure(0, weight=1)
@@ -91,152 +154,541 @@ class DashboardUI(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
-        self._stop_log_thread = False
-        threading.Thread(target=self.update_logs_loop, daemon=True).start()
+        # Log-Records kommen direkt aus dem ui_handler, eingefügt wird nur im UI-Thread
+        self.after(0, self._drain_log_records)
         LOGGER.info("Dashboard UI components initialized successfully.")
 
+        # GitHub-Requests laufen parallel im Worker-Pool, das Fenster blockiert nicht
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dashboard")
+        self._panel_results: queue.Queue = queue.Queue()
+        # einzelne Tabellenzeilen, die Loader schon vor ihrem Ende liefern (Streaming)
+        self._panel_rows: queue.Queue = queue.Queue()
+        self._streamed_panels: set[str] = set()
+        self.commit_table: CTkTable | None = None
+        self.status_table: CTkTable | None = None
+        self.details_table: CTkTable | None = None
+        self._repo = CONFIG.git.main_repo
+        self._last_x = CONFIG.dashboard.last_commits
+        self._refresh_ms = int(CONFIG.dashboard.refresh_seconds * 1000)
+        self._unsubscribe_config = CONFIG_SERVICE.subscribe(self._on_dashboard_config, "dashboard")
+        self._panel_placeholders: dict[str, ctk.CTkLabel] = {}
+        self._panel_renderers: dict = {}
+        self._panel_frames: dict[str, ctk.CTkFrame] = {}
+        self._pending_panels: set[str] = set()
+        self._stale_panels: set[str] = set()
+        self._fresh_panels: dict = {}
+        self._snapshot = load_snapshot()
+        # Zeitpunkt der letzten erfolgreichen Aktualisierung und zuletzt gespeicherter Stand
+        self._as_of: datetime | None = self._snapshot["saved_at"] if self._snapshot else None
+        self._saved_panels: dict | None = self._snapshot["panels"] if self._snapshot else None
+        self._loaded_once = False
+        self._refresh_failed = False
         self.load_data()
+        self._update_budget_label()
 
-    def insert_log(self, message: str) -> None:
-        self.log_textbox.after(0, self._insert_log_ui, message)
+    def insert_log(self, message: str, level: int = logging.INFO) -> None:
+        self.after(0, self.log_view.append, [(level, message)])
 
-    def _insert_log_ui(self, message: str):
-        self.log_textbox.configure(state="normal")
-        self.log_textbox.insert("end", message + "\n")
-        self.log_textbox.configure(state="disabled")
-        self.log_textbox.see("end")
+    def _set_log_level(self, level_name: str):
+        self.log_view.set_min_level(logging.getLevelName(level_name))
 
-    def find_latest_log(self):
-        files: list[str] = os.listdir("logs/")
-        files: list[str] = [
-            os.path.join("logs/", f) for f in files if f.endswith(".log")
-        ]
-        if not files:
-            return None
-        files.sort(key=os.path.getmtime, reverse=True)
-        return files[0]
-
-    # ========== Log-Update-Loop ==========
-    def update_logs_loop(self):
-        last_size = 0
-        latest_file = None
-        while not self._stop_log_thread:
-            try:
-                file_path = self.find_latest_log()
-                if file_path != latest_file:
-                    latest_file = file_path
-                    last_size = 0
-                    self.log_textbox.delete("1.0", "end")
-                if latest_file:
-                    with open(latest_file, "r", encoding="utf-8") as f:
-                        f.seek(last_size)
-                        new_content = f.read()
-                        if new_content:
-                            self.insert_log(new_content)
-                        last_size = f.tell()
-            except Exception as e:
-                LOGGER.error(f"Error reading log: {e}")
-            time.sleep(1)
+    def _toggle_log_session(self):
+        if self.log_session_switch.get():
+            self.log_view.show_session(latest_log(logs_dir) or log_file)
+        else:
+            self.log_view.show_buffer()
+
+    # ========== Log-Suche ==========
+    def _search_logs(self):
+        try:
+            since = parse_time(self.search_since.get())
+            until = parse_time(self.search_until.get())
+        except ValueError:
+            self.search_status.configure(text="Ungültige Zeitangabe (YYYY-MM-DD HH:MM)")
+            return
+        query = (
+            self.search_text.get().strip() or None,
+            logging.getLevelName(self.search_level.get()),
+            self.search_logger.get().strip() or None,
+            since,
+            until,
+        )
+        self.search_status.configure(text="Suche...")
+        future = self._executor.submit(self._run_log_search, *query)
+        self.after(50, self._poll_log_search, future)
 
+    @staticmethod
+    def _run_log_search(*query) -> tuple[list[dict], float]:
+        index = open_index("logs")
+        try:
+            start = time.perf_counter()
+            rows = index.search(*query, limit=LOG_SEARCH_LIMIT)
+            return rows, (time.perf_counter() - start) * 1000
+        finally:
+            index.close()
+
+    def _poll_log_search(self, future):
+        if not future.done():
+            self.after(50, self._poll_log_search, future)
+            return
+        try:
+            rows, elapsed = future.result()
+        except Exception as e:
+            LOGGER.error(f"Log search failed: {e}")
+            self.search_status.configure(text=f"Fehler: {e}")
+            return
+        self.search_status.configure(text=f"{len(rows)} Treffer in {elapsed:.1f} ms")
+        self.search_results.configure(state="normal")
+        self.search_results.delete("1.0", "end")
+        for row in reversed(rows):
+            self.search_results.insert("end", format_result(row) + "\n", row["level"])
+        self.search_results.configure(state="disabled")
+        self.search_results.see("end")
+
+    # ========== Log-Anzeige ==========
+    def _drain_log_records(self):
+        """Moves buffered log records into the textbox, batched per frame."""
+        records = ui_handler.drain(LOG_MAX_LINES_PER_FRAME)
+        if records:
+            self.log_view.append(records)
+        backlog = len(records) == LOG_MAX_LINES_PER_FRAME
+        self.after(LOG_FRAME_MS if backlog else LOG_IDLE_MS, self._drain_log_records)
+
+    # ========== Panels (progressiv laden) ==========
     def load_data(self):
         LOGGER.info("Loading dashboard data...")
 
-        REPO = "{}/{}".format(CONFIG["git"]["user"], CONFIG["git"]["repo"])
+        REPO = self._repo
+        last_x = self._last_x
+        # alles, was GitHub in einem Request liefern kann, kommt aus einem gemeinsamen Request
+        batched = batched_sections(REPO, last_x)
+
+        # Panel-Name -> (Frame, Abschnitt des gemeinsamen Requests oder eigener Loader, Renderer)
+        panels = {
+            "status": (
+                self.status_frame,
+                "status",
+                self._render_status,
+            ),
+            "commits": (
+                self.commit_table_frame,
+                "commits" if "commits" in batched else lambda: self._stream_commits(REPO, last_x),
+                self._render_commits,
+            ),
+            "details": (
+                self.commit_details_frame,
+                "last_commit" if "last_commit" in batched else lambda: get_dashboard_data(REPO, 1, sections=("last_commit",))["last_commit"],
+                self._render_details,
+            ),
+            "workflow": (
+                self.start_frame,
+                self._check_workflow_paths,
+                self._render_workflow,
+            ),
+        }
+        if self.overview_frame is not None:
+            panels["overview"] = (
+                self.overview_frame,
+                lambda: get_repo_overview(self._repos),
+                self._render_overview,
+            )
+
+        # Stale-while-revalidate: letzten Stand sofort zeichnen, dann im Hintergrund aktualisieren
+        cached_panels: dict = self._snapshot["panels"] if self._snapshot else {}
+        if self._snapshot:
+            self._set_as_of(self._snapshot["saved_at"], "Cache, wird aktualisiert...")
+
+        shared: dict[str, str] = {}
+        for name, (frame, loader, renderer) in panels.items():
+            self._panel_renderers[name] = renderer
+            self._panel_frames[name] = frame
+            if name in cached_panels:
+                try:
+                    renderer(cached_panels[name])
+                    self._stale_panels.add(name)
+                except Exception as e:
+                    LOGGER.warning(f"Could not render cached dashboard panel '{name}': {e}")
+                    self._clear_frame(frame)
+            if name not in self._stale_panels:
+                # Skeleton zuerst zeichnen, Daten kommen später
+                self._panel_placeholders[name] = self._show_placeholder(frame)
+            self._pending_panels.add(name)
+            if isinstance(loader, str):
+                shared[name] = loader
+                continue
+            future = self._executor.submit(loader)
+            future.add_done_callback(lambda f, n=name: self._panel_results.put((n, f)))
+
+        if shared:
+            future = self._executor.submit(get_dashboard_data, REPO, last_x, batched)
+            future.add_done_callback(lambda f: self._split_result(f, shared))
+        self.after(50, self._poll_panel_results)
+
+    def _split_result(self, future: Future, sections: dict[str, str]):
+        """Worker thread: hands each panel its section of the shared request as its own result."""
+        error = future.exception()
+        for name, section in sections.items():
+            part: Future = Future()
+            if error is not None:
+                part.set_exception(error)
+            else:
+                part.set_result(future.result()[section])
+            self._panel_results.put((name, part))
+
+    def _show_placeholder(self, frame: ctk.CTkFrame) -> ctk.CTkLabel:
+        placeholder = ctk.CTkLabel(frame, text="Lade Daten...", text_color="gray")
+        placeholder.pack(fill="both", expand=True, padx=5, pady=5)
+        return placeholder
+
+    def _stream_commits(self, repo_name: str, x: int) -> list[dict]:
+        """Worker thread: hands every commit row to the UI as soon as it is known."""
+        commits: list[dict] = []
+        for commit in iter_last_x_commits(repo_name, x):
+            commits.append(commit)
+            self._panel_rows.put(("commits", commit))
+        return commits
+
+    def _prepare_panel(self, name: str):
+        """Removes the skeleton or the stale snapshot content before fresh data is drawn."""
+        placeholder = self._panel_placeholders.pop(name, None)
+        if placeholder is not None:
+            placeholder.destroy()
+        if name in self._stale_panels:
+            self._stale_panels.discard(name)
+            self._clear_frame(self._panel_frames[name])
+
+    def _poll_panel_rows(self):
+        rows: list[dict] = []
+        try:
+            while True:
+                _, commit = self._panel_rows.get_nowait()
+                rows.append(commit)
+        except queue.Empty:
+            pass
+        if not rows:
+            return
+
+        # alle Zeilen dieses Polls auf einmal einfügen (ein Redraw pro Batch)
+        if "commits" not in self._streamed_panels:
+            self._streamed_panels.add("commits")
+            self._prepare_panel("commits")
+            self._render_commits(rows)
+        else:
+            self._append_table_rows(self.commit_table, [self._commit_row(c) for c in rows])
+            self.commit_table_label.configure(text=f"Last {self.commit_table.rows - 1} Commits")
+
+    def _append_table_rows(self, table: CTkTable, rows: list[list[str]]):
+        # nur die neuen Zeilen anhängen, bestehende Zellen bleiben unangetastet
+        for row in rows:
+            table.add_row(row)
+
+    def _poll_panel_results(self):
+        """Called in main thread: renders every panel whose loader has finished."""
+        self._poll_panel_rows()
+        try:
+            while True:
+                name, future = self._panel_results.get_nowait()
+                self._pending_panels.discard(name)
+                # der Loader hat alle Zeilen vor seinem Ergebnis eingereiht: Nachzügler seit dem
+                # ersten Drain jetzt einfügen, sonst gehen sie verloren oder erscheinen doppelt
+                self._poll_panel_rows()
+                error = future.exception()
+                if error is not None:
+                    LOGGER.error(f"Dashboard panel '{name}' failed to load: {error}")
+                    if name == "refresh":
+                        self._refresh_failed = True
+                    placeholder = self._panel_placeholders.get(name)
+                    if placeholder is not None:
+                        placeholder.configure(text=f"Fehler beim Laden:\n{error}", text_color="#ff5555", wraplength=300)
+                    # sonst bleibt der Snapshot (bzw. die gestreamten Zeilen) stehen
+                    continue
+                if name in self._panel_frames:
+                    self._fresh_panels[name] = future.result()
+                if name in self._streamed_panels:
+                    # Zeilen sind schon eingefügt
+                    continue
+                self._prepare_panel(name)
+                try:
+                    self._panel_renderers[name](future.result())
+                except Exception as e:
+                    LOGGER.error(f"Dashboard panel '{name}' failed to render: {e}")
+        except queue.Empty:
+            pass
+
+        if self._pending_panels:
+            self.after(50, self._poll_panel_results)
+        else:
+            self._finish_loading()
+
+    def _finish_loading(self):
+        # die Refreshes laufen alle paar Sekunden: nur der erste Ladevorgang auf INFO
+        if self._loaded_once:
+            LOGGER.debug("Dashboard data refreshed.")
+        else:
+            LOGGER.info("Dashboard data loaded.")
+            log_request_stats()
+            self._loaded_once = True
+
+        snapshot_panels = {k: v for k, v in self._fresh_panels.items() if k in SNAPSHOT_PANELS}
+        if self._refresh_failed:
+            # letzter guter Stand bleibt stehen, aber als veraltet markiert
+            self._set_as_of(self._as_of, "veraltet, offline")
+        elif self._stale_panels:
+            # Offline / Fehler: alte Werte behalten und mit neuen zusammenführen
+            cached_panels = self._snapshot["panels"] if self._snapshot else {}
+            for name in self._stale_panels & set(SNAPSHOT_PANELS):
+                snapshot_panels.setdefault(name, cached_panels.get(name))
+            self._set_as_of(self._snapshot["saved_at"], "Cache, offline")
+        else:
+            self._as_of = datetime.now()
+            self._set_as_of(self._as_of, "live")
+
+        # nur neue Daten speichern: nicht nach einem fehlgeschlagenen oder leeren Refresh
+        if (
+            not self._refresh_failed
+            and snapshot_panels
+            and snapshot_panels != self._saved_panels
+            and any(name in self._fresh_panels for name in SNAPSHOT_PANELS)
+        ):
+            try:
+                save_snapshot(snapshot_panels)
+                self._saved_panels = snapshot_panels
+            except OSError as e:
+                LOGGER.error(f"Could not save dashboard snapshot: {e}")
+
+        if self._refresh_ms > 0:
+            self.after(self._refresh_ms, self._start_refresh)
+
+    # ========== Auto-Refresh (Delta-Polling) ==========
+    def _panel_data(self, name: str):
+        """Fresh panel data, or the snapshot value if the panel is still stale."""
+        if name in self._fresh_panels:
+            return self._fresh_panels[name]
+        return (self._snapshot or {}).get("panels", {}).get(name)
+
+    def _current_head(self) -> tuple[str | None, datetime | None]:
+        details = self._panel_data("details")
+        if details:
+            date = details["date"]
+            if not isinstance(date, datetime):
+                try:
+                    date = datetime.fromisoformat(str(date))
+                except ValueError:
+                    date = None
+            return details["sha"], date
+        commits = self._panel_data("commits")
+        if commits:
+            return commits[0]["sha"], None
+        return None, None
+
+    def _start_refresh(self):
+        head_sha, since = self._current_head()
+        self._refresh_failed = False
+        LOGGER.debug("Refreshing dashboard since %s (%s).", head_sha, since)
+        future = self._executor.submit(self._refresh_worker, head_sha, since)
+        future.add_done_callback(lambda f: self._panel_results.put(("refresh", f)))
+        self._panel_renderers["refresh"] = self._apply_refresh
+        self._pending_panels.add("refresh")
+        self.after(50, self._poll_panel_results)
+
+    def _refresh_worker(self, head_sha: str | None, since: datetime | None) -> dict:
+        # Hintergrund-Priorität: interaktive Requests haben im Scheduler Vorrang
+        with SCHEDULER.background():
+            return get_dashboard_delta(self._repo, head_sha, since, self._last_x)
+
+    def _apply_refresh(self, delta: dict):
+        """Merges the delta into the existing tables instead of rebuilding them."""
+        self._update_status(delta["status"])
+
+        new_commits: list[dict] = delta["commits"]
+        if new_commits:
+            LOGGER.info(f"{len(new_commits)} new commit(s) since last refresh.")
+            commits = (new_commits + (self._panel_data("commits") or []))[: self._last_x]
+            self._fresh_panels["commits"] = commits
+            if self.commit_table is not None and "commits" not in self._panel_placeholders:
+                # neue Commits unter dem Header einfügen, herausgefallene am Ende löschen
+                for commit in reversed(new_commits[: self._last_x]):
+                    self.commit_table.add_row(self._commit_row(commit), index=1)
+                while self.commit_table.rows - 1 > self._last_x:
+                    self.commit_table.delete_row(self.commit_table.rows - 1)
+                self.commit_table_label.configure(text=f"Last {self.commit_table.rows - 1} Commits")
+                self._stale_panels.discard("commits")
+            else:
+                self._prepare_panel("commits")
+                self._render_commits(commits)
+
+        if delta["last_commit"]:
+            self._fresh_panels["details"] = delta["last_commit"]
+            if self.details_table is not None and "details" not in self._panel_placeholders and self._update_cells(
+                self.details_table, self._details_rows(delta["last_commit"])
+            ):
+                self._stale_panels.discard("details")
+            else:
+                self._prepare_panel("details")
+                self._render_details(delta["last_commit"])
+
+    def _update_status(self, status_data: dict):
+        self._fresh_panels["status"] = status_data
+        rows = self._status_rows(status_data)
+        if self.status_table is None or "status" in self._panel_placeholders or not self._update_cells(self.status_table, rows):
+            self._prepare_panel("status")
+            self._render_status(status_data)
+            return
+        self._stale_panels.discard("status")
+
+    @staticmethod
+    def _update_cells(table: CTkTable, rows: list[list]) -> bool:
+        """Sets only the cells that changed; False if the table has a different shape."""
+        if len(rows) != table.rows:
+            return False
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                if table.get(i, j) != value:
+                    table.insert(i, j, value)
+        return True
+
+    def _update_budget_label(self):
+        self.budget_label.configure(text=SCHEDULER.format_status())
+        self.after(2000, self._update_budget_label)
+
+    def _set_as_of(self, when: datetime, source: str):
+        self.as_of_label.configure(text=f"Stand: {when.strftime('%d.%m.%Y %H:%M:%S')} ({source})")
+
+    def _clear_frame(self, frame: ctk.CTkFrame):
+        for child in frame.winfo_children():
+            child.destroy()
+
+    def _render_status(self, status_data: dict[str, str | int]):
+        LOGGER.debug("Status Data: %s", status_data)
 
-        # Status Frame
-        status_data: dict[str, str | int] = get_repo_info(REPO)
-        status_data['commits'] = get_commits_since(REPO, since_datetime=None).totalCount
-        status_data['prs'] = get_prs(REPO)
-        last_release: None | GitRelease = get_last_release(REPO)
-        status_data["last_release"] = str(last_release) if last_release else "N/A"
-        LOGGER.debug("Status Data: {}".format(status_data))
-        
         # ========== Status Table ==========
-        status_data_values: list[list[str]] = []
-        for key, value in status_data.items():
-            status_data_values.append([key.replace("_", " ").capitalize(), str(value)])
+        status_data_values = self._status_rows(status_data)
         
-        status_table = CTkTable(
+        self.status_table = CTkTable(
             self.status_frame, 
             values=status_data_values, 
             row= len(status_data_values), 
             column=2,  # 2 Spalten: Name und Wert
             width=400
         )
-        status_table.pack(fill="both", padx=5, pady=5, expand=True)
-        
+        self.status_table.pack(fill="both", padx=5, pady=5, expand=True)
+
+    @staticmethod
+    def _status_rows(status_data: dict) -> list[list[str]]:
+        return [[key.replace("_", " ").capitalize(), str(value)] for key, value in status_data.items()]
+
+    def _render_commits(self, last_five_commits: list[dict]):
         # ========== Last 5 Commits Table ==========
-        last_five_commits = get_last_x_commits(REPO, CONFIG.get("dashboard", {}).get("last_commits", 5))
-        table_data: list[list[str]] = [["SHA", "Add", "Del", "Total"]]
+        table_data: list[list[str]] = [COMMIT_TABLE_HEADER]
         for c in last_five_commits:
-            table_data.append([str(c.sha[:10]) + "...", str(c.stats.additions), str(c.stats.deletions), str(c.stats.total)])
+            table_data.append(self._commit_row(c))
         
-        commit_table_label = ctk.CTkLabel(self.commit_table_frame, text=f"Last {len(last_five_commits)} Commits", font=("", 14))
-        commit_table_label.pack(pady=10)
+        self.commit_table_label = ctk.CTkLabel(self.commit_table_frame, text=f"Last {len(last_five_commits)} Commits", font=("", 14))
+        self.commit_table_label.pack(pady=10)
         
-        commit_table = CTkTable(
+        self.commit_table = CTkTable(
             self.commit_table_frame, 
             values=table_data, 
             row=len(table_data), 
             column=len(table_data[0]), 
             width=300
         )
-        commit_table.pack(fill="both", padx=5, pady=5, expand=True)
-        
+        self.commit_table.pack(fill="both", padx=5, pady=5, expand=True)
+
+    @staticmethod
+    def _commit_row(c: dict) -> list[str]:
+        return [str(c["sha"][:10]) + "...", str(c["additions"]), str(c["deletions"]), str(c["total"])]
+
+    def _render_details(self, last_commit: dict | None):
         # ========== Last Commit Details ==========
-        last_commit = get_last_commit(REPO)
         if last_commit:
-            details_data = [
-                ["SHA", last_commit.sha],
-                ["Kurze Nachricht", last_commit.commit.message.splitlines()[0]],
-                ["Ausführliche Nachricht", last_commit.commit.message],
-                ["Autor", last_commit.commit.author.name],
-                ["Autor Email", last_commit.commit.author.email],
-                ["Datum", str(last_commit.commit.author.date)],
-                ["Dateien geändert", len([f.filename for f in last_commit.files])]
-            ]
+            details_data = self._details_rows(last_commit)
             commit_details_label = ctk.CTkLabel(self.commit_details_frame, text="Last Commit Details", font=("", 14))
             commit_details_label.pack(pady=10)
             
-            details_table = CTkTable(
+            self.details_table = CTkTable(
                 self.commit_details_frame,
                 values=details_data,
                 row=len(details_data),
                 column=2,
                 width=600
             )
-            details_table.pack(fill="both", padx=5, pady=5, expand=True)
-        
-        PATHS: dict = CONFIG.get('paths', {})
-        unreal_check = os.path.exists(PATHS.get('unreal', None)) and str(PATHS.get('unreal', "")).endswith('.exe')  # type: ignore
-        unreal_project_check = os.path.exists(PATHS.get('unreal_project_file', None)) and str(PATHS.get('unreal_project_file', "")).endswith('.uproject')  # type: ignore
-        git_check = os.path.exists(PATHS.get('git', None)) and str(PATHS.get('git', "")).endswith('.exe') # type: ignore
+            self.details_table.pack(fill="both", padx=5, pady=5, expand=True)
+
+    @staticmethod
+    def _details_rows(last_commit: dict) -> list[list]:
+        return [
+            ["SHA", last_commit["sha"]],
+            ["Kurze Nachricht", last_commit["message"].splitlines()[0]],
+            ["Ausführliche Nachricht", last_commit["message"]],
+            ["Autor", last_commit["author"]],
+            ["Autor Email", last_commit["email"]],
+            ["Datum", str(last_commit["date"])],
+            ["Dateien geändert", last_commit["changed_files"]]
+        ]
+
+    def _render_overview(self, overview: dict[str, dict | str]):
+        # ========== Repository Overview ==========
+        rows: list[list[str]] = [["Repo", "Stars", "Issues", "PRs", "Commits", "Release"]]
+        for repo_name, status in overview.items():
+            if isinstance(status, dict):
+                rows.append([
+                    repo_name,
+                    str(status["stars"]),
+                    str(status["open_issues"]),
+                    str(status["prs"]),
+                    str(status["commits"]),
+                    str(status["last_release"]),
+                ])
+            else:
+                label = "Fehler" if status == "error" else "übersprungen"
+                rows.append([repo_name, label, "", "", "", ""])
+
+        overview_table = CTkTable(
+            self.overview_frame,
+            values=rows,
+            row=len(rows),
+            column=len(rows[0]),
+            width=110,
+        )
+        overview_table.pack(fill="both", padx=5, pady=5, expand=True)
+
+    def _check_workflow_paths(self) -> dict[str, bool]:
+        PATHS: dict = CONFIG.paths
+        unreal_check = os.path.exists(PATHS.get('unreal', "")) and str(PATHS.get('unreal', "")).endswith('.exe')
+        unreal_project_check = os.path.exists(PATHS.get('unreal_project_file', "")) and str(PATHS.get('unreal_project_file', "")).endswith('.uproject')
+        git_check = os.path.exists(PATHS.get('git', "")) and str(PATHS.get('git', "")).endswith('.exe')
         
         LOGGER.info(f"Unreal ({unreal_check}): {PATHS.get('unreal', None)}")
         LOGGER.info(f"Unreal Project File ({unreal_project_check}): {PATHS.get('unreal_project_file', None)}")
         LOGGER.info(f"Git ({git_check}): {PATHS.get('git', None)}")
-        
+        return {"Unreal": unreal_check, "Unreal Project File": unreal_project_check, "Git": git_check}
+
+    def _render_workflow(self, checks: dict[str, bool]):
         workflow_table = CTkTable(
             self.start_frame, 
-            values=[
-                ["Unreal", "Found" if unreal_check else "Not Found"], 
-                ["Unreal Project File", "Found" if unreal_project_check else "Not Found"], 
-                ["Git", "Found" if git_check else "Not Found"]
-            ]
+            values=[[name, "Found" if found else "Not Found"] for name, found in checks.items()]
         )
         workflow_table.pack(fill="both", padx=5, pady=5, expand=True)
         
         self.start_button = ctk.CTkButton(self.start_frame, text="Start Workflow", command=lambda: LOGGER.info("Start Workflow button clicked"))
         self.start_button.pack(padx=20, pady=20)
         
-        if unreal_check and unreal_project_check and git_check:
+        if all(checks.values()):
             self.start_button.configure(state="normal", fg_color="#187e18")  # aktiv & grün
         else:
             self.start_button.configure(state="disabled", fg_color="#8a0000")  # deaktiviert & rot
-
-        
-        LOGGER.info("Dashboard data loaded.")
         
+    def _on_dashboard_config(self, key: str, value):
+        # greift beim nächsten Refresh, ohne die Datei neu zu lesen
+        self._last_x = CONFIG.dashboard.last_commits
+        self._refresh_ms = int(CONFIG.dashboard.refresh_seconds * 1000)
+
+    def destroy(self):
+        self._unsubscribe_config()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def workspace(self):
         LOGGER.info("Statring Building Workspace")
         
@@ -1,244 +1,222 @@
 # ui/tabs/terminal.py
 """
-Terminal tab with non-blocking reader and basic ANSI SGR color handling.
-Works with pywinpty output that contains escape sequences (Clink, prompts, etc.)
+Terminal tab with non-blocking reader, ANSI SGR color handling (16/256/truecolor)
+and a VT100 screen model, so progress bars redrawn in place stay one line.
+Runs on pywinpty (Windows) or a POSIX pty, see main/terminal_tools/pty_backend.py.
+Handles output that contains escape sequences (Clink, prompts, etc.)
 """
 
-import queue
-import re
-import threading
+import time
+import tkinter as tk
+import tkinter.font as tkfont
 
 import customtkinter as ctk
-import winpty
 
-# ANSI SGR regex (matches sequences like \x1b[31m or \x1b[1;32m)
-SGR_RE = re.compile(r"\x1b\[((?:\d{1,3};?)+)m")
-# OSC (Operating System Command) sequences like ESC ] 0;title BEL or ESC ] 0;title ESC \
-OSC_RE = re.compile(r"\x1b\].*?(?:\x07|\x1b\\)")
-# Other CSI / control sequences (cursor moves, erase, etc.) - remove conservative set
-CSI_RE = re.compile(r"\x1b\[[:<>?=\d;]*[A-Za-z]")
-
-# Map common SGR color codes to tkinter tag names / colors (basic)
-SGR_COLOR_MAP = {
-    30: ("fg_black", "#000000"),
-    31: ("fg_red", "#ff5555"),
-    32: ("fg_green", "#50fa7b"),
-    33: ("fg_yellow", "#f1fa8c"),
-    34: ("fg_blue", "#6272a4"),
-    35: ("fg_magenta", "#ff79c6"),
-    36: ("fg_cyan", "#8be9fd"),
-    37: ("fg_white", "#f8f8f2"),
-    90: ("fg_bright_black", "#44475a"),
-    91: ("fg_bright_red", "#ff6e6e"),
-    92: ("fg_bright_green", "#69ff94"),
-    93: ("fg_bright_yellow", "#ffffa5"),
-    94: ("fg_bright_blue", "#caa9ff"),
-    95: ("fg_bright_magenta", "#ff92df"),
-    96: ("fg_bright_cyan", "#9aedfe"),
-    97: ("fg_bright_white", "#ffffff"),
-}
-
-# Basic attributes
-ATTR_BOLD = 1
-ATTR_ITALIC = 3  # rarely supported in terminals
-ATTR_UNDERLINE = 4
-ATTR_RESET = 0
-
-
-def parse_sgr_parts(sgr_code_str):
-    """Return list of int codes from SGR parameter string like '1;31' -> [1,31]"""
-    parts = []
-    for p in sgr_code_str.split(";"):
-        try:
-            parts.append(int(p))
-        except ValueError:
-            pass
-    return parts
-
-
-class AnsiTextParser:
-    """
-    Simple ANSI SGR parser that yields (text, taglist)
-    It strips OSC and many CSI sequences, and processes SGR color/bold/reset.
-    Not a full terminal emulator — enough for colored prompts and outputs.
-    """
-
-    def __init__(self):
-        self.reset_state()
-
-    def reset_state(self):
-        self.current_fg = None
-        self.bold = False
-        self.underline = False
-
-    def _make_tags(self):
-        tags = []
-        if self.current_fg:
-            tags.append(self.current_fg)
-        if self.bold:
-            tags.append("attr_bold")
-        if self.underline:
-            tags.append("attr_underline")
-        return tags
-
-    def feed(self, text):
-        # First remove OSC and many cursor-control CSI sequences
-        text = OSC_RE.sub("", text)
-        text = CSI_RE.sub("", text)
-
-        # Now iterate over SGR sequences
-        pos = 0
-        for match in SGR_RE.finditer(text):
-            start, end = match.span()
-            if start > pos:
-                yield text[pos:start], self._make_tags()
-
-            codes = parse_sgr_parts(match.group(1))
-            # Apply codes
-            if not codes:
-                codes = [0]
-
-            for code in codes:
-                if code == ATTR_RESET:
-                    self.reset_state()
-                elif code == ATTR_BOLD:
-                    self.bold = True
-                elif code == ATTR_UNDERLINE:
-                    self.underline = True
-                elif 30 <= code <= 37 or 90 <= code <= 97:
-                    # Set foreground
-                    mapping = SGR_COLOR_MAP.get(code)
-                    if mapping:
-                        self.current_fg = mapping[0]
-                elif code == 39:
-                    # default fg
-                    self.current_fg = None
-                # NOTE: bg colors, 256-color, truecolor not implemented here
-            pos = end
-
-        # Remainder
-        if pos < len(text):
-            yield text[pos:], self._make_tags()
+from main._template import LOGGER
+from main.config import get_config
+from main.terminal_tools.ansi import ANSI_COLORS, DEFAULT_BG, DEFAULT_FG, tag_style
+from main.terminal_tools.pty_backend import DEFAULT_COLS, DEFAULT_ROWS, create_pty
+from main.terminal_tools.pty_reader import PtyReader
+from main.terminal_tools.render_batch import FRAME_MS, drain_chunks, frame_delay
+from main.terminal_tools.screen import Run, Screen
+from main.terminal_tools.scrollback import PAGE_LINES, ScrollbackSpill
 
 
 class TerminalUI(ctk.CTkFrame):
-    def __init__(self, master, shell_cmd="cmd.exe /Q", **kwargs):
+    def __init__(self, master, shell_cmd: str | None = None, **kwargs):
         super().__init__(master, **kwargs)
 
         # Text widget (CTkTextbox wraps tkinter.Text and supports tags)
-        self.textbox = ctk.CTkTextbox(self, wrap="none")
+        self.textbox = ctk.CTkTextbox(self, wrap="none", fg_color=DEFAULT_BG, text_color=DEFAULT_FG)
         self.textbox.pack(fill="both", expand=True, padx=8, pady=8)
 
         # --- ÄNDERUNG 1: Initial sperren ---
         self.textbox.configure(state="disabled")
         # -----------------------------------
 
-        # Configure tags for colors / attributes
-        self._configure_tags()
-
         # Entry for user input
         self.entry = ctk.CTkEntry(self, placeholder_text="Befehl eingeben...")
         self.entry.pack(fill="x", padx=8, pady=(0, 8))
         self.entry.bind("<Return>", self._on_enter)
 
         # ... (Rest von __init__ bleibt gleich) ...
-        self._q = queue.Queue()
-        self._pty = winpty.PtyProcess
-        self._proc = self._pty.spawn(shell_cmd)
-        self._parser = AnsiTextParser()
+        # Backend nach Plattform (winpty / posix), überschreibbar in config.json "terminal"
+        settings = get_config().terminal
+        self._proc = create_pty(shell_cmd or settings.shell or None, kind=settings.backend or None)
+        self._size = (DEFAULT_ROWS, DEFAULT_COLS)
+        # Scrollback über dem Limit wandert in eine Datei im TMPDIR
+        self._spill = ScrollbackSpill() if settings.spill_scrollback else None
+        self._screen = Screen(
+            DEFAULT_ROWS, DEFAULT_COLS, scrollback_lines=settings.scrollback_lines, spill=self._spill
+        )
+        # aus der Spill-Datei nachgeladene Zeilen oben im Widget
+        self._paged = 0
+        self._page_id = None
         self._running = True
-        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
-        self._reader_thread.start()
+        self._poll_id = None
+        self._last_frame = 0.0
+        # Reader blockiert auf dem PTY und weckt die UI nur, wenn Daten ankommen
+        self.bind("<<PtyOutput>>", self._on_output_ready)
+        self._reader = PtyReader(self._proc, self._notify_output)
+        self._q = self._reader.chunks
+        self._reader.start()
 
         font_name = "Consolas"
         self.textbox.configure(font=(font_name, 12))
         self.entry.configure(font=(font_name, 12))
+        # Configure tags for colors / attributes
+        self._configure_tags(font_name, 12)
+        self.textbox._textbox.bind("<Configure>", self._on_resize)
+        self.textbox._textbox.configure(yscrollcommand=self._on_yscroll)
 
-        self.after(50, self._poll_output)
         self.entry.focus_set()
 
-    def _configure_tags(self):
+    def _configure_tags(self, font_name: str, size: int):
         # Attribute tags
-        self.textbox.tag_config("attr_bold")
-        self.textbox.tag_config("attr_underline", underline=True)
-        # Color tags
-        for code, (tagname, hexcol) in SGR_COLOR_MAP.items():
-            # CTkTextbox.tag_config accepts foreground as "fg" or "foreground"
-            # Under the hood CTk uses tkinter.Text tag_config, so use foreground
+        self.textbox.tag_config("attr_bold", font=(font_name, size, "bold"))
+        self.textbox.tag_config("attr_italic", font=(font_name, size, "italic"))
+        self._known_tags = {"attr_bold", "attr_italic"}
+        # Palettenfarben vorab, 256er/Truecolor-Tags bei Bedarf in _ensure_tags
+        self._ensure_tags("attr_underline", "attr_strike")
+        self._ensure_tags(*(f"{kind}_{name}" for name, _ in ANSI_COLORS for kind in ("fg", "bg")))
+
+    def _ensure_tags(self, *tags: str):
+        for tag in tags:
+            if tag in self._known_tags:
+                continue
+            self._known_tags.add(tag)
+            style = tag_style(tag)
+            if style:
+                self.textbox.tag_config(tag, **style)
+
+    def _on_resize(self, event):
+        """Keeps the PTY size in sync with the visible character grid."""
+        font = tkfont.Font(font=self.textbox._textbox.cget("font"))
+        rows = max(event.height // max(font.metrics("linespace"), 1), 1)
+        cols = max(event.width // max(font.measure("M"), 1), 1)
+        if (rows, cols) != self._size:
+            self._size = (rows, cols)
             try:
-                self.textbox.tag_config(tagname, foreground=hexcol)
-            except Exception:
-                # If CTkTextbox blocks direct tag_config, fallback to no colors
-                pass
-
-    def _reader_loop(self):
-        """Background thread that reads from the PTY and pushes to queue."""
-        while self._running:
-            try:
-                data = self._proc.read()
-                if data:
-                    # Ensure it's a python string
-                    if isinstance(data, bytes):
-                        try:
-                            data = data.decode("utf-8", errors="replace")
-                        except Exception:
-                            data = data.decode("latin1", errors="replace")
-                    self._q.put(data)
-                else:
-                    # small sleep to avoid busy loop if read() returns empty
-                    threading.Event().wait(0.01)
-            except Exception:
-                threading.Event().wait(0.05)
+                self._proc.resize(rows, cols)
+            except Exception as e:
+                LOGGER.debug(f"PTY resize to {cols}x{rows} failed: {e}")
+            self._screen.resize(rows, cols)
+            self._on_output_ready()
+
+    def _on_yscroll(self, first: str, last: str):
+        """Scrollbar update; at the top of the widget older lines are paged in from the spill file."""
+        self.textbox._y_scrollbar.set(first, last)
+        if (
+            float(first) <= 0
+            and float(last) < 1
+            and self._page_id is None
+            and self._spill is not None
+            and len(self._spill) > self._paged
+        ):
+            self._page_id = self.after_idle(self._page_in)
+
+    def _page_in(self):
+        """Inserts the next older page above the widget content without moving the view."""
+        self._page_id = None
+        stop = len(self._spill) - self._paged
+        lines = self._spill.read(stop - PAGE_LINES, stop)
+        if not lines:
+            return
+        text = self.textbox._textbox
+        top = int(text.index("@0,0").split(".")[0])
+        self.textbox.configure(state="normal")
+        text.insert("1.0", *self._tk_args(lines), "\n", ())
+        self.textbox.configure(state="disabled")
+        self._paged += len(lines)
+        text.yview(f"{top + len(lines)}.0")
 
-    def _poll_output(self):
-        """Called in main thread periodically to flush output queue into textbox."""
+    def _notify_output(self):
+        """Runs in the reader thread; event_generate is queued to the Tk main thread."""
+        if not self._running:
+            return
         try:
-            while True:
-                chunk = self._q.get_nowait()
-
-                # --- ÄNDERUNG 2: Kurzzeitig entsperren (Unlock) ---
-                self.textbox.configure(state="normal")
-                # --------------------------------------------------
-
-                # Parse ANSI and insert with tags
-                for txt, tags in self._parser.feed(chunk):
-                    if txt:
-                        # Replace carriage returns that attempt to move cursor; keep newlines
-                        txt = txt.replace("\r", "")
-                        # Insert preserving tags
-                        if tags:
-                            # Insert with multiple tags
-                            self.textbox.insert("end", txt, tuple(tags))
-                        else:
-                            self.textbox.insert("end", txt)
-                        self.textbox.see("end")
-
-                # --- ÄNDERUNG 3: Sofort wieder sperren (Lock) ---
-                self.textbox.configure(state="disabled")
-                # ------------------------------------------------
-
-        except queue.Empty:
+            self.event_generate("<<PtyOutput>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Widget wird gerade zerstört
             pass
 
-        # schedule next poll
-        if self._running:
-            self.after(50, self._poll_output)
+    def _on_output_ready(self, event=None):
+        if self._poll_id is None and self._running:
+            self._poll_id = self.after(frame_delay(time.monotonic() - self._last_frame), self._poll_output)
+
+    def _poll_output(self):
+        """
+        Feeds the output queue into the screen model and repaints what changed
+        with a single unlock and scroll per frame. Polling only continues while
+        output keeps coming; otherwise the reader wakes us again.
+        """
+        self._poll_id = None
+        _, pending = drain_chunks(self._q, self._screen.feed)
+        ops = self._screen.render_ops()
+        if ops:
+            self._render(ops)
+            self._last_frame = time.monotonic()
+
+        # bei Rückstau oder laufender Ausgabe im nächsten Frame weiter
+        if self._running and (pending or self._reader.wait_for_data()):
+            self._poll_id = self.after(FRAME_MS, self._poll_output)
+
+    def _render(self, ops: list[tuple]):
+        """Applies Screen.render_ops: only changed lines are replaced, new lines are appended at once."""
+        text = self.textbox._textbox
+        # nur mitscrollen, wenn das Ende sichtbar ist; beim Zurücklesen bleibt die Ansicht stehen
+        follow = text.yview()[1] >= 1.0
+        self.textbox.configure(state="normal")
+        if follow and self._paged:
+            # nachgeladene Zeilen verwerfen, sie stehen weiter in der Spill-Datei
+            text.delete("1.0", f"{self._paged + 1}.0")
+            self._paged = 0
+        offset = self._paged
+        for op in ops:
+            if op[0] == "replace":
+                line = op[1] + offset + 1
+                text.delete(f"{line}.0", f"{line}.end")
+                args = self._tk_args([op[2]])
+                if args:
+                    text.insert(f"{line}.0", *args)
+            elif op[0] == "append":
+                # ein Tk-Aufruf für alle neuen Zeilen: insert index text tags text tags ...
+                text.insert("end-1c", *self._tk_args(op[1], newline_first=True))
+            elif op[0] == "delete":
+                if follow:
+                    text.delete("1.0", f"{op[1] + 1}.0")
+                else:
+                    # bleiben stehen, bis wieder ans Ende gescrollt wird
+                    self._paged += op[1]
+            else:  # reset
+                text.delete("1.0", "end")
+                self._paged = 0
+                args = self._tk_args(op[1])
+                if args:
+                    text.insert("1.0", *args)
+        self.textbox.configure(state="disabled")
+        if follow:
+            self.textbox.see("end")
+
+    def _tk_args(self, lines: list[list[Run]], newline_first: bool = False) -> list:
+        args = []
+        for i, runs in enumerate(lines):
+            if i or newline_first:
+                args += ["\n", ()]
+            for run_text, tags in runs:
+                self._ensure_tags(*tags)
+                args += [run_text, tags]
+        return args
 
     def _on_enter(self, event=None):
         cmd = self.entry.get()
         if not cmd:
             return
-        # Send the command to the PTY (append newline)
+        # Send the command to the PTY (append newline as the Enter key would)
         try:
-            to_send = cmd + "\r\n"
-            # write expects bytes or str depending on API
-            try:
-                self._proc.write(to_send)
-            except TypeError:
-                # maybe expects bytes
-                self._proc.write(to_send.encode("utf-8"))
-        except Exception:
-            pass
+            self._proc.write(cmd + self._proc.newline)
+        except Exception as e:
+            LOGGER.warning(f"Could not send command to terminal: {e}")
         # echo command optionally to the textbox (some shells already echo)
         # self.textbox.insert("end", f"> {cmd}\n")
         self.entry.delete(0, "end")
@@ -246,6 +224,13 @@ class TerminalUI(ctk.CTkFrame):
     def destroy(self):
         # stop reader
         self._running = False
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+        if self._page_id is not None:
+            self.after_cancel(self._page_id)
+        self._reader.stop()
+        if self._spill is not None:
+            self._spill.close()
         try:
             # try to close spawned process cleanly
             try:
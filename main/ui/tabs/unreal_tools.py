@@ -5,18 +5,18 @@ from CTkTable import CTkTable
 import customtkinter as ctk
 import threading
 
-from main.config import load_config
+from main.config import get_config
 from main._template import LOGGER
 from main.ctk_external_modules.CTkCollapsibleFrame import CTkCollapsiblePanel
 
 
-CONFIG = load_config("main/config.json")
+CONFIG = get_config()
 
 
 class UnrealToolsUI(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
-        self.paths = CONFIG.get("paths", {})
+        self.paths = CONFIG.paths  # geteiltes dict, Änderungen anderer Tabs sind sofort sichtbar
         self.buttons = {} 
         self.tick = "✔"
         self.cross = "✘"
@@ -0,0 +1,163 @@
+import importlib
+import json
+import sys
+import types
+
+import pytest
+
+from main.config import CONFIG_SERVICE, AppConfig
+
+# Module, die beim Import get_config() aufrufen, brauchen sonst main/.env mit echtem Token
+with open(CONFIG_SERVICE.path, "r", encoding="utf-8") as file:
+    _data = json.load(file)
+_data.setdefault("git", {})["token"] = "test"
+CONFIG_SERVICE._config = AppConfig.from_dict(_data)
+
+# UI-Module, die customtkinter beim Import binden; `tk_stub` importiert sie gegen die Fakes neu
+TK_MODULES = (
+    "main.ctk_external_modules.CTkCollapsibleFrame",
+    "main.ui.log_view",
+    "main.ui.lazy_tabs",
+    "main.ui.tabs.dashboard",
+)
+
+
+class FakeWidget:
+    """
+    customtkinter stand-in without a display: records options, children and
+    `after` callbacks and accepts every other call. Subclasses (the real UI
+    classes) get an AttributeError for unknown private attributes, so a
+    missing attribute is not hidden by the fake.
+    """
+
+    def __init__(self, master=None, *args, **kwargs):
+        self.master = master
+        self.options = dict(kwargs)
+        self.children: list = []
+        self.destroyed = False
+        self.scheduled: list = []
+        if isinstance(master, FakeWidget):
+            master.children.append(self)
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") or (name.startswith("_") and type(self) is not FakeWidget):
+            raise AttributeError(name)
+        return FakeWidget()
+
+    def __call__(self, *args, **kwargs):
+        return FakeWidget()
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+    def cget(self, key: str):
+        return self.options.get(key)
+
+    def get(self, *args):
+        return ""  # CTkEntry, CTkOptionMenu, CTkSwitch
+
+    def destroy(self):
+        self.destroyed = True
+
+    def winfo_children(self) -> list:
+        return [child for child in self.children if not child.destroyed]
+
+    def after(self, ms, callback, *args):
+        self.scheduled.append((callback, args))
+        return str(len(self.scheduled))
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def run_scheduled(self, *names: str) -> int:
+        """Runs the callbacks scheduled so far with these names (all if none given) once."""
+        due = [item for item in self.scheduled if not names or getattr(item[0], "__name__", "") in names]
+        for item in due:
+            self.scheduled.remove(item)
+            callback, args = item
+            callback(*args)
+        return len(due)
+
+
+class FakeTable(FakeWidget):
+    """CTkTable stand-in with the same data API; `calls` records every change."""
+
+    def __init__(self, master=None, row=None, column=None, values=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.values = [list(r) for r in values or []]
+        self.rows = row if row is not None else len(self.values)
+        self.columns = column if column is not None else len(self.values[0]) if self.values else 0
+        self.calls: list[tuple] = []
+
+    def update_values(self, values, **kwargs):
+        self.calls.append(("update_values", len(values)))
+        self.values = values
+
+    def add_row(self, values, index=None, **kwargs):
+        self.calls.append(("add_row", index))
+        self.values.insert(len(self.values) if index is None else index, list(values))
+        self.rows += 1
+
+    def delete_row(self, index=None):
+        if len(self.values) == 1:
+            return
+        if index is None or index >= len(self.values):
+            index = len(self.values) - 1
+        self.calls.append(("delete_row", index))
+        self.values.pop(index)
+        self.rows -= 1
+
+    def insert(self, row, column, value, **kwargs):
+        self.calls.append(("insert", row, column))
+        self.values[row][column] = value
+
+    def get(self, row=None, column=None):
+        if row is not None and column is not None:
+            return self.values[row][column]
+        return self.values
+
+
+class FakeTabview(FakeWidget):
+    """CTkTabview stand-in: one FakeWidget frame per tab."""
+
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.frames: dict[str, FakeWidget] = {}
+        self.selected: str | None = None
+
+    def add(self, name: str) -> FakeWidget:
+        self.frames[name] = FakeWidget(self)
+        return self.frames[name]
+
+    def tab(self, name: str) -> FakeWidget:
+        return self.frames[name]
+
+    def get(self):
+        return self.selected
+
+    def click(self, name: str):
+        """Selects a tab like a user click: the `command` callback runs."""
+        self.selected = name
+        self.options["command"]()
+
+
+@pytest.fixture
+def tk_stub(monkeypatch):
+    """Returns `import_ui(name)`: imports a UI module against fake customtkinter/CTkTable modules."""
+    ctk = types.ModuleType("customtkinter")
+    ctk.CTkTabview = FakeTabview
+    ctk.__getattr__ = lambda name: FakeWidget  # CTkFrame, CTkLabel, CTkButton, ...
+    ctktable = types.ModuleType("CTkTable")
+    ctktable.CTkTable = FakeTable
+    monkeypatch.setitem(sys.modules, "customtkinter", ctk)
+    monkeypatch.setitem(sys.modules, "CTkTable", ctktable)
+    for name in TK_MODULES:
+        # nach dem Test sind wieder die echten Module (und Paket-Attribute) eingetragen
+        package, _, leaf = name.rpartition(".")
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        monkeypatch.delattr(importlib.import_module(package), leaf, raising=False)
+
+    def import_ui(name: str) -> types.ModuleType:
+        return importlib.import_module(name)
+
+    return import_ui
@@ -0,0 +1,131 @@
+import pytest
+
+from main.terminal_tools.ansi import AnsiParser, color_256, tag_style
+
+E = "\x1b"
+SAMPLE = (
+    f"{E}]0;Guns-And-Choices - cmd{E}\\{E}[1;32muser{E}[0m@{E}[38;5;208mhost{E}[0m> "
+    f"{E}[?25l{E}[2K\r[1/812] Compile{E}(B {E}[33;1mwarning C4996{E}[0m\r\n"
+    f"{E}[38;2;255;85;85mError{E}[39m {E}[48:2::10:20:30mbg{E}[49m "
+    f"{E}P1$r0m{E}\\{E}[7mrev{E}[27m{E}[m done"
+)
+
+
+def _parse(*chunks: str) -> list[tuple[str, tuple[str, ...]]]:
+    """Parses the chunks with one parser and merges neighbouring runs with equal tags."""
+    parser = AnsiParser()
+    runs = []
+    for chunk in chunks:
+        for text, tags in parser.feed(chunk):
+            if runs and runs[-1][1] == tags:
+                runs[-1] = (runs[-1][0] + text, tags)
+            elif text:
+                runs.append((text, tags))
+    return runs
+
+
+def test_sgr_colours_and_attributes():
+    assert _parse(SAMPLE) == [
+        ("user", ("fg_green", "attr_bold")),
+        ("@", ()),
+        ("host", ("fg_#ff8700",)),
+        ("> \r[1/812] Compile ", ()),
+        ("warning C4996", ("fg_yellow", "attr_bold")),
+        ("\r\n", ()),
+        ("Error", ("fg_#ff5555",)),
+        (" ", ()),
+        ("bg", ("bg_#0a141e",)),
+        (" ", ()),
+        ("rev", ("fg_#1e1e1e", "bg_#f8f8f2")),
+        (" done", ()),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_sequences_split_across_chunks_do_not_leak(size):
+    chunks = [SAMPLE[i : i + size] for i in range(0, len(SAMPLE), size)]
+
+    assert _parse(*chunks) == _parse(SAMPLE)
+
+
+def test_every_split_position_gives_the_same_result():
+    expected = _parse(SAMPLE)
+    for i in range(len(SAMPLE) + 1):
+        assert _parse(SAMPLE[:i], SAMPLE[i:]) == expected, i
+
+
+def test_bright_background_and_reset_codes():
+    runs = _parse(f"{E}[92;104;3;4;9mx{E}[23;24;29my{E}[0;35mz{E}[22;39mw")
+
+    assert runs == [
+        ("x", ("fg_bright_green", "bg_bright_blue", "attr_italic", "attr_underline", "attr_strike")),
+        ("y", ("fg_bright_green", "bg_bright_blue")),
+        ("z", ("fg_magenta",)),
+        ("w", ()),
+    ]
+
+
+def test_private_and_malformed_sequences_are_dropped():
+    # CSI > 4 m ist kein SGR; "ESC [ 1 ; \n" bricht ab, Newline bleibt erhalten
+    assert _parse(f"{E}[>4;1ma{E}[1;\nb{E}{E}[31mc") == [("a\nb", ()), ("c", ("fg_red",))]
+
+
+def test_unterminated_osc_swallows_text_until_terminated():
+    assert _parse(f"x{E}]0;very long", " title", f"\x07y") == [("xy", ())]
+
+
+class _Recorder:
+    def __init__(self):
+        self.events = []
+
+    def csi(self, params, final):
+        self.events.append(("csi", params, final))
+
+    def esc(self, final):
+        self.events.append(("esc", final))
+
+
+@pytest.mark.parametrize("size", [1, 3, 64])
+def test_handler_gets_control_sequences_in_order_with_text(size):
+    recorder = _Recorder()
+    parser = AnsiParser(handler=recorder)
+    for i in range(0, len(SAMPLE), size):
+        for text, _ in parser.feed(SAMPLE[i : i + size]):
+            if recorder.events and recorder.events[-1][0] == "text":
+                recorder.events[-1] = ("text", recorder.events[-1][1] + text)
+            elif text:
+                recorder.events.append(("text", text))
+
+    assert recorder.events == [
+        ("text", "user@host> "),
+        ("csi", "?25", "l"),
+        ("csi", "2", "K"),
+        ("text", "\r[1/812] Compile warning C4996\r\nError bg rev done"),
+    ]
+
+
+def test_color_256_palette():
+    assert color_256(1) == "red"
+    assert color_256(16) == "#000000"
+    assert color_256(231) == "#ffffff"
+    assert color_256(232) == "#080808"
+    assert color_256(255) == "#eeeeee"
+
+
+def test_tag_style():
+    assert tag_style("fg_red") == {"foreground": "#ff5555"}
+    assert tag_style("bg_#0a141e") == {"background": "#0a141e"}
+    assert tag_style("attr_strike") == {"overstrike": True}
+    assert tag_style("attr_bold") is None
+
+
+def test_benchmark_reports_all_parsers():
+    from benchmarks.ansi import load_log, run_benchmark
+
+    result = run_benchmark(load_log(), mb=0.3, chunk_sizes=(1024,), repeat=1)["chunk_sizes"]["1024"]
+
+    assert result["streaming"]["leaked_escapes"] == 0
+    assert result["regex"]["leaked_escapes"] > 0
+    # die alte Pipeline entfernt SGR vor dem SGR-Durchlauf und färbt nichts
+    assert result["regex"]["tagged_chars"] == 0
+    assert result["streaming"]["tagged_chars"] > 0
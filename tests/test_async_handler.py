@@ -0,0 +1,48 @@
+import logging
+from logging.handlers import QueueListener
+
+from main.log_tools.async_handler import BoundedQueueHandler
+from main.log_tools.ui_handler import UILogHandler
+
+
+def _logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger("test-async-handler")
+    logger.propagate = False
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_overflow_drops_debug_but_keeps_warnings():
+    handler = BoundedQueueHandler(maxsize=2)
+    logger = _logger(handler)
+    logger.debug("one")
+    logger.debug("two")
+    logger.debug("three")
+    assert handler.dropped == 1
+
+    target = UILogHandler()
+    listener = QueueListener(handler.queue, target)
+    listener.start()
+    # Queue voll: Warnung wartet auf Platz statt verworfen zu werden
+    logger.warning("kept")
+    listener.stop()
+
+    assert [text for _, text in target.drain()] == ["one", "two", "kept"]
+    assert handler.dropped == 1
+    assert handler.stats()["ui_records"] == 4
+
+
+def test_lazy_args_are_formatted_in_listener_mutable_args_eagerly():
+    handler = BoundedQueueHandler()
+    logger = _logger(handler)
+    data = {"a": 1}
+    logger.debug("value %s", 5)
+    logger.debug("data %s", [data])
+    data["a"] = 2
+
+    lazy, eager = handler.queue.get_nowait(), handler.queue.get_nowait()
+    assert lazy.args == (5,)
+    assert lazy.getMessage() == "value 5"
+    assert eager.args is None
+    assert eager.getMessage() == "data [{'a': 1}]"
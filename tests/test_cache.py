@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from main.github_tools.cache import CachingAdapter, EtagCache
+
+
+@pytest.fixture
+def etag_server():
+    calls: list[str | None] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("X-RateLimit-Remaining", "4999")
+                self.end_headers()
+                return
+            body = json.dumps({"name": "Guns-And-Choices"}).encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/repos/a/b", calls
+    server.shutdown()
+    server.server_close()
+
+
+def _session(cache: EtagCache) -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", CachingAdapter(cache))
+    return session
+
+
+def test_revalidates_with_etag(tmp_path, etag_server):
+    url, calls = etag_server
+    cache = EtagCache(tmp_path)
+    session = _session(cache)
+
+    first = session.get(url)
+    second = session.get(url)
+
+    assert calls == [None, '"v1"']
+    assert first.json() == second.json() == {"name": "Guns-And-Choices"}
+    assert second.status_code == 200
+    assert second.headers["X-RateLimit-Remaining"] == "4999"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_persists_on_disk(tmp_path, etag_server):
+    url, calls = etag_server
+    _session(EtagCache(tmp_path)).get(url)
+
+    reopened = EtagCache(tmp_path)
+    assert reopened.stats()["entries"] == 1
+    assert _session(reopened).get(url).json() == {"name": "Guns-And-Choices"}
+    assert reopened.hits == 1
+
+
+def test_eviction_is_size_bounded(tmp_path):
+    cache = EtagCache(tmp_path, max_bytes=300)
+    for i in range(5):
+        cache.put(f"key{i}", {"etag": f'"{i}"', "body": "x" * 100})
+
+    assert cache.size() <= 300
+    assert cache.evictions > 0
+    assert cache.get("key4") is not None
+    assert cache.get("key0") is None
+
+
+def test_eviction_counts_entries_of_other_instances(tmp_path):
+    ours = EtagCache(tmp_path, max_bytes=300)
+    other = EtagCache(tmp_path, max_bytes=10_000)
+    for i in range(3):
+        other.put(f"other{i}", {"body": "x" * 100})
+        os.utime(tmp_path / f"other{i}.json", (i + 1, i + 1))
+
+    ours.put("mine", {"body": "y" * 100})
+
+    assert ours.size() <= 300
+    assert ours.get("mine") is not None and ours.get("other0") is None
+
+
+def test_counters_are_exact_under_concurrency(tmp_path):
+    cache = EtagCache(tmp_path)
+
+    def count():
+        for _ in range(1000):
+            cache.record_hit()
+            cache.record_miss()
+
+    threads = [threading.Thread(target=count) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 8000
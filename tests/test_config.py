@@ -55,3 +55,11 @@ def test_check_config_fail(mock_env_file, mock_json_file):
     with patch("main.config.load_config", return_value={"git": {"token": "test_token"}}):
         assert check_config(["non_existent_key"]) is False
 
+
+def test_load_config_does_not_log_the_token(mock_env_file, mock_json_file):
+    with patch("builtins.open", mock_open(read_data=mock_json_file)):
+        with patch("os.path.exists", return_value=True):
+            with patch("main.config.LOGGER") as logger:
+                load_config("dummy_path")
+    logged = " ".join(str(call) for call in logger.method_calls)
+    assert "test_token" not in logged
@@ -0,0 +1,87 @@
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from main.config import AppConfig, ConfigService, write_json_atomic
+from main.errors import ConfigError
+from main.log_tools.settings import LogSettings
+
+DATA = {
+    "app_title": "UnrealGitUI",
+    "mode": "dark",
+    "git": {"repo": "Guns-And-Choices", "user": "GunsAndChoices", "token": "secret"},
+    "dashboard": {"refresh_seconds": 60},
+    "paths": {"git": "C:\\git.exe"},
+    "custom": {"keep": True},
+}
+
+
+def test_app_config_roundtrip_without_token():
+    config = AppConfig.from_dict(DATA)
+    assert config.git.main_repo == "GunsAndChoices/Guns-And-Choices"
+    assert config.dashboard.refresh_seconds == 60
+    assert config.dashboard.last_commits == 5  # Default
+
+    data = config.to_dict()
+    assert "token" not in data["git"]
+    assert data["custom"] == {"keep": True}
+    assert data["paths"] == {"git": "C:\\git.exe"}
+
+
+def test_log_settings_parse_like_the_app_config():
+    logs = {"keep_files": 5, "index_days": 7, "unknown": 1}
+    expected = AppConfig.from_dict(dict(DATA, logs=logs)).logs
+    assert LogSettings.from_dict(logs) == expected
+    assert expected.keep_files == 5 and expected.max_file_mb == 20  # Default
+
+
+def test_app_config_missing_required_keys():
+    with pytest.raises(ConfigError):
+        AppConfig.from_dict({"mode": "dark"})
+
+
+def test_service_loads_once_and_notifies(tmp_path):
+    path = tmp_path / "config.json"
+    service = ConfigService(str(path))
+    changes = []
+    service.subscribe(lambda key, value: changes.append((key, value)), "dashboard")
+
+    with patch("main.config.load_config", return_value=json.loads(json.dumps(DATA))) as load:
+        first = service.get()
+        assert service.get() is first
+        service.set("dashboard.refresh_seconds", 30)
+        service.set("mode", "light")
+        assert load.call_count == 1
+
+    assert first.dashboard.refresh_seconds == 30
+    assert changes == [("dashboard.refresh_seconds", 30)]
+    with pytest.raises(AttributeError):
+        service.set("dashboard.refresh_secs", 1)
+
+    service.save()
+    service.flush()
+    saved = json.loads(path.read_text())
+    assert saved["mode"] == "light"
+    assert "token" not in saved["git"]
+
+
+def test_save_is_debounced_and_atomic(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text("{}")
+    service = ConfigService(str(path), save_delay=0.05)
+
+    with patch("main.config.load_config", return_value=json.loads(json.dumps(DATA))):
+        service.get()
+    with patch("main.config.write_json_atomic", wraps=write_json_atomic) as write:
+        for mode in ("light", "dark", "light"):
+            service.set("mode", mode)
+            service.save()
+        # vor Ablauf des Fensters noch nichts geschrieben
+        assert write.call_count == 0
+        time.sleep(0.3)
+        assert write.call_count == 1
+
+    assert json.loads(path.read_text())["mode"] == "light"
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]  # keine Temp-Dateien übrig
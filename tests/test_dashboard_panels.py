@@ -0,0 +1,280 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+
+from conftest import FakeTable, FakeWidget
+
+COMMITS = [{"sha": f"{i:040x}", "additions": i, "deletions": 0, "total": i} for i in range(3)]
+LAST_COMMIT = {
+    "sha": "a" * 40,
+    "message": "Fix build\n\nDetails",
+    "author": "dev",
+    "email": "dev@example.com",
+    "date": "2026-01-01T00:00:00",
+    "changed_files": 2,
+}
+NEW_COMMIT = {"sha": "f" * 40, "additions": 9, "deletions": 1, "total": 10}
+NEW_DETAILS = dict(LAST_COMMIT, sha="f" * 40, message="New commit")
+DATA = {"status": {"open_issues": 1}, "commit_count": 3, "commits": COMMITS, "last_commit": LAST_COMMIT}
+
+
+@pytest.fixture
+def dashboard(tk_stub, monkeypatch):
+    """The dashboard module on fake widgets, with GitHub and the snapshot stubbed out."""
+    module = tk_stub("main.ui.tabs.dashboard")
+    # nicht über den asynchronen Konsolen-Handler: käme erst in der Ausgabe späterer Tests an
+    monkeypatch.setattr(module, "LOGGER", MagicMock())
+    monkeypatch.setattr(module, "get_configured_repos", lambda: ["org/repo"])
+    monkeypatch.setattr(module, "load_snapshot", lambda: None)
+    monkeypatch.setattr(module, "save_snapshot", lambda panels: None)
+    monkeypatch.setattr(module, "log_request_stats", lambda: None)
+    monkeypatch.setattr(module, "iter_last_x_commits", lambda repo, x: iter(COMMITS[:x]))
+    # lokales Repo: nur Status und Commit-Zahl über die API, Commits und Details aus git
+    monkeypatch.setattr(module, "batched_sections", lambda repo, x=5: ("status", "commit_count"))
+    monkeypatch.setattr(
+        module, "get_dashboard_data", lambda repo, x=5, sections=tuple(DATA): {k: DATA[k] for k in sections}
+    )
+    return module
+
+
+@pytest.fixture
+def make_ui(dashboard):
+    """Builds DashboardUI through its real __init__ (which starts loading)."""
+    uis = []
+
+    def make():
+        uis.append(dashboard.DashboardUI(FakeWidget()))
+        return uis[-1]
+
+    yield make
+    for ui in uis:
+        ui._executor.shutdown(wait=True)
+        ui.destroy()
+
+
+def _settle(ui, timeout: float = 5.0):
+    """Runs the panel polls until every loader has been rendered."""
+    deadline = time.monotonic() + timeout
+    while ui._pending_panels:
+        assert time.monotonic() < deadline, f"still loading: {ui._pending_panels}"
+        time.sleep(0.002)
+        ui.run_scheduled("_poll_panel_results")
+
+
+def _commit_rows(dashboard, ui, commits):
+    return [dashboard.COMMIT_TABLE_HEADER] + [ui._commit_row(c) for c in commits]
+
+
+def test_panels_show_placeholders_while_loading(dashboard, make_ui, monkeypatch):
+    started = threading.Event()
+    monkeypatch.setattr(dashboard, "iter_last_x_commits", lambda repo, x: started.wait(5) and iter(COMMITS))
+
+    ui = make_ui()
+
+    assert {"status", "commits", "details", "workflow"} <= ui._pending_panels
+    placeholders = dict(ui._panel_placeholders)
+    assert all(p.options["text"] == "Lade Daten..." for p in placeholders.values())
+    started.set()
+    _settle(ui)
+    assert all(p.destroyed for p in placeholders.values())
+
+
+def test_complete_load_renders_every_panel_once(dashboard, make_ui):
+    ui = make_ui()
+    _settle(ui)
+
+    assert not ui._pending_panels and not ui._panel_placeholders
+    assert ui.status_table.values == [["Open issues", "1"]]
+    assert ui.commit_table.values == _commit_rows(dashboard, ui, COMMITS)
+    assert ui.details_table.values[0] == ["SHA", LAST_COMMIT["sha"]]
+    assert ui.start_button.options["state"] in ("normal", "disabled")
+    assert ui.as_of_label.options["text"].endswith("(live)")
+
+
+def test_failing_panel_shows_error_and_others_still_load(dashboard, make_ui, monkeypatch):
+    def failing(repo, x=5, sections=tuple(DATA)):
+        if "status" in sections:
+            raise RuntimeError("rate limited")
+        return {k: DATA[k] for k in sections}
+
+    monkeypatch.setattr(dashboard, "get_dashboard_data", failing)
+
+    ui = make_ui()
+    _settle(ui)
+
+    error = ui._panel_placeholders["status"]
+    assert "rate limited" in error.options["text"] and error.options["text_color"] == "#ff5555"
+    assert ui.status_table is None
+    assert ui.commit_table.rows == len(COMMITS) + 1
+    assert not ui._pending_panels
+
+
+def test_streamed_batches_are_appended_row_by_row(dashboard, make_ui, monkeypatch):
+    monkeypatch.setattr(dashboard.DashboardUI, "load_data", lambda self: None)
+    ui = make_ui()
+    ui._panel_renderers = {"commits": ui._render_commits}
+    ui._panel_rows.put(("commits", COMMITS[0]))
+    ui._poll_panel_rows()
+    table = ui.commit_table
+
+    for commit in COMMITS[1:]:
+        ui._panel_rows.put(("commits", commit))
+    ui._poll_panel_rows()
+
+    assert table.values == _commit_rows(dashboard, ui, COMMITS)
+    assert table.calls == [("add_row", None)] * (len(COMMITS) - 1)
+    assert ui.commit_table_label.options["text"] == f"Last {len(COMMITS)} Commits"
+
+
+def test_github_panels_share_one_request(dashboard, make_ui, monkeypatch):
+    calls = []
+
+    def fetch(repo, x=5, sections=tuple(DATA)):
+        calls.append(sections)
+        return {k: DATA[k] for k in sections}
+
+    monkeypatch.setattr(dashboard, "batched_sections", lambda repo, x=5: tuple(DATA))
+    monkeypatch.setattr(dashboard, "get_dashboard_data", fetch)
+    monkeypatch.setattr(dashboard, "iter_last_x_commits", MagicMock(side_effect=AssertionError("paged")))
+
+    ui = make_ui()
+    _settle(ui)
+
+    assert calls == [tuple(DATA)]
+    assert ui.status_table.values == [["Open issues", "1"]]
+    assert ui.commit_table.values == _commit_rows(dashboard, ui, COMMITS)
+    assert ui.details_table.values[0] == ["SHA", LAST_COMMIT["sha"]]
+
+
+def test_failing_shared_request_marks_every_github_panel(dashboard, make_ui, monkeypatch):
+    def offline(repo, x=5, sections=tuple(DATA)):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(dashboard, "batched_sections", lambda repo, x=5: tuple(DATA))
+    monkeypatch.setattr(dashboard, "get_dashboard_data", offline)
+
+    ui = make_ui()
+    _settle(ui)
+
+    for name in ("status", "commits", "details"):
+        assert "offline" in ui._panel_placeholders[name].options["text"]
+    assert ui.commit_table is None
+
+
+def test_refresh_merges_new_commits_into_the_tables(dashboard, make_ui, monkeypatch):
+    ui = make_ui()
+    _settle(ui)
+    commit_table, details_table = ui.commit_table, ui.details_table
+    monkeypatch.setattr(
+        dashboard,
+        "get_dashboard_delta",
+        lambda repo, head, since, x: {"commits": [NEW_COMMIT], "status": {"open_issues": 2}, "last_commit": NEW_DETAILS},
+    )
+    ui._last_x = 3
+
+    ui._start_refresh()
+    _settle(ui)
+
+    assert ui.commit_table is commit_table and ui.details_table is details_table
+    assert commit_table.values == _commit_rows(dashboard, ui, [NEW_COMMIT] + COMMITS[:2])
+    # nur die neue Zeile eingefügt und die herausgefallene gelöscht, keine Zelle neu geschrieben
+    assert commit_table.calls == [("add_row", 1), ("delete_row", len(COMMITS) + 1)]
+    assert details_table.values[0] == ["SHA", NEW_DETAILS["sha"]]
+    # SHA und beide Nachrichten
+    assert details_table.calls == [("insert", 0, 1), ("insert", 1, 1), ("insert", 2, 1)]
+    assert ui.status_table.values == [["Open issues", "2"]]
+    assert ui.status_table.calls == [("insert", 0, 1)]
+
+
+def test_failing_refresh_keeps_the_tables_and_marks_them_stale(dashboard, make_ui, monkeypatch):
+    ui = make_ui()
+    _settle(ui)
+    before = [list(row) for row in ui.commit_table.values]
+    as_of = ui._as_of
+    save = MagicMock()
+    monkeypatch.setattr(dashboard, "save_snapshot", save)
+
+    def offline(repo, head, since, x):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(dashboard, "get_dashboard_delta", offline)
+
+    ui._start_refresh()
+    _settle(ui)
+
+    assert ui.commit_table.values == before
+    assert ui.status_table.values == [["Open issues", "1"]]
+    assert ui._as_of == as_of
+    assert ui.as_of_label.options["text"] == f"Stand: {as_of.strftime('%d.%m.%Y %H:%M:%S')} (veraltet, offline)"
+    save.assert_not_called()
+
+
+def test_unchanged_refresh_is_quiet_and_not_saved(dashboard, make_ui, monkeypatch):
+    ui = make_ui()
+    _settle(ui)
+    save, stats = MagicMock(), MagicMock()
+    monkeypatch.setattr(dashboard, "save_snapshot", save)
+    monkeypatch.setattr(dashboard, "log_request_stats", stats)
+    monkeypatch.setattr(
+        dashboard,
+        "get_dashboard_delta",
+        lambda repo, head, since, x: {"commits": [], "status": {"open_issues": 1}, "last_commit": None},
+    )
+
+    ui._start_refresh()
+    _settle(ui)
+
+    assert ui.as_of_label.options["text"].endswith("(live)")
+    save.assert_not_called()
+    stats.assert_not_called()
+    assert dashboard.LOGGER.info.call_args_list.count((("Dashboard data loaded.",),)) == 1
+
+
+class _LateRowsQueue(queue.Queue):
+    """Result queue whose loader enqueues its last rows right before the poll sees the result."""
+
+    def __init__(self, rows: queue.Queue, late: list[dict]):
+        super().__init__()
+        self._rows, self._late = rows, late
+
+    def get_nowait(self):
+        item = super().get_nowait()
+        for commit in self._late:
+            self._rows.put(("commits", commit))
+        self._late = []
+        return item
+
+
+@pytest.mark.parametrize("drained", [0, 1, 2])
+def test_rows_enqueued_just_before_the_result_are_not_lost(dashboard, make_ui, monkeypatch, drained):
+    monkeypatch.setattr(dashboard.DashboardUI, "load_data", lambda self: None)
+    ui = make_ui()
+    for commit in COMMITS[:drained]:
+        ui._panel_rows.put(("commits", commit))
+    ui._poll_panel_rows()
+    ui._panel_results = _LateRowsQueue(ui._panel_rows, COMMITS[drained:])
+    future = Future()
+    future.set_result(COMMITS)
+    ui._panel_results.put(("commits", future))
+    ui._pending_panels = {"commits"}
+    ui._panel_renderers = {"commits": ui._render_commits}
+
+    ui._poll_panel_results()
+
+    assert ui.commit_table.values == _commit_rows(dashboard, ui, COMMITS)
+    assert ui._panel_rows.empty() and not ui._pending_panels
+
+
+def test_fake_table_matches_the_ctktable_api():
+    import inspect
+
+    from CTkTable import CTkTable
+
+    for name in ("add_row", "delete_row", "insert", "get", "update_values"):
+        real = list(inspect.signature(getattr(CTkTable, name)).parameters)
+        fake = list(inspect.signature(getattr(FakeTable, name)).parameters)
+        assert fake[: len(real)] == real, name
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import pytest
+
+import main.github_tools.dashboard as dashboard
+from main.github_tools.providers import DashboardProvider
+
+COMMITS = [{"sha": f"{i:040x}", "additions": i, "deletions": 0, "total": i} for i in (3, 2, 1)]
+LAST_COMMIT = {"sha": COMMITS[0]["sha"], "message": "Newest", "date": datetime(2026, 1, 1)}
+
+
+class _StubProvider(DashboardProvider):
+    """Local provider stand-in: commit data without git or network."""
+
+    name = "stub"
+
+    def get_commit_count(self) -> int:
+        return len(COMMITS)
+
+    def get_last_commits(self, x: int = 5) -> list[dict]:
+        return COMMITS[:x]
+
+    def get_last_commit(self) -> dict | None:
+        return LAST_COMMIT
+
+
+class _StubGithub:
+    def __init__(self, repo_name: str, token: str):
+        pass
+
+    def get_repo_facts(self, include_commit_count: bool = False) -> dict:
+        return {"stars": 7, "open_issues": 2}
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setitem(dashboard._PROVIDERS, "org/repo", _StubProvider())
+    # nur die GitHub-only Fakten kommen über die API
+    monkeypatch.setattr(dashboard, "GithubProvider", _StubGithub)
+
+
+def test_dashboard_data_from_local_provider(provider):
+    data = dashboard.get_dashboard_data("org/repo", 2)
+
+    assert data["commits"] == COMMITS[:2]
+    assert data["commit_count"] == 3
+    assert data["status"] == {"stars": 7, "open_issues": 2, "commits": 3}
+    assert data["last_commit"] is LAST_COMMIT
+    assert dashboard.get_dashboard_data("org/repo", 2, sections=("last_commit",)) == {"last_commit": LAST_COMMIT}
+
+
+def test_dashboard_delta_stops_at_known_head(provider):
+    delta = dashboard.get_dashboard_delta("org/repo", COMMITS[1]["sha"], datetime(2025, 12, 31))
+
+    assert delta["commits"] == COMMITS[:1]
+    assert delta["status"]["commits"] == 3
+    assert delta["last_commit"] is LAST_COMMIT
+
+
+def test_dashboard_delta_without_new_commits(provider):
+    delta = dashboard.get_dashboard_delta("org/repo", COMMITS[0]["sha"], None)
+
+    assert delta["commits"] == [] and delta["last_commit"] is None
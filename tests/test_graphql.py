@@ -0,0 +1,187 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from main.errors import GithubQueryError
+from main.github_tools.graphql import (
+    fetch_dashboard,
+    fetch_repo_overview,
+    iter_commit_stats,
+)
+
+REPOSITORY = {
+    "name": "Guns-And-Choices",
+    "description": "Test Repo",
+    "stargazerCount": 3,
+    "forkCount": 1,
+    "issues": {"totalCount": 2},
+    "openPullRequests": {"totalCount": 1},
+    "pullRequests": {"totalCount": 7},
+    "latestRelease": {"name": "", "tagName": "v1.0.0"},
+    "defaultBranchRef": {
+        "name": "master",
+        "target": {
+            "history": {
+                "totalCount": 42,
+                "nodes": [
+                    {
+                        "oid": "a" * 40,
+                        "additions": 10,
+                        "deletions": 4,
+                        "changedFilesIfAvailable": 3,
+                        "message": "Fix build\n\nLonger text",
+                        "author": {
+                            "name": "Tester",
+                            "email": "tester@example.com",
+                            "date": "2025-01-02T03:04:05Z",
+                        },
+                    },
+                    {
+                        "oid": "b" * 40,
+                        "additions": 1,
+                        "deletions": 0,
+                        "changedFilesIfAvailable": 1,
+                        "message": "Init",
+                        "author": None,
+                    },
+                ],
+            }
+        },
+    },
+}
+
+
+@pytest.fixture
+def graphql_server():
+    received: list[dict] = []
+    response: dict = {"body": {"data": {"repository": REPOSITORY}}}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            received.append(
+                {
+                    "auth": self.headers["Authorization"],
+                    "body": json.loads(self.rfile.read(length)),
+                }
+            )
+            payload = response["body"]
+            if callable(payload):
+                payload = payload(received[-1]["body"])
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/graphql", received, response
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_dashboard_single_request(graphql_server):
+    url, received, _ = graphql_server
+    data = fetch_dashboard("GunsAndChoices/Guns-And-Choices", 5, "tok", endpoint=url)
+
+    assert len(received) == 1
+    assert received[0]["auth"] == "bearer tok"
+    assert received[0]["body"]["variables"] == {
+        "owner": "GunsAndChoices",
+        "name": "Guns-And-Choices",
+        "last": 5,
+    }
+
+    assert list(data["status"].keys()) == [
+        "name",
+        "description",
+        "stars",
+        "forks",
+        "open_issues",
+        "default_branch",
+        "commits",
+        "prs",
+        "last_release",
+    ]
+    assert data["status"]["open_issues"] == 3
+    assert data["status"]["commits"] == 42
+    assert data["status"]["prs"] == 7
+    assert data["status"]["last_release"] == "v1.0.0"
+
+
+def test_fetch_dashboard_commits_and_details(graphql_server):
+    url, _, _ = graphql_server
+    data = fetch_dashboard("GunsAndChoices/Guns-And-Choices", 1, "tok", endpoint=url)
+
+    assert data["commits"] == [
+        {"sha": "a" * 40, "additions": 10, "deletions": 4, "total": 14}
+    ]
+    details = data["last_commit"]
+    assert details["author"] == "Tester"
+    assert details["changed_files"] == 3
+    assert details["date"].year == 2025
+
+
+def test_fetch_dashboard_errors(graphql_server):
+    url, _, response = graphql_server
+    response["body"] = {"data": None, "errors": [{"message": "Bad credentials"}]}
+    with pytest.raises(GithubQueryError):
+        fetch_dashboard("GunsAndChoices/Guns-And-Choices", 5, "tok", endpoint=url)
+
+
+def test_iter_commit_stats_pages(graphql_server):
+    url, received, response = graphql_server
+    nodes = [{"oid": f"{i:040d}", "additions": i, "deletions": 1} for i in range(7)]
+
+    def page(body):
+        after = int(body["variables"]["after"] or 0)
+        first = body["variables"]["first"]
+        chunk = nodes[after : after + first]
+        return {
+            "data": {
+                "repository": {
+                    "defaultBranchRef": {
+                        "target": {
+                            "history": {
+                                "pageInfo": {
+                                    "hasNextPage": after + first < len(nodes),
+                                    "endCursor": str(after + first),
+                                },
+                                "nodes": chunk,
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    response["body"] = page
+    stats = list(iter_commit_stats("a/b", 6, "tok", endpoint=url, page_size=4))
+
+    assert [s["additions"] for s in stats] == [0, 1, 2, 3, 4, 5]
+    assert stats[2]["total"] == 3
+    # 6 Commits mit Seitengröße 4 -> 2 Requests statt 6
+    assert [r["body"]["variables"]["first"] for r in received] == [4, 2]
+
+
+def test_fetch_repo_overview_aliases(graphql_server):
+    url, received, response = graphql_server
+    repo = dict(REPOSITORY)
+    response["body"] = {
+        "data": {"r0": repo, "r1": None},
+        "errors": [{"path": ["r1"], "message": "Could not resolve to a Repository"}],
+    }
+
+    overview = fetch_repo_overview(["GunsAndChoices/Guns-And-Choices", "GunsAndChoices/Missing"], "tok", endpoint=url)
+
+    assert len(received) == 1
+    assert received[0]["body"]["variables"]["r1_name"] == "Missing"
+    assert overview["GunsAndChoices/Guns-And-Choices"]["commits"] == 42
+    assert overview["GunsAndChoices/Missing"] is None
@@ -0,0 +1,84 @@
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import pytest
+
+from conftest import FakeTabview, FakeWidget
+
+
+@pytest.fixture
+def lazy_tabs(tk_stub, monkeypatch):
+    module = tk_stub("main.ui.lazy_tabs")
+    # nicht über den asynchronen Konsolen-Handler: käme erst in der Ausgabe späterer Tests an
+    monkeypatch.setattr(module, "LOGGER", MagicMock())
+    return module
+
+
+@pytest.fixture
+def tabs(lazy_tabs, monkeypatch):
+    built: list[str] = []
+
+    class TabUI(FakeWidget):
+        def __init__(self, master):
+            super().__init__(master)
+            built.append(next(name for name, frame in tabview.frames.items() if frame is master))
+
+    class BrokenUI:
+        def __init__(self, master):
+            raise RuntimeError("kaputt")
+
+    module = ModuleType("fake_tab_module")
+    module.TabUI, module.BrokenUI = TabUI, BrokenUI
+    monkeypatch.setitem(sys.modules, "fake_tab_module", module)
+
+    tabview = FakeTabview()
+    tabs = lazy_tabs.LazyTabs(tabview)
+    for name in ("A", "B", "C"):
+        tabs.add(name, "fake_tab_module", "TabUI")
+    tabs.add("Broken", "fake_tab_module", "BrokenUI")
+    tabs.add("Empty")
+    tabs.built = built
+    return tabs
+
+
+def test_tab_is_built_on_first_select_only(tabs):
+    assert tabs.built == [] and tabs.widgets == {}
+
+    tabs.tabview.click("B")
+    tabs.tabview.click("B")
+
+    assert tabs.built == ["B"]
+    assert set(tabs.timings) == {"B"}
+
+
+def test_tab_without_ui_class_stays_empty(tabs):
+    tabs.tabview.click("Empty")
+
+    assert tabs.build("Empty") is None and "Empty" not in tabs.widgets
+
+
+def test_prewarm_builds_one_tab_per_idle_slot_in_order(tabs):
+    tabs.tabview.click("B")
+    tabs.prewarm(["C", "B", "Unknown", "A"])
+
+    # Bau erst im Leerlauf, nicht im Aufruf
+    assert tabs.built == ["B"]
+    tabs.tabview.run_scheduled()  # after -> after_idle
+    tabs.tabview.run_scheduled()
+    assert tabs.built == ["B", "C"]
+
+    while tabs.tabview.run_scheduled():
+        pass
+    assert tabs.built == ["B", "C", "A"]
+
+
+def test_failing_builder_shows_error_label(lazy_tabs, tabs):
+    tabs.tabview.click("Broken")
+
+    widget = tabs.widgets["Broken"]
+    assert isinstance(widget, FakeWidget) and "kaputt" in widget.options["text"]
+    assert 'Could not build tab "Broken"' in lazy_tabs.LOGGER.exception.call_args.args[0]
+    # kein zweiter Versuch beim erneuten Auswählen
+    tabs.tabview.click("Broken")
+    assert tabs.widgets["Broken"] is widget
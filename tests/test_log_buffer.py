@@ -0,0 +1,89 @@
+import logging
+
+from main.log_tools.log_buffer import LogBuffer, SessionLogFile
+
+
+def test_log_buffer_caps_lines_and_reports_dropped():
+    buffer = LogBuffer(max_lines=3)
+    assert buffer.extend([(logging.INFO, "a"), (logging.INFO, "b")]) == 0
+    assert buffer.extend([(logging.ERROR, "Traceback\n  line\nError")]) == 2
+
+    assert len(buffer) == 3
+    assert buffer.window(0, 10) == [
+        (logging.ERROR, "Traceback"),
+        (logging.ERROR, "  line"),
+        (logging.ERROR, "Error"),
+    ]
+    assert buffer.dropped == 2
+
+
+def test_log_buffer_level_filter_and_window():
+    buffer = LogBuffer()
+    buffer.extend([(logging.DEBUG, f"debug {i}") for i in range(5)])
+    buffer.extend([(logging.WARNING, "warn")])
+
+    buffer.set_min_level(logging.INFO)
+    assert buffer.window(0, 10) == [(logging.WARNING, "warn")]
+
+    buffer.set_min_level(logging.DEBUG)
+    assert [text for _, text in buffer.window(2, 2)] == ["debug 2", "debug 3"]
+
+
+def test_session_log_file_indexes_incrementally(tmp_path):
+    path = tmp_path / "session.log"
+    path.write_text(
+        "2025 @ app | INFO | start\n"
+        "2025 @ app | ERROR | boom\n"
+        "Traceback (most recent call last):\n"
+        "2025 @ app | DEBUG | partial",
+        encoding="utf-8",
+    )
+    session = SessionLogFile(path, min_level=logging.INFO)
+    session.refresh()
+
+    # unvollständige letzte Zeile wird noch nicht indiziert
+    assert len(session) == 3
+    assert session.window(1, 2) == [
+        (logging.ERROR, "2025 @ app | ERROR | boom"),
+        (logging.ERROR, "Traceback (most recent call last):"),
+    ]
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n2025 @ app | WARNING | later\n")
+    session.refresh()
+    assert session.window(3, 5) == [(logging.WARNING, "2025 @ app | WARNING | later")]
+
+    session.set_min_level(logging.DEBUG)
+    assert len(session) == 5
+
+
+def test_session_log_file_keeps_rotated_parts(tmp_path):
+    from main.log_tools.rotation import CompressingRotatingFileHandler
+
+    path = tmp_path / "session.log"
+    handler = CompressingRotatingFileHandler(path, max_bytes=60)
+    handler.setFormatter(logging.Formatter("%(asctime)s @ app | %(levelname)s | %(message)s"))
+
+    def log(level: int, message: str):
+        handler.emit(logging.LogRecord("app", level, __file__, 1, message, None, None))
+
+    session = SessionLogFile(path)
+    log(logging.INFO, "first")
+    session.refresh()
+    log(logging.ERROR, "second")  # noch im alten Teil, aber erst nach dem Rollover indiziert
+    for i in range(4):
+        log(logging.WARNING, f"line {i}")
+    session.refresh()
+
+    assert sorted(p.name for p in tmp_path.glob("session.*.log.gz")) == [
+        "session.1.log.gz",
+        "session.2.log.gz",
+    ]
+    messages = [text.rpartition(" | ")[2] for _, text in session.window(0, 10)]
+    assert messages == ["first", "second", "line 0", "line 1", "line 2", "line 3"]
+    assert [level for level, _ in session.window(0, 2)] == [logging.INFO, logging.ERROR]
+
+    # gelöschter Teil: Platzhalter statt Fehler
+    (tmp_path / "session.1.log.gz").unlink()
+    assert session.window(0, 1) == [(logging.INFO, "[Logteil 1 nicht mehr vorhanden]")]
+    handler.close()
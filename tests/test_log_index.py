@@ -0,0 +1,73 @@
+import json
+import logging
+from datetime import datetime
+
+from main.log_tools.log_index import JsonLinesFormatter, LogIndexHandler, open_index
+from main.log_tools.search import main as search_main
+
+
+def _ts(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _fill(directory):
+    index = open_index(directory)
+    index.add(
+        [
+            (_ts("2025-01-01 10:00"), logging.INFO, "unrealgitui", "s1", "Loading dashboard data..."),
+            (_ts("2025-01-01 10:05"), logging.WARNING, "unrealgitui", "s1", "GitHub rate limit hit (status 403)"),
+            (_ts("2025-01-02 09:00"), logging.DEBUG, "github.Requester", "s2", "GET /repos rate limit"),
+            (_ts("2025-01-02 09:30"), logging.ERROR, "unrealgitui", "s2", "Log search failed: boom"),
+        ]
+    )
+    return index
+
+
+def test_search_filters(tmp_path):
+    index = _fill(tmp_path)
+
+    assert [r["message"] for r in index.search("rate limit")] == [
+        "GET /repos rate limit",
+        "GitHub rate limit hit (status 403)",
+    ]
+    assert [r["level"] for r in index.search(level=logging.WARNING)] == ["ERROR", "WARNING"]
+    assert [r["logger"] for r in index.search(logger="github")] == ["github.Requester"]
+    rows = index.search(since=datetime(2025, 1, 1, 10, 1), until=datetime(2025, 1, 2, 9, 10))
+    assert [r["session"] for r in rows] == ["s2", "s1"]
+    # FTS-Syntaxzeichen im Suchtext dürfen keinen Fehler werfen
+    assert [r["level"] for r in index.search('status "403)')] == ["WARNING"]
+    index.close()
+
+
+def test_handler_indexes_records_in_batches(tmp_path):
+    index = open_index(tmp_path)
+    handler = LogIndexHandler(index, "session")
+    logger = logging.getLogger("test-log-index")
+    logger.propagate = False
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+
+    logger.info("hello %s", "world")
+    handler.flush()
+    reader = open_index(tmp_path)
+    assert [r["message"] for r in reader.search("world")] == ["hello world"]
+    handler.close()
+    reader.close()
+
+
+def test_json_lines_formatter():
+    record = logging.LogRecord("app", logging.ERROR, __file__, 1, "failed %d", (3,), None)
+    data = json.loads(JsonLinesFormatter("s1").format(record))
+    assert data["level"] == "ERROR"
+    assert data["message"] == "failed 3"
+    assert data["session"] == "s1"
+
+
+def test_cli(tmp_path, capsys):
+    _fill(tmp_path).close()
+    assert search_main(["limit", "--level", "WARNING", "--logs-dir", str(tmp_path)]) == 0
+    out = capsys.readouterr()
+    assert out.out.splitlines() == [
+        "2025-01-01 10:05:00 @ unrealgitui | WARNING | GitHub rate limit hit (status 403)"
+    ]
+    assert "1 records" in out.err
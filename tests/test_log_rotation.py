@@ -0,0 +1,116 @@
+import gzip
+import logging
+import os
+
+import pytest
+
+import main.log_tools.rotation as rotation
+from main.log_tools.rotation import (
+    CompressingRotatingFileHandler,
+    compress_closed_logs,
+    latest_log,
+    prune_logs,
+    write_latest_pointer,
+)
+
+
+def test_handler_rotates_by_size_and_compresses(tmp_path):
+    path = tmp_path / "session.log"
+    handler = CompressingRotatingFileHandler(path, max_bytes=50)
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "x" * 40, None, None)
+    for _ in range(3):
+        handler.emit(record)
+    handler.close()
+
+    rotated = sorted(p.name for p in tmp_path.glob("*.gz"))
+    # dritter Record überschreitet max_bytes -> ein Rollover
+    assert rotated == ["session.1.log.gz"]
+    assert gzip.decompress((tmp_path / "session.1.log.gz").read_bytes()) == (b"x" * 40 + b"\n") * 2
+    assert path.read_text(encoding="utf-8") == "x" * 40 + "\n"
+
+
+def test_latest_pointer_follows_rollover(tmp_path):
+    assert latest_log(tmp_path) is None
+    path = tmp_path / "session.log"
+    handler = CompressingRotatingFileHandler(path, max_bytes=10, latest_pointer=True)
+    write_latest_pointer(tmp_path, path)
+    assert latest_log(tmp_path) == path
+
+    # eine andere Instanz hat inzwischen ihren eigenen Pointer geschrieben
+    write_latest_pointer(tmp_path, tmp_path / "other.log")
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "x" * 20, None, None)
+    handler.emit(record)
+    handler.emit(record)
+    handler.close()
+
+    assert (tmp_path / "session.1.log.gz").exists()
+    assert latest_log(tmp_path) == path
+    assert not (tmp_path / "latest.txt.tmp").exists()
+
+
+def test_compress_and_prune_keep_current_log(tmp_path):
+    current = tmp_path / "current.log"
+    current.write_text("now\n")
+    for i in range(4):
+        old = tmp_path / f"old{i}.log"
+        old.write_text("old\n" * 100)
+        os.utime(old, (i + 1, i + 1))
+
+    compressed = compress_closed_logs(tmp_path, current)
+    assert len(compressed) == 4
+    assert current.exists()
+
+    removed = prune_logs(tmp_path, keep_files=2, protect=(current,))
+    assert sorted(p.name for p in removed) == ["old0.log.gz", "old1.log.gz", "old2.log.gz"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["current.log", "old3.log.gz"]
+
+
+def test_compress_skips_recent_and_locked_logs(tmp_path, monkeypatch):
+    current = tmp_path / "current.log"
+    running = tmp_path / "other-instance.log"
+    locked = tmp_path / "locked.jsonl"
+    for path in (current, running, locked):
+        path.write_text("line\n")
+    os.utime(locked, (1, 1))
+
+    real_remove = os.remove
+
+    def remove(path):
+        if os.fspath(path) == os.fspath(locked):
+            raise PermissionError("in use")
+        real_remove(path)
+
+    monkeypatch.setattr(rotation.os, "remove", remove)
+
+    assert compress_closed_logs(tmp_path, current) == []
+    # weder doppelt (Original + .gz) noch verloren
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["current.log", "locked.jsonl", "other-instance.log"]
+
+
+def test_prune_counts_files_per_stream(tmp_path):
+    for i in range(3):
+        for suffix in (".log.gz", ".jsonl.gz"):
+            path = tmp_path / f"s{i}{suffix}"
+            path.write_text("x")
+            os.utime(path, (i + 1, i + 1))
+
+    removed = prune_logs(tmp_path, keep_files=2)
+
+    assert sorted(p.name for p in removed) == ["s0.jsonl.gz", "s0.log.gz"]
+
+
+@pytest.mark.parametrize("suffix", [".log", ".jsonl"])
+def test_rollover_protects_both_streams_of_the_session(tmp_path, suffix):
+    session = tmp_path / "session.log"
+    session.with_suffix(".jsonl").write_text("{}\n")
+    session.write_text("")
+    for path in session.parent.iterdir():
+        os.utime(path, (1, 1))
+
+    handler = CompressingRotatingFileHandler(session.with_suffix(suffix), max_bytes=10, keep_files=1)
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "x" * 20, None, None)
+    handler.emit(record)
+    handler.emit(record)
+    handler.close()
+
+    assert session.exists() and session.with_suffix(".jsonl").exists()
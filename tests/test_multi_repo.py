@@ -0,0 +1,50 @@
+import threading
+
+from main.github_tools.multi_repo import RepoOverview
+
+
+def test_fetch_all_batches_concurrently():
+    calls: list[list[str]] = []
+    lock = threading.Lock()
+
+    def fetch(batch, token):
+        with lock:
+            calls.append(batch)
+        return {repo: {"stars": 1} for repo in batch}
+
+    repos = [f"org/repo{i}" for i in range(25)]
+    overview = RepoOverview("tok", batch_size=10, fetch=fetch).fetch_all(repos)
+
+    assert list(overview) == repos
+    assert all(status == {"stars": 1} for status in overview.values())
+    # 25 Repos -> 3 Requests
+    assert sorted(len(batch) for batch in calls) == [5, 10, 10]
+
+
+def test_failure_budget_skips_broken_repo():
+    calls: list[list[str]] = []
+
+    def fetch(batch, token):
+        calls.append(batch)
+        return {repo: (None if repo == "org/broken" else {"stars": 1}) for repo in batch}
+
+    overview = RepoOverview("tok", failure_budget=2, fetch=fetch)
+    repos = ["org/ok", "org/broken"]
+
+    assert overview.fetch_all(repos)["org/broken"] == "error"
+    assert overview.fetch_all(repos)["org/broken"] == "error"
+    third = overview.fetch_all(repos)
+
+    assert third["org/broken"] == "skipped"
+    assert third["org/ok"] == {"stars": 1}
+    assert calls[-1] == ["org/ok"]
+
+
+def test_failed_batch_does_not_break_others():
+    def fetch(batch, token):
+        if "org/b" in batch:
+            raise ConnectionError("boom")
+        return {repo: {"stars": 2} for repo in batch}
+
+    overview = RepoOverview("tok", batch_size=1, fetch=fetch).fetch_all(["org/a", "org/b"])
+    assert overview == {"org/a": {"stars": 2}, "org/b": "error"}
@@ -0,0 +1,84 @@
+import subprocess
+
+import pytest
+
+from main.github_tools.providers import (
+    GithubProvider,
+    LocalGitProvider,
+    create_commit_provider,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.name", "Tester")
+    _git(tmp_path, "config", "user.email", "tester@example.com")
+
+    (tmp_path / "a.txt").write_text("one\ntwo\nthree\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Initial commit")
+
+    (tmp_path / "a.txt").write_text("one\nTWO\n")
+    (tmp_path / "b.bin").write_bytes(b"\x00\x01\x02")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Second commit\n\nWith body")
+    return tmp_path
+
+
+def test_local_commit_count_and_stats(git_repo):
+    provider = LocalGitProvider(str(git_repo))
+
+    assert provider.get_commit_count() == 2
+
+    commits = provider.get_last_commits(5)
+    assert len(commits) == 2
+    # neuester Commit zuerst; Binärdatei zählt nicht zu Add/Del
+    assert commits[0]["additions"] == 1
+    assert commits[0]["deletions"] == 2
+    assert commits[0]["total"] == 3
+    assert commits[1]["additions"] == 3
+    assert len(commits[0]["sha"]) == 40
+
+
+def test_local_last_commit(git_repo):
+    details = LocalGitProvider(str(git_repo)).get_last_commit()
+
+    assert details["message"] == "Second commit\n\nWith body"
+    assert details["author"] == "Tester"
+    assert details["email"] == "tester@example.com"
+    assert details["changed_files"] == 2
+    assert details["date"].year >= 2024
+
+
+def test_provider_fallback(git_repo, tmp_path_factory):
+    local = create_commit_provider("local", "a/b", "tok", str(git_repo))
+    assert isinstance(local, LocalGitProvider)
+
+    missing = create_commit_provider(
+        "local", "a/b", "tok", str(tmp_path_factory.mktemp("no_clone"))
+    )
+    assert isinstance(missing, GithubProvider)
+
+    assert isinstance(create_commit_provider("github", "a/b", "tok", str(git_repo)), GithubProvider)
+
+
+def test_local_commits_since_head(git_repo):
+    provider = LocalGitProvider(str(git_repo))
+    head = provider.get_last_commit()["sha"]
+
+    assert list(provider.iter_commits_since(head, None, 5)) == []
+
+    (git_repo / "c.txt").write_text("new\n")
+    _git(git_repo, "add", ".")
+    _git(git_repo, "commit", "-q", "-m", "Third commit")
+
+    new = list(provider.iter_commits_since(head, None, 5))
+    assert len(new) == 1
+    assert new[0]["additions"] == 1
+    # unbekannter Head -> Vergleich über die letzten x Commits
+    assert len(list(provider.iter_commits_since("f" * 40, None, 2))) == 2
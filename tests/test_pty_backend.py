@@ -0,0 +1,100 @@
+import queue
+import sys
+import time
+
+import pytest
+
+from main.terminal_tools.pty_backend import create_pty, default_backend
+from main.terminal_tools.pty_reader import PtyReader
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX pty backend")
+
+
+def _start(command: str, rows: int = 24, cols: int = 80) -> tuple:
+    backend = create_pty(command, rows, cols, kind="posix")
+    reader = PtyReader(backend, lambda: None)
+    reader.start()
+    return backend, reader
+
+
+def _read_until(reader: PtyReader, text: str, timeout: float = 5.0) -> str:
+    output = ""
+    deadline = time.monotonic() + timeout
+    while text not in output:
+        remaining = deadline - time.monotonic()
+        assert remaining > 0, f"timeout, got {output!r}"
+        try:
+            output += reader.chunks.get(timeout=min(remaining, 0.1))
+        except queue.Empty:
+            pass
+    return output
+
+
+def test_default_backend_on_posix():
+    assert default_backend() == "posix"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        create_pty("/bin/sh", kind="telnet")
+
+
+def test_posix_backend_runs_shell_and_echoes_input():
+    backend, reader = _start("/bin/sh")
+    try:
+        backend.write("echo ready-$((40 + 2))" + backend.newline)
+        # Echo der Eingabe enthält "$((40 + 2))", erst die Ausgabe "ready-42"
+        assert "ready-42" in _read_until(reader, "ready-42")
+    finally:
+        reader.stop()
+        backend.close()
+    assert not backend.isalive()
+
+
+def test_posix_backend_applies_size_and_resize():
+    backend, reader = _start("/bin/sh -c 'stty size; read x; stty size'", rows=30, cols=100)
+    try:
+        _read_until(reader, "30 100")
+        backend.resize(40, 120)
+        backend.write(backend.newline)
+        _read_until(reader, "40 120")
+    finally:
+        reader.stop()
+        backend.close()
+
+
+def test_posix_backend_reports_eof_when_process_exits():
+    backend, reader = _start("/bin/sh -c 'echo done'")
+    try:
+        _read_until(reader, "done")
+        assert reader.eof.wait(timeout=5)
+        assert not backend.isalive() or backend.proc.wait(timeout=5) == 0
+    finally:
+        reader.stop()
+        backend.close()
+
+
+def test_terminal_benchmark_drains_all_output():
+    from benchmarks.terminal import run_benchmark
+
+    result = run_benchmark(mb=0.2, backend="posix")
+
+    assert result["backend"] == "posix"
+    assert result["frames"] > 0
+    # gezählt wird die Rohausgabe inkl. Escape-Sequenzen, sie muss vollständig ankommen
+    assert result["chars_per_frame"] * result["frames"] > 0.2 * 1024 * 1024
+
+
+def test_posix_backend_shell_has_controlling_terminal():
+    # /dev/tty lässt sich nur mit Controlling Terminal öffnen
+    backend, reader = _start("/bin/sh -c ': </dev/tty && echo ctty-ok'")
+    try:
+        _read_until(reader, "ctty-ok")
+    finally:
+        reader.stop()
+        backend.close()
+
+
+def test_posix_backend_rejects_missing_command():
+    with pytest.raises(FileNotFoundError):
+        create_pty("/nonexistent/shell", kind="posix")
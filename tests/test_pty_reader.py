@@ -0,0 +1,93 @@
+import socket
+import threading
+
+from main.terminal_tools.pty_reader import PtyReader
+from main.terminal_tools.render_batch import FRAME_MS, frame_delay
+
+
+class _SocketPty:
+    """PTY stand-in: reads bytes from one end of a socketpair."""
+
+    def __init__(self):
+        self.sock, self.peer = socket.socketpair()
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def read(self, size: int) -> bytes:
+        data = self.sock.recv(size)
+        if not data:
+            raise EOFError("closed")
+        return data
+
+
+def _reader(pty) -> tuple[PtyReader, threading.Semaphore]:
+    notified = threading.Semaphore(0)
+    reader = PtyReader(pty, notified.release)
+    reader.start()
+    return reader, notified
+
+
+def _collect(reader: PtyReader) -> str:
+    text = ""
+    while not reader.chunks.empty():
+        text += reader.chunks.get_nowait()
+    return text
+
+
+def test_reader_notifies_once_until_ui_waits_again():
+    pty = _SocketPty()
+    reader, notified = _reader(pty)
+    try:
+        pty.peer.sendall(b"first\r\n")
+        assert notified.acquire(timeout=2)
+        pty.peer.sendall(b"second\r\n")
+        # zweite Ausgabe weckt die UI nicht erneut, solange sie noch nicht abgeholt hat
+        assert not notified.acquire(timeout=0.2)
+        assert _collect(reader) == "first\r\nsecond\r\n"
+
+        assert reader.wait_for_data() is False
+        pty.peer.sendall(b"third")
+        assert notified.acquire(timeout=2)
+        assert _collect(reader) == "third"
+    finally:
+        reader.stop()
+
+
+def test_reader_decodes_utf8_split_across_reads():
+    pty = _SocketPty()
+    reader, notified = _reader(pty)
+    try:
+        data = "Größe ✓".encode("utf-8")
+        pty.peer.sendall(data[:3])  # schneidet das "ö" in der Mitte
+        assert notified.acquire(timeout=2)
+        reader.wait_for_data()
+        pty.peer.sendall(data[3:])
+        assert notified.acquire(timeout=2)
+        assert _collect(reader) == "Größe ✓"
+    finally:
+        reader.stop()
+
+
+def test_reader_sets_eof_when_process_closes():
+    pty = _SocketPty()
+    reader, notified = _reader(pty)
+    pty.peer.sendall(b"bye")
+    pty.peer.close()
+
+    assert reader.eof.wait(timeout=2)
+    assert _collect(reader) == "bye"
+    reader.stop()
+
+
+def test_stop_wakes_idle_reader():
+    reader, _ = _reader(_SocketPty())
+
+    reader.stop(timeout=2)
+
+    assert not reader._thread.is_alive()
+
+
+def test_frame_delay_draws_immediately_after_a_pause():
+    assert frame_delay(1.0) == 0
+    assert frame_delay(0.001) == FRAME_MS
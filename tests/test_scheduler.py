@@ -0,0 +1,132 @@
+import threading
+import time
+
+from requests.structures import CaseInsensitiveDict
+
+from main.github_tools.scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    LatencyHistogram,
+    RequestScheduler,
+    endpoint_key,
+    resource_for,
+)
+
+
+def _headers(**values) -> CaseInsensitiveDict:
+    return CaseInsensitiveDict({k.replace("_", "-"): str(v) for k, v in values.items()})
+
+
+def test_budget_from_headers_and_background_reserve():
+    scheduler = RequestScheduler(background_reserve=100)
+    scheduler.acquire()
+    scheduler.release(
+        "GET /repos/:repo",
+        200,
+        _headers(X_RateLimit_Remaining=50, X_RateLimit_Limit=5000, X_RateLimit_Reset=time.time() + 3600),
+        0.1,
+    )
+
+    assert scheduler.budget("core").remaining == 50
+    assert scheduler.budget("core").limit == 5000
+    # Interaktiv darf die Reserve nutzen, Hintergrund-Refresh nicht
+    assert scheduler._wait_time(INTERACTIVE, time.time()) is None
+    assert scheduler._wait_time(BACKGROUND, time.time()) > 0
+
+
+def test_interactive_requests_go_first():
+    scheduler = RequestScheduler(max_concurrent=1)
+    scheduler.acquire()
+    order: list[str] = []
+
+    def worker(name, priority):
+        scheduler.acquire(priority)
+        order.append(name)
+        scheduler.release("GET /x", 200, None, 0.0)
+
+    background = threading.Thread(target=worker, args=("background", BACKGROUND))
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=worker, args=("interactive", INTERACTIVE))
+    interactive.start()
+    time.sleep(0.05)
+    assert scheduler.queue_depth() == 2
+
+    scheduler.release("GET /x", 200, None, 0.0)
+    background.join(2)
+    interactive.join(2)
+    assert order == ["interactive", "background"]
+
+
+def test_secondary_rate_limit_backs_off():
+    scheduler = RequestScheduler()
+    scheduler.acquire()
+    scheduler.release("GET /x", 403, _headers(Retry_After=30), 0.2)
+
+    wait = scheduler._wait_time(INTERACTIVE, time.time())
+    assert 25 < wait <= 30
+    assert scheduler.stats()["paused_for"] > 0
+
+
+def test_latency_histogram_and_endpoint_keys():
+    histogram = LatencyHistogram()
+    for ms in (10, 20, 30, 400, 3000):
+        histogram.record(ms)
+    assert histogram.percentile(0.5) == 50
+    assert histogram.percentile(0.95) == 5000
+    assert histogram.summary()["count"] == 5
+
+    sha = "a" * 40
+    assert endpoint_key("GET", f"https://api.github.com/repos/o/r/commits/{sha}") == "GET /repos/:repo/commits/:sha"
+    assert endpoint_key("GET", "https://api.github.com/repos/o/r/pulls/12") == "GET /repos/:repo/pulls/:id"
+
+
+def test_budgets_are_kept_per_resource():
+    scheduler = RequestScheduler(background_reserve=100)
+    reset = time.time() + 3600
+    scheduler.acquire(resource="graphql")
+    scheduler.release(
+        "POST /graphql Dashboard",
+        200,
+        _headers(X_RateLimit_Remaining=0, X_RateLimit_Limit=5000, X_RateLimit_Reset=reset, X_RateLimit_Resource="graphql"),
+        0.1,
+        "graphql",
+    )
+    scheduler.acquire()
+    scheduler.release(
+        "GET /repos/:repo",
+        200,
+        _headers(X_RateLimit_Remaining=4000, X_RateLimit_Limit=5000, X_RateLimit_Reset=reset, X_RateLimit_Resource="core"),
+        0.1,
+    )
+
+    assert scheduler.budget("graphql").remaining == 0
+    assert scheduler.budget("core").remaining == 4000
+    # leeres GraphQL-Budget blockiert REST-Requests nicht
+    assert scheduler._wait_time(INTERACTIVE, time.time(), "graphql") > 0
+    assert scheduler._wait_time(BACKGROUND, time.time(), "core") is None
+    assert set(scheduler.stats()["budgets"]) == {"core", "graphql"}
+    assert resource_for("https://api.github.com/graphql") == "graphql"
+    assert resource_for("https://api.github.com/search/issues") == "search"
+    assert resource_for("https://api.github.com/repos/o/r") == "core"
+
+
+def test_graphql_requests_are_keyed_by_operation():
+    body = b'{"query": "query Dashboard($owner: String!) {\\n  repository { name } }", "variables": {}}'
+    assert endpoint_key("POST", "https://api.github.com/graphql", body) == "POST /graphql Dashboard"
+    named = b'{"query": "{ viewer { login } }", "operationName": "Viewer"}'
+    assert endpoint_key("POST", "https://api.github.com/graphql", named) == "POST /graphql Viewer"
+    assert endpoint_key("POST", "https://api.github.com/graphql", b"{}") == "POST /graphql :anonymous"
+
+
+def test_format_status_shows_budgets_and_latency_histograms():
+    scheduler = RequestScheduler()
+    for endpoint, ms in (("GET /repos/:repo", 0.03), ("GET /repos/:repo", 0.3), ("POST /graphql Dashboard", 0.08)):
+        scheduler.acquire()
+        scheduler.release(endpoint, 200, _headers(X_RateLimit_Remaining=10, X_RateLimit_Limit=60), ms)
+
+    lines = scheduler.format_status().splitlines()
+
+    assert lines[0].startswith("API-Budget: core 10/60 | Queue: 0")
+    assert lines[1] == "GET /repos/:repo (n=2): p50<=50ms p95<=500ms [1 0 0 1 0 0 0 0]"
+    assert lines[2] == "POST /graphql Dashboard (n=1): p50<=100ms p95<=100ms [0 1 0 0 0 0 0 0]"
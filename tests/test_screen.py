@@ -0,0 +1,122 @@
+import pytest
+
+from main.terminal_tools.screen import Screen
+
+E = "\x1b"
+
+
+class _Widget:
+    """Applies render_ops to a list of text lines like TerminalUI does to the Text widget."""
+
+    def __init__(self):
+        self.lines = [""]
+
+    def apply(self, ops):
+        text = lambda runs: "".join(t for t, _ in runs)
+        for op in ops:
+            if op[0] == "replace":
+                self.lines[op[1]] = text(op[2])
+            elif op[0] == "append":
+                self.lines += map(text, op[1])
+            elif op[0] == "delete":
+                del self.lines[: op[1]]
+            else:
+                self.lines = list(map(text, op[1]))
+
+
+def _screen(data: str, rows: int = 5, cols: int = 20, **kwargs) -> Screen:
+    screen = Screen(rows, cols, **kwargs)
+    screen.feed(data)
+    return screen
+
+
+def test_progress_bar_redrawn_with_carriage_return_stays_one_line():
+    bars = "".join(f"\r[{'#' * i:<10}] {i * 10}%" for i in range(11))
+    screen = _screen(f"Building\r\n{bars}\r\nDone\r\n")
+
+    assert screen.text() == ["Building", "[##########] 100%", "Done", "", ""]
+
+
+def test_erase_line_and_git_style_progress():
+    screen = _screen(f"abcdef\r{E}[Kxy\r\nobjects:  10% (1/10)\robjects: 100%{E}[K\n")
+
+    assert screen.text()[:2] == ["xy", "objects: 100%"]
+
+
+def test_cursor_up_redraws_multi_line_progress():
+    screen = _screen("a: 0%\r\nb: 0%\r\n")
+    screen.feed(f"{E}[2A\ra: 50%{E}[K\r\n{E}[Kb: 50%\r\n")
+
+    assert screen.text()[:3] == ["a: 50%", "b: 50%", ""]
+    assert (screen.row, screen.col) == (2, 0)
+
+
+def test_colours_are_kept_per_cell():
+    screen = _screen(f"ok {E}[31merror{E}[0m!")
+
+    assert screen.lines[0].runs() == [("ok ", ()), ("error", ("fg_red",)), ("!", ())]
+
+
+def test_autowrap_and_scrollback():
+    screen = _screen("abcdefg\r\n" + "".join(f"{i}\r\n" for i in range(5)), rows=3, cols=5)
+
+    assert screen.text() == ["abcde", "fg", "0", "1", "2", "3", "4", ""]
+    screen.render_ops()
+    assert len(screen.scrollback) == 5
+
+
+def test_scroll_region_keeps_lines_outside():
+    screen = _screen(f"head\r\n1\r\n2\r\n3\r\nfoot{E}[2;4r{E}[4;1H" + "x\r\ny\r\nz", rows=5)
+
+    assert screen.text() == ["head", "x", "y", "z", "foot"]
+    assert not screen.scrollback
+
+
+def test_alternate_screen_restores_main_screen():
+    screen = _screen("prompt> less")
+    screen.feed(f"{E}[?1049h{E}[Hpager{E}[2J")
+    assert screen.text()[0] == ""
+    screen.feed(f"{E}[?1049l")
+
+    assert screen.text()[0] == "prompt> less"
+    assert (screen.row, screen.col) == (0, 12)
+
+
+def test_only_changed_lines_are_repainted():
+    screen = _screen("line 1\r\nline 2\r\nprogress 10%")
+    screen.render_ops()
+
+    screen.feed("\rprogress 50%")
+
+    assert screen.render_ops() == [("replace", 2, [("progress 50%", ())])]
+    assert screen.render_ops() == []
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_widget_follows_screen_for_any_chunking(size):
+    data = "".join(
+        f"{E}[32m[{i}/40]{E}[0m Compile Module.{i}.cpp\r\n"
+        + (f"\r{E}[Kprogress {i}%" if i % 3 else "")
+        + (f"{E}[1A{E}[2Kup {i}\r\n" if i % 7 == 0 else "")
+        for i in range(40)
+    )
+    screen, widget = Screen(6, 30, scrollback_lines=20), _Widget()
+    for start in range(0, len(data), size):
+        screen.feed(data[start : start + size])
+        widget.apply(screen.render_ops())
+
+    assert widget.lines == screen.text()
+    assert len(screen.scrollback) == 20
+
+
+def test_resize_redraws_everything():
+    screen, widget = _screen("one\r\ntwo\r\nthree\r\nfour", rows=4), _Widget()
+    widget.apply(screen.render_ops())
+
+    screen.resize(2, 10)
+    ops = screen.render_ops()
+    widget.apply(ops)
+
+    assert ops[0][0] == "reset"
+    assert widget.lines == ["one", "two", "three", "four"]
+    assert screen.cursor == (3, 4)
@@ -0,0 +1,61 @@
+import pytest
+
+from main.terminal_tools.screen import Screen
+from main.terminal_tools.scrollback import ScrollbackSpill
+
+
+@pytest.fixture
+def spill(tmp_path):
+    spill = ScrollbackSpill(tmp_path)
+    yield spill
+    spill.close()
+
+
+def test_spill_reads_ranges_back_with_tags(spill):
+    spill.append([[("line 0", ())], [("ok ", ()), ("Fehler\n\"ä\"", ("fg_red", "attr_bold"))]])
+    spill.append([[]])
+
+    assert len(spill) == 3
+    assert spill.read(0, 3) == [
+        [("line 0", ())],
+        [("ok ", ()), ("Fehler\n\"ä\"", ("fg_red", "attr_bold"))],
+        [],
+    ]
+    assert spill.read(1, 2) == [[("ok ", ()), ("Fehler\n\"ä\"", ("fg_red", "attr_bold"))]]
+    assert spill.read(-5, 1) == [[("line 0", ())]]
+    assert spill.read(2, 99) == [[]] and spill.read(3, 4) == []
+
+
+def test_spill_remaps_after_growing(spill):
+    spill.append([[(f"{i}", ())] for i in range(10)])
+    assert spill.read(9, 10) == [[("9", ())]]
+
+    spill.append([[(f"{i}", ())] for i in range(10, 5000)])
+
+    assert spill.read(4998, 5000) == [[("4998", ())], [("4999", ())]]
+
+
+def test_clear_and_close_remove_content(spill):
+    spill.append([[("x", ())]])
+    spill.read(0, 1)
+    spill.clear()
+    assert len(spill) == 0 and spill.read(0, 1) == []
+
+    spill.close()
+    spill.close()
+    assert not spill.path.exists()
+
+
+def test_screen_spills_lines_beyond_the_cap(spill):
+    screen = Screen(3, 20, scrollback_lines=5, spill=spill)
+    for i in range(30):
+        screen.feed(f"line {i}\r\n")
+        screen.render_ops()
+
+    assert len(screen.scrollback) == 5
+    spilled = ["".join(t for t, _ in runs) for runs in spill.read(0, len(spill))]
+    assert spilled + screen.text() == [f"line {i}" for i in range(30)] + [""]
+
+    screen.feed("\x1b[3J")
+    screen.render_ops()
+    assert len(spill) == 0
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from main.github_tools.snapshot import load_snapshot, save_snapshot
+
+
+def test_snapshot_roundtrip(tmp_path):
+    path = tmp_path / "snapshot.json"
+    panels = {
+        "status": {"name": "Guns-And-Choices", "stars": 3},
+        "commits": [{"sha": "a" * 40, "additions": 1, "deletions": 2, "total": 3}],
+        "details": {"sha": "a" * 40, "date": datetime(2025, 1, 2, 3, 4, 5)},
+    }
+    save_snapshot(panels, path)
+
+    snapshot = load_snapshot(path)
+    assert isinstance(snapshot["saved_at"], datetime)
+    assert snapshot["panels"]["status"] == panels["status"]
+    assert snapshot["panels"]["commits"] == panels["commits"]
+    assert snapshot["panels"]["details"]["date"] == "2025-01-02 03:04:05"
+
+
+def test_snapshot_missing_or_corrupt(tmp_path):
+    path = tmp_path / "snapshot.json"
+    assert load_snapshot(path) is None
+    path.write_text("{not json", encoding="utf-8")
+    assert load_snapshot(path) is None
@@ -0,0 +1,39 @@
+import json
+
+from benchmarks.startup import main as benchmark_main
+from benchmarks.startup import over_baseline, parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       3100 | main._template
+noise
+"""
+
+
+def test_parse_importtime():
+    modules = parse_importtime(IMPORTTIME)
+    assert modules["_io"] == {"self_ms": 0.12, "cumulative_ms": 0.12, "depth": 1}
+    assert modules["main._template"]["cumulative_ms"] == 3.1
+    assert modules["main._template"]["depth"] == 0
+
+
+def test_stub_startup_result_structure(tmp_path):
+    output = tmp_path / "startup.json"
+    assert benchmark_main(["--stub", "--output", str(output)]) == 0
+    result = json.loads(output.read_text())
+
+    assert result["mode"] == "stub"
+    # ohne Display gibt es keinen gezeichneten Frame, nur den markierten Zeitpunkt
+    assert "first_window_ms" not in result
+    for key in ("import_main_ms", "first_window_stub_ms", "usable_ms", "import_total_ms"):
+        assert isinstance(result[key], (int, float))
+    assert "main.main" in result["app_modules_ms"]
+    assert "Dashboard" in result["tabs_ms"]
+
+
+def test_over_baseline():
+    baseline = {"_comment": "x", "usable_ms": 100, "first_window_ms": 50}
+
+    assert over_baseline({"usable_ms": 150.0, "first_window_stub_ms": 60}, baseline) == ["usable_ms: 150 ms > 100 ms"]
+    assert over_baseline({"usable_ms": 90}, baseline) == []
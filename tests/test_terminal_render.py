@@ -0,0 +1,40 @@
+import queue
+
+from main.terminal_tools.render_batch import drain_chunks
+
+
+def _queue(*chunks) -> queue.Queue:
+    q = queue.Queue()
+    for chunk in chunks:
+        q.put(chunk)
+    return q
+
+
+def test_drain_feeds_all_pending_chunks_in_order():
+    fed: list[str] = []
+
+    chars, pending = drain_chunks(_queue("line 1\r\n", "line 2\r\n", "done"), fed.append)
+
+    assert not pending
+    assert fed == ["line 1\r\n", "line 2\r\n", "done"] and chars == 20
+
+
+def test_drain_leaves_rest_for_next_frame_when_char_limit_is_reached():
+    q = _queue(*(["x" * 100] * 10))
+
+    chars, pending = drain_chunks(q, lambda chunk: None, max_chars=250)
+
+    assert pending
+    assert chars == 300  # angefangene Chunks werden ganz übernommen
+    assert q.qsize() == 7
+
+    chars, pending = drain_chunks(q, lambda chunk: None)
+    assert not pending and chars == 700
+
+
+def test_drain_respects_time_budget():
+    q = _queue("a", "b")
+
+    chars, pending = drain_chunks(q, lambda chunk: None, budget=0)
+
+    assert chars == 0 and pending
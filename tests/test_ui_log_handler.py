@@ -0,0 +1,33 @@
+import logging
+
+from main.log_tools.ui_handler import UILogHandler
+
+
+def _logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger("test-ui-handler")
+    logger.propagate = False
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_ui_handler_formats_and_drains_in_batches():
+    handler = UILogHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s | %(message)s"))
+    logger = _logger(handler)
+
+    logger.debug("one")
+    logger.warning("two")
+    logger.error("three")
+
+    assert handler.drain(2) == [(logging.DEBUG, "DEBUG | one"), (logging.WARNING, "WARNING | two")]
+    assert handler.drain() == [(logging.ERROR, "ERROR | three")]
+    assert handler.drain() == []
+
+
+def test_ui_handler_drops_oldest_when_full():
+    handler = UILogHandler(buffer_size=3)
+    logger = _logger(handler)
+    for i in range(5):
+        logger.info(str(i))
+    assert [text for _, text in handler.drain()] == ["2", "3", "4"]